@@ -5,7 +5,7 @@ from pathlib import Path
 import sys
 from typing import Any
 
-from src.app.experiments.analysis import analyze_results
+from src.app.experiments.analysis import AnalysisCache, analyze_results
 from src.app.experiments.reporting import generate_report
 from src.app.experiments.scenarios import load_scenarios
 
@@ -46,6 +46,36 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Disable adaptive reruns for scenarios with high censored share",
     )
+    parser.add_argument(
+        "--engine",
+        choices=("serial", "ensemble"),
+        default="serial",
+        help="Simulation engine: one ForestFireCA per run, or equal-shape runs batched in one ensemble stack",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for simulation; results are identical for any value",
+    )
+    parser.add_argument(
+        "--common-random-numbers",
+        action="store_true",
+        help="Give run i of every scenario the same seed; lets rain-timing sweeps share their first steps",
+    )
+    parser.add_argument("--cache-dir", default="results/cache", help="Directory for cached per-run metrics")
+    parser.add_argument("--cache-max-mb", type=float, default=512.0, help="Size cap of the run cache in MiB")
+    parser.add_argument("--no-cache", action="store_true", help="Simulate every run without reading or writing the cache")
+    parser.add_argument(
+        "--journal",
+        default=None,
+        help="Append-only journal of finished runs (default: <results-dir>/experiment_journal.jsonl)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep the runs already in the journal and simulate only the missing run_ids",
+    )
     parser.add_argument("--results-dir", default="results/raw", help="Directory for CSV/Parquet outputs")
     parser.add_argument("--reports-dir", default="reports", help="Directory for markdown/html reports")
     raw_argv = list(sys.argv[1:] if argv is None else argv)
@@ -53,23 +83,6 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(sanitized)
 
 
-def _flatten_results(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    flattened_rows: list[dict[str, Any]] = []
-    for item in results:
-        row = {"run_id": item["run_id"], "scenario": item["scenario"], "seed": item["seed"]}
-        row.update({f"param_{k}": v for k, v in item["params"].items()})
-        row.update(item["metrics"])
-        flattened_rows.append(row)
-    return flattened_rows
-
-
-def _group_results_by_scenario(results: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
-    grouped: dict[str, list[dict[str, Any]]] = {}
-    for item in results:
-        grouped.setdefault(str(item["scenario"]), []).append(item)
-    return grouped
-
-
 def _collect_problematic_scenarios(summary: Any, target_share: float) -> list[str]:
     return sorted(
         [
@@ -90,7 +103,15 @@ def _scenario_snapshot(summary: Any, scenario_name: str) -> dict[str, float]:
 
 
 def main() -> None:
-    from src.app.experiments.runner import ExperimentResult, persist_results, results_to_dicts, run_experiments as run_batch
+    from src.app.experiments.runner import (
+        ExperimentResult,
+        iter_experiments,
+        persist_rows,
+        result_row,
+        resume_truncated_runs,
+    )
+    from src.app.experiments.cache import RunCache
+    from src.app.experiments.journal import ResultJournal, batch_fingerprint
 
     args = parse_args()
 
@@ -100,48 +121,103 @@ def main() -> None:
         args.n = 100
 
     defaults, scenarios = load_scenarios(args.scenarios)
-    results = run_batch(
+    cache = None if args.no_cache else RunCache(args.cache_dir, max_bytes=int(args.cache_max_mb * 1024 * 1024))
+    planned_run_ids = [f"{scenario.name}-{run_index:04d}" for scenario in scenarios for run_index in range(args.n)]
+    run_order = {run_id: position for position, run_id in enumerate(planned_run_ids)}
+    journal_path = Path(args.journal) if args.journal else Path(args.results_dir) / "experiment_journal.jsonl"
+    fingerprint = batch_fingerprint(
         defaults=defaults,
         scenarios=scenarios,
-        runs_per_scenario=args.n,
         base_seed=args.seed,
         max_steps=args.max_steps,
         critical_baf_threshold=args.critical_baf_threshold,
+        common_random_numbers=args.common_random_numbers,
     )
 
-    results_payload = results_to_dicts(results)
+    # Finished runs go straight to the journal; only their flat analysis rows stay in memory, plus the
+    # truncated runs the censor audit may continue.
+    rows: list[dict[str, Any] | None] = [None] * len(planned_run_ids)
+    resumable: dict[str, ExperimentResult] = {}
+
+    def keep(result: ExperimentResult):
+        rows[run_order[result.run_id]] = result_row(result)
+        if result.metrics.get("truncated_by_max_steps"):
+            resumable[result.run_id] = result
+        else:
+            resumable.pop(result.run_id, None)
+
+    try:
+        journal = ResultJournal(journal_path, resume=args.resume, fingerprint=fingerprint)
+    except ValueError as exc:
+        raise SystemExit(f"[resume] {exc}; rerun without --resume or with another --journal") from exc
+    with journal:
+        restored = 0
+        if args.resume:
+            for result in journal.read():
+                if result.run_id in run_order:
+                    keep(result)
+                    restored += 1
+        if restored:
+            print(f"[resume] {restored} runs restored from {journal_path}")
+        for result in iter_experiments(
+            defaults=defaults,
+            scenarios=scenarios,
+            runs_per_scenario=args.n,
+            base_seed=args.seed,
+            max_steps=args.max_steps,
+            critical_baf_threshold=args.critical_baf_threshold,
+            engine=args.engine,
+            workers=args.workers,
+            keep_checkpoints=not args.disable_censor_audit,
+            cache=cache,
+            skip_run_ids={run_id for run_id, row in zip(planned_run_ids, rows) if row is not None},
+            common_random_numbers=args.common_random_numbers,
+        ):
+            journal.append(result)
+            keep(result)
+
     current_max_steps = int(args.max_steps)
-    scenario_defs = {scenario.name: scenario for scenario in scenarios}
-    grouped_results = _group_results_by_scenario(results_payload)
     audit_rounds: list[dict[str, Any]] = []
+    analysis_cache = AnalysisCache()
     stop_reason = "audit_disabled" if args.disable_censor_audit else "target_met_initial"
 
     if not args.disable_censor_audit:
+        # The audit only reads per-scenario shares and means, so the cheap "audit" profile is enough; the
+        # summary after one round is the summary before the next. Scenarios a round did not rerun are served
+        # from ``analysis_cache``.
+        summary_after = analyze_results(
+            rows,
+            critical_baf_threshold=args.critical_baf_threshold,
+            profile="audit",
+            cache=analysis_cache,
+        )
         for round_index in range(1, max(0, int(args.censor_max_retries)) + 1):
-            rows_before = _flatten_results([item for group in grouped_results.values() for item in group])
-            summary_before = analyze_results(rows_before, critical_baf_threshold=args.critical_baf_threshold)
+            summary_before = summary_after
             problematic = _collect_problematic_scenarios(summary_before, args.censor_target_share)
             if not problematic:
                 stop_reason = "target_met"
                 break
 
             next_max_steps = max(current_max_steps + 1, int(current_max_steps * float(args.censor_step_multiplier)))
-            rerun_scenarios = [scenario_defs[name] for name in problematic if name in scenario_defs]
-            rerun_results = run_batch(
-                defaults=defaults,
-                scenarios=rerun_scenarios,
-                runs_per_scenario=args.n,
-                base_seed=args.seed + round_index * 100_003,
+            rerun = set(problematic)
+            to_resume = [result for result in resumable.values() if result.scenario in rerun]
+            resumed = resume_truncated_runs(
+                to_resume,
                 max_steps=next_max_steps,
                 critical_baf_threshold=args.critical_baf_threshold,
+                workers=args.workers,
+                keep_checkpoints=True,
+                cache=cache,
             )
-            rerun_payload = results_to_dicts(rerun_results)
-            rerun_grouped = _group_results_by_scenario(rerun_payload)
-            for scenario_name, items in rerun_grouped.items():
-                grouped_results[scenario_name] = items
+            for result in resumed:
+                keep(result)
 
-            rows_after = _flatten_results([item for group in grouped_results.values() for item in group])
-            summary_after = analyze_results(rows_after, critical_baf_threshold=args.critical_baf_threshold)
+            summary_after = analyze_results(
+                rows,
+                critical_baf_threshold=args.critical_baf_threshold,
+                profile="audit",
+                cache=analysis_cache,
+            )
 
             scenario_deltas = []
             for scenario_name in problematic:
@@ -165,6 +241,7 @@ def main() -> None:
                     "from_max_steps": current_max_steps,
                     "to_max_steps": next_max_steps,
                     "rerun_scenarios": problematic,
+                    "resumed_runs": len(resumed),
                     "scenario_deltas": scenario_deltas,
                 }
             )
@@ -173,9 +250,11 @@ def main() -> None:
         else:
             stop_reason = "max_retries_reached"
 
-    final_results_payload = [item for group in grouped_results.values() for item in group]
-    final_rows = _flatten_results(final_results_payload)
-    final_summary = analyze_results(final_rows, critical_baf_threshold=args.critical_baf_threshold)
+    resumable.clear()
+    final_rows = rows
+    final_summary = analyze_results(
+        final_rows, critical_baf_threshold=args.critical_baf_threshold, cache=analysis_cache
+    )
     final_problematic = _collect_problematic_scenarios(final_summary, args.censor_target_share)
     if stop_reason == "target_met_initial" and final_problematic:
         stop_reason = "target_not_met_initial"
@@ -189,18 +268,7 @@ def main() -> None:
         "final_problematic_scenarios": final_problematic,
     }
 
-    persisted_results = [
-        ExperimentResult(
-            run_id=str(item["run_id"]),
-            scenario=str(item["scenario"]),
-            seed=int(item["seed"]),
-            params=dict(item["params"]),
-            metrics=dict(item["metrics"]),
-        )
-        for item in final_results_payload
-    ]
-
-    csv_path, parquet_path = persist_results(persisted_results, Path(args.results_dir))
+    csv_path, parquet_path = persist_rows(final_rows, Path(args.results_dir))
     md_path, html_path, _ = generate_report(
         final_rows,
         final_summary,
@@ -217,6 +285,8 @@ def main() -> None:
         f"target={args.censor_target_share:.4f}, final_problematic={len(final_problematic)}, "
         f"rounds={len(audit_rounds)}, max_steps={args.max_steps}->{current_max_steps}, stop_reason={stop_reason}"
     )
+    if cache is not None:
+        print(f"[cache] dir={cache.cache_dir}, hits={cache.hits}, misses={cache.misses}")
 
 
 if __name__ == "__main__":
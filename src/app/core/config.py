@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 
 @dataclass
@@ -39,3 +40,36 @@ class CAConfig:
     rain_scenario_start_step: int = 20
     rain_scenario_end_step: int = 35
     rain_scenario_intensity: float = 0.5
+
+    # Random stream layout for ignition and rain. "per_direction" is the reference stream
+    # (one full-grid draw per spreading direction plus two rain draws). "combined" merges
+    # the directions into 1 - prod(1 - p_dir) and draws only for tree cells next to fire
+    # and, for rain, only for burning cells: same model, different random sequence.
+    ignition_mode: str = "per_direction"
+
+    # Sparse stepping: side of the square tiles tracked in the activity map.
+    # 0 keeps the dense full-grid step.
+    tile_size: int = 0
+
+    # Threaded stepping: height of the horizontal strips that are stepped in parallel, each with
+    # its own random stream keyed by step and strip, so results do not depend on ``threads``.
+    # 0 keeps the single-threaded dense step. Ignored while ``tile_size`` is set.
+    strip_rows: int = 0
+    # Worker threads for strip stepping; 0 uses one per CPU.
+    threads: int = 0
+
+    # Random number source. "sequential" draws from one np.random.Generator in call order (the
+    # reference). "counter" addresses every draw by (seed, step, purpose, cell), so the dense, tiled
+    # and strip steps give bit-identical grids for one seed, and cells without any chance of
+    # changing are not drawn for at all.
+    rng_mode: str = "sequential"
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        # Every assignment (including the GUI's in-place edits) bumps the revision, so engines know
+        # when to recompile values derived from the config.
+        super().__setattr__("_revision", self.__dict__.get("_revision", 0) + 1)
+
+    @property
+    def revision(self) -> int:
+        return self.__dict__.get("_revision", 0)
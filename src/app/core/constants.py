@@ -16,3 +16,30 @@ BURNING = BURNING1
 
 TREE_STATES = (TREE_DECID, TREE_CONIF)
 BURNING_STATES = (BURNING1, BURNING2, BURNING3)
+
+# A transition code packs a cell's state (low three bits) with the outcomes drawn for it this step.
+IGNITE_BIT = 1 << 3
+DAMPEN_BIT = 1 << 4
+EXTINGUISH_BIT = 1 << 5
+TRANSITION_CODES = 1 << 6
+
+
+def next_state(code: int) -> int:
+    """State a cell moves to in one step, given its transition code.
+
+    Ignition wins over everything else; dampening only affects BURNING1 cells and extinguishing
+    only BURNING2 cells, so the outcome bits may be set for any cell.
+    """
+    state = code & 0b111
+    if code & IGNITE_BIT:
+        return BURNING1
+    if state == BURNING1:
+        return BURNING3 if code & DAMPEN_BIT else BURNING2
+    if state == BURNING2:
+        return BURNT if code & EXTINGUISH_BIT else BURNING3
+    if state == BURNING3:
+        return BURNT
+    return state
+
+
+NEXT_STATE = tuple(next_state(code) for code in range(TRANSITION_CODES))
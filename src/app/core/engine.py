@@ -1,6 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+import json
+import os
+import struct
+import threading
+from typing import Any, Callable
+import zlib
+
 import numpy as np
 
 from src.app.core.config import CAConfig
@@ -11,16 +20,187 @@ from src.app.core.constants import (
     BURNING3,
     BURNING_STATES,
     BURNT,
+    DAMPEN_BIT,
     EMPTY,
+    EXTINGUISH_BIT,
+    IGNITE_BIT,
+    NEXT_STATE,
+    TRANSITION_CODES,
     TREE_CONIF,
     TREE_DECID,
     TREE_STATES,
 )
+from src.app.core.counter_rng import (
+    COMBINED_IGNITION,
+    DAMPEN,
+    EXTINGUISH,
+    LIGHTNING,
+    CounterStreams,
+    counter_uniform,
+)
 from src.app.core.metrics import calculate_fire_metrics, metrics_to_json
 from src.app.core.metrics import METRICS_PAYLOAD_SCHEMA_VERSION
 
 
-class ForestFireCA:
+@dataclass(frozen=True)
+class CACheckpoint:
+    """Mid-run state of one simulation; restoring it continues the run exactly where it stopped."""
+
+    grid: np.ndarray
+    rng_state: dict[str, Any]
+    step_count: int
+    lightning_cooldown: int
+    initial_tree_cells: int
+    burning_cells_history: list[int]
+
+    def to_bytes(self) -> bytes:
+        """Compact binary form: a small JSON header (RNG state, counters) and the zlib-packed grid and history.
+
+        Cell states fit in a byte, and grids are mostly runs of a few states, so the grid compresses to a
+        small fraction of ``H * W`` bytes.
+        """
+        grid = np.ascontiguousarray(self.grid, dtype=np.uint8)
+        meta = {
+            "shape": list(grid.shape),
+            "rng_state": self.rng_state,
+            "step_count": int(self.step_count),
+            "lightning_cooldown": int(self.lightning_cooldown),
+            "initial_tree_cells": int(self.initial_tree_cells),
+        }
+        encoded_meta = json.dumps(meta, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        history = np.asarray(self.burning_cells_history, dtype="<u4")
+        body = zlib.compress(grid.tobytes() + history.tobytes(), _SNAPSHOT_COMPRESSION)
+        return _SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, len(encoded_meta)) + encoded_meta + body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> CACheckpoint:
+        """Inverse of ``to_bytes``; raises ``ValueError`` for data that is not a snapshot of this version."""
+        try:
+            magic, version, meta_size = _SNAPSHOT_HEADER.unpack_from(data)
+        except struct.error as exc:
+            raise ValueError("Truncated simulation snapshot") from exc
+        if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+            raise ValueError(f"Not a version {_SNAPSHOT_VERSION} simulation snapshot")
+        start = _SNAPSHOT_HEADER.size
+        try:
+            meta = json.loads(data[start : start + meta_size].decode("utf-8"))
+            body = zlib.decompress(data[start + meta_size :])
+        except (ValueError, zlib.error) as exc:
+            raise ValueError("Corrupt simulation snapshot") from exc
+        h, w = (int(v) for v in meta["shape"])
+        if len(body) < h * w or (len(body) - h * w) % 4:
+            raise ValueError("Corrupt simulation snapshot")
+        return cls(
+            grid=np.frombuffer(body, dtype=np.uint8, count=h * w).reshape(h, w).copy(),
+            rng_state=meta["rng_state"],
+            step_count=int(meta["step_count"]),
+            lightning_cooldown=int(meta["lightning_cooldown"]),
+            initial_tree_cells=int(meta["initial_tree_cells"]),
+            burning_cells_history=np.frombuffer(body, dtype="<u4", offset=h * w).tolist(),
+        )
+
+
+_SNAPSHOT_MAGIC = b"FFCA"
+_SNAPSHOT_VERSION = 1
+# magic, format version, JSON header length
+_SNAPSHOT_HEADER = struct.Struct("<4sBI")
+_SNAPSHOT_COMPRESSION = 1
+
+# Next state per transition code (see constants.next_state), and the change each code makes to
+# the per-state cell counts.
+TRANSITION_TABLE = np.array(NEXT_STATE, dtype=np.uint8)
+TRANSITION_TABLE.flags.writeable = False
+_TRANSITION_COUNT_DELTA = np.zeros((TRANSITION_CODES, 8), dtype=np.int64)
+for _code, _next in enumerate(NEXT_STATE):
+    _TRANSITION_COUNT_DELTA[_code, _code & 0b111] -= 1
+    _TRANSITION_COUNT_DELTA[_code, _next] += 1
+
+
+def _scratch_buffers(shape: tuple[int, int]) -> dict[str, np.ndarray]:
+    """Flat scratch buffers for stepping rectangles of up to ``shape`` cells."""
+    h, w = shape
+    n = h * w
+    n_padded = (h + 2) * (w + 2)
+    return {
+        "stage_factor": np.zeros(n_padded, dtype=np.float32),
+        "flamm": np.zeros(n, dtype=np.float32),
+        "p_eff": np.zeros(n, dtype=np.float32),
+        "uniform": np.zeros(n, dtype=np.float64),
+        "survival": np.zeros(n, dtype=np.float64),
+        "is_tree": np.zeros(n, dtype=bool),
+        "candidates": np.zeros(n, dtype=bool),
+        "hits": np.zeros(n, dtype=bool),
+        "ignite": np.zeros(n, dtype=bool),
+        "code": np.zeros(n, dtype=np.uint8),
+        "code_bits": np.zeros(n, dtype=np.uint8),
+    }
+
+
+# One thread pool for the strip steps of every engine in the process, with its worker count.
+_STRIP_POOL: tuple[int, ThreadPoolExecutor] | None = None
+_STRIP_POOL_LOCK = threading.Lock()
+
+
+def _map_strips(workers: int, advance: Callable[[int], np.ndarray], strips: range) -> list[np.ndarray]:
+    """Run ``advance`` over ``strips`` on the shared pool of ``workers`` threads.
+
+    Creating engines (or forks) therefore never creates threads, and asking for another worker count
+    shuts the previous pool down before replacing it. Strip steps from engines on different threads
+    take turns; each one already keeps all the pool's workers busy.
+    """
+    global _STRIP_POOL
+    with _STRIP_POOL_LOCK:
+        if _STRIP_POOL is None or _STRIP_POOL[0] != workers:
+            if _STRIP_POOL is not None:
+                _STRIP_POOL[1].shutdown()
+            _STRIP_POOL = (workers, ThreadPoolExecutor(workers, thread_name_prefix="ca-strip"))
+        return list(_STRIP_POOL[1].map(advance, strips))
+
+
+class _DrawLane:
+    """A random stream plus the scratch buffers the rectangle kernels of a step work in.
+
+    The engine is its own lane; the threaded strip step gives every strip a separate one.
+    """
+
+    rng: np.random.Generator
+    _scratch: dict[str, np.ndarray]
+
+    def _buffer(self, name: str, shape: tuple[int, int]) -> np.ndarray:
+        """C-contiguous view of a preallocated scratch buffer with the given 2D shape."""
+        return self._scratch[name][:shape[0] * shape[1]].reshape(shape)
+
+    def _fill_uniform(self, out: np.ndarray):
+        if isinstance(self.rng, np.random.Generator):
+            self.rng.random(out=out)
+        else:
+            out[...] = self.rng.random(out.shape)
+
+    def _skip_uniform(self, out: np.ndarray, fills: int):
+        """Advance the stream as ``fills`` calls of ``_fill_uniform(out)`` would, without generating if possible."""
+        if isinstance(self.rng, np.random.Generator) and skip_uniform_draws(self.rng, fills * out.size):
+            return
+        for _ in range(fills):
+            self._fill_uniform(out)
+
+    def _sparse_rain_outcome(self, g: np.ndarray, state: int, probability: float, out: np.ndarray):
+        """Per-cell Bernoulli outcome for cells in ``state``, drawing only for those cells."""
+        out.fill(False)
+        if probability <= 0.0:
+            return
+        cells = np.flatnonzero(g == state)
+        if cells.size:
+            out.ravel()[cells] = self.rng.random(cells.size) < probability
+
+
+class _StripLane(_DrawLane):
+    def __init__(self, shape: tuple[int, int]):
+        self.shape = shape
+        self.rng = np.random.default_rng(0)
+        self._scratch = _scratch_buffers(shape)
+
+
+class ForestFireCA(_DrawLane):
     _DIRS = [
         (-1, -1), (-1, 0), (-1, 1),
         (0, -1),           (0, 1),
@@ -35,59 +215,188 @@ class ForestFireCA:
     _T_MIN = -10.0
     _T_MAX = 40.0
 
+    _TREE_TABLE = np.isin(np.arange(8), TREE_STATES)
+
+    # When set, every step cross-checks the incremental state counters against a full bincount.
+    debug_counts = False
+
     def __init__(self, cfg: CAConfig):
         self.cfg = cfg
+        self._plan_cache: tuple[CAConfig, int, StepPlan] | None = None
         self.rng = np.random.default_rng(cfg.seed)
+        # Draw keys for rng_mode="counter"; _step_keys holds the current step's.
+        self._counter = CounterStreams(cfg.seed)
+        self._step_keys = np.zeros(0, dtype=np.uint64)
+        # Two padded grids with an EMPTY one-cell border: the front one holds the current
+        # state, the back one receives the next step. ``grid`` is a view of the front interior.
+        self._pads: list[np.ndarray] = []
+        self._front = 0
+        self._scratch: dict[str, np.ndarray] = {}
+        # Cells per state value, kept up to date by step() and the edit APIs.
+        self._counts = [0] * 8
+        # Per-tile "holds fire" map for tile_size > 0, built for ``_tile_size`` and kept up to date
+        # by the grid setter, the edit APIs and the tiled step.
+        self._tile_active: np.ndarray | None = None
+        self._tile_size = 0
         self.grid = self._make_initial_grid()
         self.step_count = 0
         self._lightning_cooldown = 0
+        # Set by advance_idle() for the step it already knows ends with a lightning event.
+        self._lightning_due = False
         self.initial_tree_cells = 0
         self.burning_cells_history: list[int] = []
         self.final_counts: dict[str, int] = {}
         self.latest_metrics: dict[str, int | float] = {}
         self.start_run_tracking()
 
-    def _make_initial_grid(self) -> np.ndarray:
-        cfg = self.cfg
-        h, w = cfg.height, cfg.width
-        grid = np.full((h, w), EMPTY, dtype=np.uint8)
+    @property
+    def plan(self) -> StepPlan:
+        """Step constants compiled from ``cfg``; recompiled after ``cfg`` is replaced or any of its fields is set."""
+        cached = self._plan_cache
+        if cached is None or cached[0] is not self.cfg or cached[1] != self.cfg.revision:
+            cached = (self.cfg, self.cfg.revision, compile_step_plan(self.cfg))
+            self._plan_cache = cached
+        return cached[2]
 
-        has_tree = self.rng.random((h, w)) < float(np.clip(cfg.init_tree_density, 0.0, 1.0))
-        conif_ratio = float(np.clip(cfg.conifer_ratio, 0.0, 1.0))
-        is_conif = has_tree & (self.rng.random((h, w)) < conif_ratio)
-        is_decid = has_tree & ~is_conif
-
-        grid[is_decid] = TREE_DECID
-        grid[is_conif] = TREE_CONIF
-        return grid
+    def _make_initial_grid(self) -> np.ndarray:
+        return initial_grid(self.cfg, self.rng)
+
+    @property
+    def grid(self) -> np.ndarray:
+        """The current states: a view into the double-buffered padded grids, not a copy.
+
+        Each step writes the other buffer and swaps, so the array returned here is overwritten by the
+        second ``step()`` after it was taken. Copy it to keep a grid across steps.
+        """
+        return self._pads[self._front][1:-1, 1:-1]
+
+    @grid.setter
+    def grid(self, value: np.ndarray):
+        value = np.asarray(value, dtype=np.uint8)
+        if not self._pads or self._pads[0].shape != (value.shape[0] + 2, value.shape[1] + 2):
+            self._allocate_buffers(value.shape)
+        self._pads[self._front][1:-1, 1:-1] = value
+        self._recount()
+        self._rebuild_tile_activity()
+
+    def _recount(self):
+        self._counts = np.bincount(self.grid.ravel(), minlength=8).tolist()
+
+    def verify_counts(self):
+        """Raise if the incremental state counters disagree with a full recount of the grid."""
+        expected = np.bincount(self.grid.ravel(), minlength=8).tolist()
+        if expected != self._counts:
+            raise RuntimeError(
+                f"Cell counters out of sync at step {self.step_count}: tracked={self._counts}, actual={expected}"
+            )
+
+    def _allocate_buffers(self, shape: tuple[int, int]):
+        h, w = shape
+        self._pads = [np.zeros((h + 2, w + 2), dtype=np.uint8) for _ in range(2)]
+        self._front = 0
+        self._scratch = _scratch_buffers(shape)
+        self._strip_lanes: list[_StripLane] = []
 
     def reset(self):
         self.rng = np.random.default_rng(self.cfg.seed)
+        self._counter = CounterStreams(self.cfg.seed)
         self.grid = self._make_initial_grid()
         self.step_count = 0
         self._lightning_cooldown = 0
         self.start_run_tracking()
 
+    def checkpoint(self) -> CACheckpoint:
+        return CACheckpoint(
+            grid=self.grid.copy(),
+            rng_state=self.rng.bit_generator.state,
+            step_count=self.step_count,
+            lightning_cooldown=self._lightning_cooldown,
+            initial_tree_cells=self.initial_tree_cells,
+            burning_cells_history=list(self.burning_cells_history),
+        )
+
+    @classmethod
+    def from_checkpoint(cls, cfg: CAConfig, checkpoint: CACheckpoint) -> ForestFireCA:
+        """Rebuild an engine for ``cfg`` in the state captured by ``checkpoint``."""
+        ca = cls(cfg)
+        ca.restore(checkpoint)
+        return ca
+
+    def snapshot(self) -> bytes:
+        """Current state as ``CACheckpoint.to_bytes``; ``restore`` continues the run from it exactly."""
+        return self.checkpoint().to_bytes()
+
+    def restore(self, state: CACheckpoint | bytes):
+        """Put this engine back into a state from ``checkpoint()`` or ``snapshot()``.
+
+        The config is not part of the state: restore into an engine built for the same (or a
+        compatible) config, whose grid shape must match.
+        """
+        checkpoint = CACheckpoint.from_bytes(state) if isinstance(state, bytes) else state
+        expected_shape = (int(self.cfg.height), int(self.cfg.width))
+        if checkpoint.grid.shape != expected_shape:
+            raise ValueError(f"Checkpoint grid {checkpoint.grid.shape} does not match config grid {expected_shape}")
+        self.rng.bit_generator.state = checkpoint.rng_state
+        self.grid = checkpoint.grid
+        self.step_count = int(checkpoint.step_count)
+        self._lightning_cooldown = int(checkpoint.lightning_cooldown)
+        self._lightning_due = False
+        self.initial_tree_cells = int(checkpoint.initial_tree_cells)
+        self.burning_cells_history = list(checkpoint.burning_cells_history)
+
+    def fork(self, new_seed: int | None = None) -> ForestFireCA:
+        """Independent copy of the running simulation, e.g. to branch what-if runs from a common prefix.
+
+        With ``new_seed=None`` the fork keeps a copy of the RNG state and repeats this run's future;
+        otherwise it continues from the current grid with a fresh stream seeded by ``new_seed``. The
+        fork skips initial grid generation and copies only the current grid; every step writes a whole
+        new grid, so sharing it between branches would not save anything past their first step.
+        """
+        clone = type(self).__new__(type(self))
+        clone.cfg = self.cfg if new_seed is None else replace(self.cfg, seed=new_seed)
+        clone._plan_cache = self._plan_cache
+        clone.rng = np.random.default_rng(clone.cfg.seed)
+        clone._counter = CounterStreams(new_seed) if new_seed is not None else self._counter
+        clone._step_keys = self._step_keys
+        if new_seed is None:
+            clone.rng.bit_generator.state = self.rng.bit_generator.state
+        clone._allocate_buffers(self.grid.shape)
+        clone._pads[clone._front][1:-1, 1:-1] = self.grid
+        clone._counts = list(self._counts)
+        clone._tile_active = None if self._tile_active is None else self._tile_active.copy()
+        clone._tile_size = self._tile_size
+        clone.step_count = self.step_count
+        clone._lightning_cooldown = self._lightning_cooldown
+        clone._lightning_due = False
+        clone.initial_tree_cells = self.initial_tree_cells
+        clone.burning_cells_history = list(self.burning_cells_history)
+        clone.final_counts = dict(self.final_counts)
+        clone.latest_metrics = dict(self.latest_metrics)
+        return clone
+
     def has_active_fire(self) -> bool:
-        return bool(np.any((self.grid == BURNING1) | (self.grid == BURNING2) | (self.grid == BURNING3)))
+        return self._burning_cells_count() > 0
 
     def _burning_cells_count(self) -> int:
-        return int(np.count_nonzero((self.grid == BURNING1) | (self.grid == BURNING2) | (self.grid == BURNING3)))
+        counts = self._counts
+        return counts[BURNING1] + counts[BURNING2] + counts[BURNING3]
 
     def cell_counts(self) -> dict[str, int]:
-        g = self.grid
+        counts = self._counts
         return {
-            "empty": int(np.count_nonzero(g == EMPTY)),
-            "decid": int(np.count_nonzero(g == TREE_DECID)),
-            "conif": int(np.count_nonzero(g == TREE_CONIF)),
+            "empty": counts[EMPTY],
+            "decid": counts[TREE_DECID],
+            "conif": counts[TREE_CONIF],
             "burning": self._burning_cells_count(),
-            "barrier": int(np.count_nonzero(g == BARRIER)),
-            "burnt": int(np.count_nonzero(g == BURNT)),
+            "barrier": counts[BARRIER],
+            "burnt": counts[BURNT],
         }
 
     def start_run_tracking(self):
-        trees = (self.grid == TREE_DECID) | (self.grid == TREE_CONIF)
-        self.initial_tree_cells = int(np.count_nonzero(trees))
+        # Resynchronise derived state in case the grid was edited directly.
+        self._recount()
+        self._rebuild_tile_activity()
+        self.initial_tree_cells = self._counts[TREE_DECID] + self._counts[TREE_CONIF]
         self.burning_cells_history = [self._burning_cells_count()]
         self.final_counts = self.cell_counts()
         self.latest_metrics = calculate_fire_metrics(
@@ -131,6 +440,10 @@ class ForestFireCA:
             "rain_scenario_start_step": int(self.cfg.rain_scenario_start_step),
             "rain_scenario_end_step": int(self.cfg.rain_scenario_end_step),
             "rain_scenario_intensity": float(self.cfg.rain_scenario_intensity),
+            "ignition_mode": str(self.cfg.ignition_mode),
+            "tile_size": int(self.cfg.tile_size),
+            "strip_rows": int(self.cfg.strip_rows),
+            "rng_mode": str(self.cfg.rng_mode),
         }
 
         return {
@@ -149,199 +462,643 @@ class ForestFireCA:
         return metrics_to_json(self.metrics_payload())
 
     def current_rain_intensity(self) -> float:
-        manual = float(self.cfg.rain_intensity) if self.cfg.rain_enabled else 0.0
+        return self.plan.rain_at(self.step_count)
 
-        scenario = 0.0
-        if self.cfg.rain_scenario_enabled:
-            start = int(self.cfg.rain_scenario_start_step)
-            end = int(self.cfg.rain_scenario_end_step)
-            if start <= self.step_count < end and end > start:
-                scenario = float(self.cfg.rain_scenario_intensity)
-
-        return float(np.clip(manual + scenario, 0.0, 1.0))
+    def _set_cell(self, row: int, col: int, state: int):
+        self._counts[int(self.grid[row, col])] -= 1
+        self._counts[state] += 1
+        self.grid[row, col] = state
 
     def set_empty(self, row: int, col: int):
         if 0 <= row < self.cfg.height and 0 <= col < self.cfg.width:
-            self.grid[row, col] = EMPTY
+            self._set_cell(row, col, EMPTY)
 
     def set_barrier(self, row: int, col: int, enabled: bool = True):
         if 0 <= row < self.cfg.height and 0 <= col < self.cfg.width:
             v = int(self.grid[row, col])
             if enabled:
                 if v not in BURNING_STATES:
-                    self.grid[row, col] = BARRIER
+                    self._set_cell(row, col, BARRIER)
             elif v == BARRIER:
-                self.grid[row, col] = EMPTY
+                self._set_cell(row, col, EMPTY)
 
     def plant_decid(self, row: int, col: int):
         if 0 <= row < self.cfg.height and 0 <= col < self.cfg.width:
             if int(self.grid[row, col]) not in (BARRIER, *BURNING_STATES):
-                self.grid[row, col] = TREE_DECID
+                self._set_cell(row, col, TREE_DECID)
 
     def plant_conif(self, row: int, col: int):
         if 0 <= row < self.cfg.height and 0 <= col < self.cfg.width:
             if int(self.grid[row, col]) not in (BARRIER, *BURNING_STATES):
-                self.grid[row, col] = TREE_CONIF
+                self._set_cell(row, col, TREE_CONIF)
 
     def ignite(self, row: int, col: int):
         if 0 <= row < self.cfg.height and 0 <= col < self.cfg.width:
             if int(self.grid[row, col]) in TREE_STATES:
-                self.grid[row, col] = BURNING1
-
-    def _shift_no_wrap(self, mask: np.ndarray, dx: int, dy: int) -> np.ndarray:
-        h, w = mask.shape
-        out = np.zeros_like(mask, dtype=mask.dtype)
-
-        xs0 = max(0, -dx)
-        xs1 = h - max(0, dx)
-        ys0 = max(0, -dy)
-        ys1 = w - max(0, dy)
-
-        xd0 = max(0, dx)
-        yd0 = max(0, dy)
-
-        out[xd0:xd0 + (xs1 - xs0), yd0:yd0 + (ys1 - ys0)] = mask[xs0:xs1, ys0:ys1]
-        return out
+                self._set_cell(row, col, BURNING1)
+                self._mark_tile_active(row, col)
 
     def _spread_prob_wind(self, dx: int, dy: int) -> float:
-        if not self.cfg.wind_enabled or self.cfg.wind_strength <= 0:
-            return 1.0
-
-        wx, wy = self._WIND_DIRS.get(self.cfg.wind_dir, (0, 1))
-        d_norm = (dx * dx + dy * dy) ** 0.5
-        w_norm = (wx * wx + wy * wy) ** 0.5
-        dot = (dx * wx + dy * wy) / (d_norm * w_norm)
-
-        # s = float(self.cfg.wind_strength)
-        # p = 1.0 - s * (1.0 - dot) / 2.0
-        # return float(np.clip(p, 0.0, 1.0))
-        
-        s = float(np.clip(self.cfg.wind_strength, 0.0, 1.0))
-        downwind_factor = 1.0 + s
-        crosswind_factor = 1.0 - 0.25 * s
-        upwind_factor = 1.0 - s
-
-        if dot >= 0.0:
-            p = crosswind_factor + dot * (downwind_factor - crosswind_factor)
-        else:
-            p = crosswind_factor + (-dot) * (upwind_factor - crosswind_factor)
-
-        return float(max(p, 0.0))
+        return spread_prob_wind(self.cfg, dx, dy)
 
     def _temp_norm(self) -> float:
-        t = float(self.cfg.temperature_c)
-        return float(np.clip((t - self._T_MIN) / (self._T_MAX - self._T_MIN), 0.0, 1.0))
-
-    def _lightning_event(self, tree_mask: np.ndarray, susceptibility: np.ndarray, event_prob: float) -> np.ndarray:
-        ignite = np.zeros_like(tree_mask, dtype=bool)
-
-        if not self.cfg.lightning_enabled:
+        return temperature_norm(self.cfg)
+
+    def _tile_shape(self) -> tuple[int, int]:
+        t = self._tile_size
+        h, w = self.grid.shape
+        return -(-h // t), -(-w // t)
+
+    def _rebuild_tile_activity(self):
+        """Recompute the per-tile activity map from the whole grid for the current ``cfg.tile_size``."""
+        self._tile_size = int(self.cfg.tile_size)
+        if self._tile_size <= 0:
+            self._tile_active = None
+            return
+        self._tile_active = np.zeros(self._tile_shape(), dtype=bool)
+        self._refresh_tile_activity(0, self.grid.shape[0], 0, self.grid.shape[1])
+
+    def _refresh_tile_activity(self, r0: int, r1: int, c0: int, c1: int):
+        """Recompute activity for the tile-aligned cell rectangle [r0:r1, c0:c1]."""
+        t = self._tile_size
+        g = self.grid[r0:r1, c0:c1]
+        burning = (g >= BURNING1) & (g <= BURNING3)
+        row_starts = np.arange(0, burning.shape[0], t)
+        col_starts = np.arange(0, burning.shape[1], t)
+        per_tile = np.logical_or.reduceat(np.logical_or.reduceat(burning, row_starts, axis=0), col_starts, axis=1)
+        self._tile_active[r0 // t:r0 // t + per_tile.shape[0], c0 // t:c0 // t + per_tile.shape[1]] = per_tile
+
+    def _mark_tile_active(self, row: int, col: int):
+        if self._tile_active is not None:
+            t = self._tile_size
+            self._tile_active[row // t, col // t] = True
+
+    def _active_rects(self) -> list[tuple[int, int, int, int]]:
+        """Cell rectangles covering active tiles plus a one-tile halo, one per run of tiles in a tile row."""
+        active = self._tile_active
+        th, tw = active.shape
+        padded = np.zeros((th + 2, tw + 2), dtype=bool)
+        padded[1:-1, 1:-1] = active
+        halo = np.zeros_like(active)
+        for dr in (0, 1, 2):
+            for dc in (0, 1, 2):
+                halo |= padded[dr:dr + th, dc:dc + tw]
+
+        t = self._tile_size
+        h, w = self.grid.shape
+        rects: list[tuple[int, int, int, int]] = []
+        for tr in np.flatnonzero(halo.any(axis=1)):
+            edges = np.diff(np.concatenate(([0], halo[tr].view(np.int8), [0])))
+            starts = np.flatnonzero(edges == 1)
+            stops = np.flatnonzero(edges == -1)
+            r0, r1 = int(tr) * t, min(h, (int(tr) + 1) * t)
+            for tc0, tc1 in zip(starts, stops):
+                rects.append((r0, r1, int(tc0) * t, min(w, int(tc1) * t)))
+        return rects
+
+    def _lightning_event(self, event_prob: float, dryness_eff: float) -> np.ndarray:
+        """Return flat indices of cells struck by lightning this step (usually empty).
+
+        The eligible trees and their weights are only materialised when an event fires.
+        """
+        no_strikes = np.empty(0, dtype=np.intp)
+        plan = self.plan
+
+        if not plan.lightning_enabled:
             if self._lightning_cooldown > 0:
                 self._lightning_cooldown -= 1
-            return ignite
+            return no_strikes
 
         if self._lightning_cooldown > 0:
             self._lightning_cooldown -= 1
-            return ignite
+            return no_strikes
 
-        if self.rng.random() >= float(np.clip(event_prob, 0.0, 1.0)):
-            return ignite
+        rng = self._counter.generator(self.step_count, LIGHTNING) if plan.counter_draws else self.rng
+        if self._lightning_due:
+            self._lightning_due = False
+        elif rng.random() >= float(np.clip(event_prob, 0.0, 1.0)):
+            return no_strikes
 
-        eligible = np.flatnonzero(tree_mask)
+        g = self.grid
+        eligible = np.flatnonzero((g == TREE_DECID) | (g == TREE_CONIF))
         if eligible.size == 0:
-            return ignite
+            return no_strikes
 
-        max_k = min(int(self.cfg.lightning_max_strikes_per_event), eligible.size)
+        max_k = min(plan.lightning_max_strikes, eligible.size)
         if max_k <= 0:
-            return ignite
+            return no_strikes
 
-        k = int(self.rng.integers(1, max_k + 1))
+        k = int(rng.integers(1, max_k + 1))
 
-        weights = susceptibility.ravel()[eligible].astype(np.float64)
+        flamm = plan.flammability[g.ravel()[eligible]]
+        weights = np.clip(dryness_eff * flamm, 0.0, 1.0).astype(np.float32).astype(np.float64)
         total = weights.sum()
         if total <= 0:
-            return ignite
+            return no_strikes
         weights /= total
 
-        chosen = self.rng.choice(eligible, size=k, replace=False, p=weights)
-        ignite.ravel()[chosen] = True
+        chosen = rng.choice(eligible, size=k, replace=False, p=weights)
+
+        self._lightning_cooldown = plan.lightning_cooldown_steps
+        return chosen
+
+    def _lightning_event_prob(self, rain: float) -> float:
+        return float(np.clip(self.plan.lightning_f * (1.0 - rain) ** 2, 0.0, 1.0))
+
+    def lightning_strike_possible(self) -> bool:
+        """Whether lightning can strike a tree at the current rain level (once any cooldown has passed)."""
+        plan = self.plan
+        if not plan.lightning_enabled or plan.lightning_f <= 0.0:
+            return False
+        return self._strike_prob(self.current_rain_intensity()) > 0.0
+
+    def _strike_prob(self, rain: float) -> float:
+        """Chance that a step without fire and without cooldown ends with a tree struck by lightning."""
+        event_prob = self._lightning_event_prob(rain)
+        if event_prob <= 0.0 or self.plan.lightning_max_strikes <= 0:
+            return 0.0
+        # Mirrors _lightning_event: an event strikes only if some tree has a positive float32 weight.
+        dryness_eff = self._dryness_eff(rain)
+        flamm = self.plan.flammability
+        for state in TREE_STATES:
+            if self._counts[state] and np.float32(np.clip(dryness_eff * flamm[state], 0.0, 1.0)) > 0:
+                return event_prob
+        return 0.0
+
+    def _steps_until_rain_change(self) -> int | None:
+        """Steps until the rain scenario window opens or closes; ``None`` if rain stays as it is."""
+        plan = self.plan
+        if plan.rain_scenario == 0.0 or plan.rain_end <= plan.rain_start or self.step_count >= plan.rain_end:
+            return None
+        return (plan.rain_start if self.step_count < plan.rain_start else plan.rain_end) - self.step_count
+
+    def _skip_idle_steps(self, steps: int):
+        self.step_count += steps
+        self._lightning_cooldown = max(0, self._lightning_cooldown - steps)
+        self.burning_cells_history.extend([0] * steps)
+
+    def _counter_idle_failures(self, event_prob: float, span: int) -> int:
+        """Failed lightning rolls, at most ``span``, before the first success from the current step on."""
+        for offset in range(span):
+            if self._counter.generator(self.step_count + offset, LIGHTNING).random() < event_prob:
+                return offset
+        return span
+
+    def advance_idle(self, max_steps: int) -> int:
+        """Jump over steps without fire up to and including the next lightning strike; return the steps taken.
+
+        Without fire a step only counts down the lightning cooldown and rolls for an event, so the
+        cooldown is consumed at once and the number of failed rolls is drawn from a geometric
+        distribution (per stretch of constant rain). The strike step itself runs through ``step()``.
+        At most ``max_steps`` steps are taken, and none while fire is active. Outcomes have the same
+        distribution as stepping one by one, but the random stream is consumed differently; with
+        ``rng_mode="counter"`` the rolls are read from their addressed draws and outcomes are identical.
+        """
+        if self.has_active_fire():
+            return 0
+        budget = max(0, int(max_steps))
+        advanced = 0
+        while advanced < budget:
+            span = budget - advanced
+            until_change = self._steps_until_rain_change()
+            if until_change is not None:
+                span = min(span, until_change)
+            if self.plan.lightning_enabled and self._lightning_cooldown > 0:
+                span = min(span, self._lightning_cooldown)
+            elif self.plan.lightning_enabled:
+                strike_prob = self._strike_prob(self.current_rain_intensity())
+                if strike_prob <= 0.0:
+                    failures = span
+                elif self.plan.counter_draws:
+                    failures = self._counter_idle_failures(strike_prob, span)
+                else:
+                    failures = int(self.rng.geometric(strike_prob)) - 1
+                if failures < span:
+                    self._skip_idle_steps(failures)
+                    # An addressed roll is simply read again by step(), which keeps the strike draws in place.
+                    self._lightning_due = not self.plan.counter_draws
+                    self.step()
+                    return advanced + failures + 1
+            self._skip_idle_steps(span)
+            advanced += span
+        return advanced
+
+    def _dryness_eff(self, rain: float) -> float:
+        return float(np.clip(self.plan.dryness_base * (1.0 - rain), 0.0, 1.0))
+
+    def _stage_factor_table(self) -> np.ndarray:
+        return self.plan.stage_factors
+
+    def _flammability_table(self) -> np.ndarray:
+        return self.plan.flammability
+
+    def _ignite_rect(
+        self, r0: int, r1: int, c0: int, c1: int, dryness_eff: float, lane: _DrawLane | None = None
+    ) -> np.ndarray:
+        """Neighbour ignitions for grid rows r0:r1 and columns c0:c1, read from the padded front grid.
+
+        Neighbours are slice views of a padded stage-factor grid; every temporary lives in a
+        preallocated scratch buffer of ``lane`` (the engine itself by default), so the
+        per-direction loop allocates nothing.
+        """
+        lane = self if lane is None else lane
+        plan = self.plan
+        pad = self._pads[self._front]
+        shape = (r1 - r0, c1 - c0)
+        g = pad[r0 + 1:r1 + 1, c0 + 1:c1 + 1]
+
+        # A burning cell contributes exactly its clipped stage factor, the same float32 value
+        # the per-stage masks summed to before.
+        src = lane._buffer("stage_factor", (shape[0] + 2, shape[1] + 2))
+        np.take(plan.stage_factors, pad[r0:r1 + 2, c0:c1 + 2], out=src, mode="clip")
+
+        is_tree = lane._buffer("is_tree", shape)
+        np.take(self._TREE_TABLE, g, out=is_tree, mode="clip")
+        flamm = lane._buffer("flamm", shape)
+        np.take(plan.flammability, g, out=flamm, mode="clip")
+        if not plan.wind_enabled:
+            # Every direction has multiplier 1.0, so flamm * dryness is shared by all of them.
+            np.multiply(flamm, dryness_eff, out=flamm)
+
+        candidates = lane._buffer("candidates", shape)
+        p_eff = lane._buffer("p_eff", shape)
+        uniform = lane._buffer("uniform", shape)
+        hits = lane._buffer("hits", shape)
+        ignite = lane._buffer("ignite", shape)
+        ignite.fill(False)
+        combined = plan.combined_draws
+        if combined:
+            survival = lane._buffer("survival", shape)
+            survival.fill(1.0)
+        for direction, ((dx, dy), p_wind) in enumerate(zip(self._DIRS, plan.wind)):
+            src_factor = src[1 - dx:1 - dx + shape[0], 1 - dy:1 - dy + shape[1]]
+            np.greater(src_factor, 0.0, out=candidates)
+            np.logical_and(candidates, is_tree, out=candidates)
+            if not candidates.any():
+                continue
 
-        self._lightning_cooldown = int(self.cfg.lightning_cooldown_steps)
+            if plan.wind_enabled:
+                np.multiply(flamm, p_wind * dryness_eff, out=p_eff)
+                np.multiply(p_eff, src_factor, out=p_eff)
+            else:
+                np.multiply(flamm, src_factor, out=p_eff)
+            np.clip(p_eff, 0.0, 1.0, out=p_eff)
+            if combined:
+                # p_eff is zero wherever the direction has no burning source or no tree.
+                np.subtract(1.0, p_eff, out=uniform)
+                np.multiply(survival, uniform, out=survival)
+                continue
+            if plan.counter_draws:
+                # Addressed draws are only needed where ignition is possible.
+                cells = np.flatnonzero(candidates)
+                draws = self._counter_draws(direction, r0, c0, shape[1], cells)
+                ignite.ravel()[cells[draws < p_eff.ravel()[cells]]] = True
+                continue
+            lane._fill_uniform(uniform)
+            np.less(uniform, p_eff, out=hits)
+            np.logical_and(hits, candidates, out=hits)
+            np.logical_or(ignite, hits, out=ignite)
+
+        if combined:
+            exposed = np.flatnonzero(survival < 1.0)
+            if exposed.size:
+                if plan.counter_draws:
+                    draws = self._counter_draws(COMBINED_IGNITION, r0, c0, shape[1], exposed)
+                else:
+                    draws = lane.rng.random(exposed.size)
+                ignite.ravel()[exposed] = draws < 1.0 - survival.ravel()[exposed]
         return ignite
 
-    def step(self):
-        g = self.grid
-
-        b1 = (g == BURNING1)
-        b2 = (g == BURNING2)
-        b3 = (g == BURNING3)
-
-        decid = (g == TREE_DECID)
-        conif = (g == TREE_CONIF)
-        is_tree = decid | conif
-
-        barrier = (g == BARRIER)
-        burnt = (g == BURNT)
+    def _counter_draws(self, purpose: int, r0: int, c0: int, width: int, cells: np.ndarray) -> np.ndarray:
+        """Counter-based uniforms for flat ``cells`` of the ``width``-column rectangle starting at (r0, c0)."""
+        rows, cols = np.divmod(cells, width)
+        return counter_uniform(self._step_keys[purpose], (rows + r0) * self.grid.shape[1] + cols + c0)
+
+    def _combined_draws(self) -> bool:
+        return self.plan.combined_draws
+
+    def _finish_rect(
+        self,
+        r0: int,
+        r1: int,
+        c0: int,
+        c1: int,
+        rain: float,
+        ignite: np.ndarray,
+        out: np.ndarray,
+        lane: _DrawLane | None = None,
+    ) -> np.ndarray:
+        """Draw rain outcomes for the rectangle, write its next states into ``out`` and return the count changes."""
+        lane = self if lane is None else lane
+        g = self._pads[self._front][r0 + 1:r1 + 1, c0 + 1:c1 + 1]
+        shape = g.shape
+        uniform = lane._buffer("uniform", shape)
+        outcome = lane._buffer("hits", shape)
+        code = lane._buffer("code", shape)
+        bits = lane._buffer("code_bits", shape)
+
+        np.multiply(ignite.view(np.uint8), IGNITE_BIT, out=code)
+        np.bitwise_or(code, g, out=code)
+        plan = self.plan
+        if plan.counter_draws:
+            if rain > 0.0:
+                for state, scale, purpose, bit in (
+                    (BURNING1, 0.25, DAMPEN, DAMPEN_BIT),
+                    (BURNING2, 0.50, EXTINGUISH, EXTINGUISH_BIT),
+                ):
+                    outcome.fill(False)
+                    cells = np.flatnonzero(g == state)
+                    outcome.ravel()[cells] = self._counter_draws(purpose, r0, c0, shape[1], cells) < scale * rain
+                    set_transition_bit(code, outcome, bit, bits)
+        elif plan.combined_draws:
+            if rain > 0.0:
+                lane._sparse_rain_outcome(g, BURNING1, 0.25 * rain, outcome)
+                set_transition_bit(code, outcome, DAMPEN_BIT, bits)
+                lane._sparse_rain_outcome(g, BURNING2, 0.50 * rain, outcome)
+                set_transition_bit(code, outcome, EXTINGUISH_BIT, bits)
+        elif rain <= 0.0:
+            # Nothing is dampened or extinguished, but the reference stream still spends both draws.
+            lane._skip_uniform(uniform, 2)
+        else:
+            # The table ignores the dampen bit outside BURNING1 and the extinguish bit outside BURNING2.
+            lane._fill_uniform(uniform)
+            np.less(uniform, 0.25 * rain, out=outcome)
+            set_transition_bit(code, outcome, DAMPEN_BIT, bits)
+            lane._fill_uniform(uniform)
+            np.less(uniform, 0.50 * rain, out=outcome)
+            set_transition_bit(code, outcome, EXTINGUISH_BIT, bits)
 
-        humidity = float(np.clip(self.cfg.humidity, 0.0, 1.0))
-        dryness = 1.0 - humidity
+        return apply_transitions(code, g, out, outcome)[0]
 
-        t_norm = self._temp_norm()
-        temp_factor = 0.5 + t_norm
+    def _add_counts(self, delta: np.ndarray):
+        counts = self._counts
+        for state, change in enumerate(delta.tolist()):
+            counts[state] += change
 
+    def step(self):
+        """Advance one step and return ``grid``, which is a view that later steps overwrite."""
+        if self.plan.counter_draws:
+            self._step_keys = self._counter.keys(self.step_count)
+        if int(self.cfg.tile_size) != self._tile_size:
+            self._rebuild_tile_activity()
+        if self._tile_active is not None:
+            return self._step_tiled()
+        if int(self.cfg.strip_rows) > 0:
+            return self._step_strips()
+
+        h, w = self.grid.shape
         rain = self.current_rain_intensity()
-        dryness_eff = float(np.clip(dryness * temp_factor * (1.0 - rain), 0.0, 1.0))
+        dryness_eff = self._dryness_eff(rain)
 
-        flamm = np.zeros(g.shape, dtype=np.float32)
-        flamm[decid] = float(np.clip(self.cfg.flamm_decid, 0.0, 5.0))
-        flamm[conif] = float(np.clip(self.cfg.flamm_conif, 0.0, 5.0))
+        ignite = self._ignite_rect(0, h, 0, w, dryness_eff)
 
-        s1, s2, s3 = self.cfg.burn_stage_factors
-        s1 = float(np.clip(s1, 0.0, 1.0))
-        s2 = float(np.clip(s2, 0.0, 1.0))
-        s3 = float(np.clip(s3, 0.0, 1.0))
+        lightning_event_prob = self._lightning_event_prob(rain)
+        ignite.ravel()[self._lightning_event(lightning_event_prob, dryness_eff)] = True
 
-        ignite_from_neighbors = np.zeros_like(is_tree, dtype=bool)
-        for dx, dy in self._DIRS:
-            src1 = self._shift_no_wrap(b1, dx, dy)
-            src2 = self._shift_no_wrap(b2, dx, dy)
-            src3 = self._shift_no_wrap(b3, dx, dy)
+        back = self._pads[1 - self._front]
+        self._add_counts(self._finish_rect(0, h, 0, w, rain, ignite, back[1:-1, 1:-1]))
+        self._front = 1 - self._front
 
-            src_factor = src1.astype(np.float32) * s1 + src2.astype(np.float32) * s2 + src3.astype(np.float32) * s3
-            candidates = is_tree & (src_factor > 0.0)
-            if not candidates.any():
-                continue
+        self.step_count += 1
+        self.burning_cells_history.append(self._burning_cells_count())
+        if self.debug_counts:
+            self.verify_counts()
+        return self.grid
 
-            p_wind = self._spread_prob_wind(dx, dy)
-            p_eff = np.clip(p_wind * dryness_eff * flamm * src_factor, 0.0, 1.0).astype(np.float32)
-            ignite_from_neighbors |= candidates & (self.rng.random(g.shape) < p_eff)
+    def _step_strips(self):
+        """Advance horizontal strips of ``strip_rows`` rows in parallel on a thread pool.
+
+        Every strip reads its one-row halos from the padded front grid, writes only its own rows of
+        the back grid and draws from its own generator, seeded from a per-step key and the strip
+        index. The key and the lightning draws come from the engine stream on the calling thread,
+        so the trajectory does not depend on the thread count; for a given seed it differs from the
+        dense step while following the same model.
+        """
+        h, w = self.grid.shape
+        rows = int(self.cfg.strip_rows)
+        rain = self.current_rain_intensity()
+        dryness_eff = self._dryness_eff(rain)
+        lightning_event_prob = self._lightning_event_prob(rain)
+
+        step_key = int(self.rng.integers(2**63))
+        struck = self._lightning_event(lightning_event_prob, dryness_eff)
+        struck_rows, struck_cols = np.unravel_index(struck, (h, w))
+
+        n_strips = -(-h // rows)
+        if len(self._strip_lanes) != n_strips or self._strip_lanes[0].shape != (rows, w):
+            self._strip_lanes = [_StripLane((rows, w)) for _ in range(n_strips)]
+        back = self._pads[1 - self._front][1:-1, 1:-1]
+
+        def advance(strip: int) -> np.ndarray:
+            lane = self._strip_lanes[strip]
+            lane.rng = np.random.default_rng((step_key, strip))
+            r0, r1 = strip * rows, min(h, (strip + 1) * rows)
+            ignite = self._ignite_rect(r0, r1, 0, w, dryness_eff, lane)
+            in_strip = (struck_rows >= r0) & (struck_rows < r1)
+            ignite[struck_rows[in_strip] - r0, struck_cols[in_strip]] = True
+            return self._finish_rect(r0, r1, 0, w, rain, ignite, back[r0:r1], lane)
+
+        workers = int(self.cfg.threads) or os.cpu_count() or 1
+        strips = range(n_strips)
+        if workers == 1:
+            deltas = list(map(advance, strips))
+        else:
+            deltas = _map_strips(workers, advance, strips)
+        self._add_counts(np.sum(deltas, axis=0))
+        self._front = 1 - self._front
+
+        self.step_count += 1
+        self.burning_cells_history.append(self._burning_cells_count())
+        if self.debug_counts:
+            self.verify_counts()
+        return self.grid
 
-        susceptibility = np.clip(dryness_eff * flamm, 0.0, 1.0).astype(np.float32)
-        lightning_event_prob = float(np.clip(self.cfg.f * (1.0 - rain) ** 2, 0.0, 1.0))
-        ignite_lightning = self._lightning_event(is_tree, susceptibility, lightning_event_prob)
+    def _step_tiled(self):
+        """Advance only the tiles holding fire (plus a one-tile halo); other tiles keep their state.
 
-        ignite = ignite_from_neighbors | ignite_lightning
+        Random draws are made per processed rectangle, so for a given seed the trajectory
+        differs from the dense step while following the same model.
+        """
+        g = self.grid
+        rain = self.current_rain_intensity()
+        dryness_eff = self._dryness_eff(rain)
+
+        # Rectangles read the front grid and write into the back one, so halos always see
+        # the pre-step state; the updated rectangles are copied back afterwards.
+        back = self._pads[1 - self._front][1:-1, 1:-1]
+        rects = self._active_rects()
+        for r0, r1, c0, c1 in rects:
+            ignite = self._ignite_rect(r0, r1, c0, c1, dryness_eff)
+            self._add_counts(self._finish_rect(r0, r1, c0, c1, rain, ignite, back[r0:r1, c0:c1]))
+
+        lightning_event_prob = self._lightning_event_prob(rain)
+        struck = self._lightning_event(lightning_event_prob, dryness_eff)
+
+        for r0, r1, c0, c1 in rects:
+            g[r0:r1, c0:c1] = back[r0:r1, c0:c1]
+            self._refresh_tile_activity(r0, r1, c0, c1)
+        for row, col in zip(*np.unravel_index(struck, g.shape)):
+            # A struck tree may already have caught fire from a neighbour in this step.
+            if int(g[row, col]) in TREE_STATES:
+                self._set_cell(int(row), int(col), BURNING1)
+                self._mark_tile_active(int(row), int(col))
 
-        dampen_b1 = b1 & (self.rng.random(g.shape) < (0.25 * rain))
-        extinguish_b2 = b2 & (self.rng.random(g.shape) < (0.50 * rain))
+        self.step_count += 1
+        self.burning_cells_history.append(self._burning_cells_count())
+        if self.debug_counts:
+            self.verify_counts()
+        return self.grid
 
-        next_g = np.full(g.shape, EMPTY, dtype=np.uint8)
-        next_g[barrier] = BARRIER
-        next_g[burnt] = BURNT
 
-        next_g[b3] = BURNT
-        next_g[b2 & ~extinguish_b2] = BURNING3
-        next_g[extinguish_b2] = BURNT
+# Per-config model terms, shared with the batched ensemble engine.
 
-        next_g[b1 & ~dampen_b1] = BURNING2
-        next_g[dampen_b1] = BURNING3
+def skip_uniform_draws(rng: np.random.Generator, count: int) -> bool:
+    """Advance ``rng`` past ``count`` ``random()`` doubles without generating them; False if it cannot."""
+    bit_generator = rng.bit_generator
+    # Doubles use whole 64-bit outputs; a buffered 32-bit half would be dropped by advance().
+    if not isinstance(bit_generator, np.random.PCG64) or bit_generator.state["has_uint32"]:
+        return False
+    bit_generator.advance(count)
+    return True
 
-        next_g[decid & ~ignite] = TREE_DECID
-        next_g[conif & ~ignite] = TREE_CONIF
 
-        next_g[ignite] = BURNING1
+def set_transition_bit(code: np.ndarray, flag: np.ndarray, bit: int, scratch: np.ndarray):
+    """Set ``bit`` in the transition ``code`` of every cell where ``flag`` is True."""
+    np.multiply(flag.view(np.uint8), bit, out=scratch)
+    np.bitwise_or(code, scratch, out=code)
+
+
+def apply_transitions(code: np.ndarray, g: np.ndarray, out: np.ndarray, changed: np.ndarray, members: int = 1) -> np.ndarray:
+    """Write the next state of every transition ``code`` into ``out`` with a single table lookup.
+
+    ``g`` holds the current states and ``changed`` is boolean scratch of the same shape. The cells
+    are split evenly into ``members`` runs; returns the per-state count changes, one row per run.
+    """
+    np.take(TRANSITION_TABLE, code, out=out, mode="clip")
+    # Only cells that change state move the counters, and those are few outside large fires.
+    np.not_equal(out, g, out=changed)
+    cells = np.flatnonzero(changed)
+    keys = code.ravel()[cells].astype(np.intp)
+    if members > 1:
+        keys += cells // (changed.size // members) * TRANSITION_CODES
+    histogram = np.bincount(keys, minlength=members * TRANSITION_CODES)
+    return histogram.reshape(members, TRANSITION_CODES) @ _TRANSITION_COUNT_DELTA
+
+
+def initial_grid(cfg: CAConfig, rng: np.random.Generator) -> np.ndarray:
+    h, w = cfg.height, cfg.width
+    grid = np.full((h, w), EMPTY, dtype=np.uint8)
+
+    has_tree = rng.random((h, w)) < float(np.clip(cfg.init_tree_density, 0.0, 1.0))
+    conif_ratio = float(np.clip(cfg.conifer_ratio, 0.0, 1.0))
+    is_conif = has_tree & (rng.random((h, w)) < conif_ratio)
+    is_decid = has_tree & ~is_conif
+
+    grid[is_decid] = TREE_DECID
+    grid[is_conif] = TREE_CONIF
+    return grid
+
+
+def spread_prob_wind(cfg: CAConfig, dx: int, dy: int) -> float:
+    if not cfg.wind_enabled or cfg.wind_strength <= 0:
+        return 1.0
+
+    wx, wy = ForestFireCA._WIND_DIRS.get(cfg.wind_dir, (0, 1))
+    d_norm = (dx * dx + dy * dy) ** 0.5
+    w_norm = (wx * wx + wy * wy) ** 0.5
+    dot = (dx * wx + dy * wy) / (d_norm * w_norm)
+
+    # s = float(cfg.wind_strength)
+    # p = 1.0 - s * (1.0 - dot) / 2.0
+    # return float(np.clip(p, 0.0, 1.0))
+
+    s = float(np.clip(cfg.wind_strength, 0.0, 1.0))
+    downwind_factor = 1.0 + s
+    crosswind_factor = 1.0 - 0.25 * s
+    upwind_factor = 1.0 - s
+
+    if dot >= 0.0:
+        p = crosswind_factor + dot * (downwind_factor - crosswind_factor)
+    else:
+        p = crosswind_factor + (-dot) * (upwind_factor - crosswind_factor)
+
+    return float(max(p, 0.0))
+
+
+def temperature_norm(cfg: CAConfig) -> float:
+    t = float(cfg.temperature_c)
+    return float(np.clip((t - ForestFireCA._T_MIN) / (ForestFireCA._T_MAX - ForestFireCA._T_MIN), 0.0, 1.0))
+
+
+def stage_factor_table(cfg: CAConfig) -> np.ndarray:
+    table = np.zeros(8, dtype=np.float32)
+    for state, factor in zip(BURNING_STATES, cfg.burn_stage_factors):
+        table[state] = float(np.clip(factor, 0.0, 1.0))
+    return table
+
+
+def flammability_table(cfg: CAConfig) -> np.ndarray:
+    table = np.zeros(8, dtype=np.float32)
+    table[TREE_DECID] = float(np.clip(cfg.flamm_decid, 0.0, 5.0))
+    table[TREE_CONIF] = float(np.clip(cfg.flamm_conif, 0.0, 5.0))
+    return table
+
+
+@dataclass(frozen=True)
+class StepPlan:
+    """Everything a step derives from a ``CAConfig``, compiled once instead of on every step."""
+
+    stage_factors: np.ndarray
+    flammability: np.ndarray
+    # Spread multiplier per ``ForestFireCA._DIRS`` entry.
+    wind: tuple[float, ...]
+    wind_enabled: bool
+    # (1 - humidity) * (0.5 + temperature_norm), before rain.
+    dryness_base: float
+    combined_draws: bool
+    # rng_mode == "counter": draws are addressed by (step, purpose, cell), see counter_rng.
+    counter_draws: bool
+    rain_manual: float
+    # Intensity added while the rain scenario window [rain_start, rain_end) is open; 0 when disabled.
+    rain_scenario: float
+    rain_start: int
+    rain_end: int
+    lightning_enabled: bool
+    lightning_f: float
+    lightning_max_strikes: int
+    lightning_cooldown_steps: int
+
+    def rain_at(self, step: int) -> float:
+        scenario = self.rain_scenario if self.rain_start <= step < self.rain_end else 0.0
+        return float(np.clip(self.rain_manual + scenario, 0.0, 1.0))
+
+
+def compile_step_plan(cfg: CAConfig) -> StepPlan:
+    mode = str(cfg.ignition_mode)
+    if mode not in ("per_direction", "combined"):
+        raise ValueError(f"Unknown ignition_mode: {mode!r}")
+    rng_mode = str(cfg.rng_mode)
+    if rng_mode not in ("sequential", "counter"):
+        raise ValueError(f"Unknown rng_mode: {rng_mode!r}")
+    stage_factors = stage_factor_table(cfg)
+    flammability = flammability_table(cfg)
+    stage_factors.flags.writeable = False
+    flammability.flags.writeable = False
+    return StepPlan(
+        stage_factors=stage_factors,
+        flammability=flammability,
+        wind=tuple(spread_prob_wind(cfg, dx, dy) for dx, dy in ForestFireCA._DIRS),
+        wind_enabled=bool(cfg.wind_enabled) and cfg.wind_strength > 0,
+        dryness_base=(1.0 - float(np.clip(cfg.humidity, 0.0, 1.0))) * (0.5 + temperature_norm(cfg)),
+        combined_draws=mode == "combined",
+        counter_draws=rng_mode == "counter",
+        rain_manual=float(cfg.rain_intensity) if cfg.rain_enabled else 0.0,
+        rain_scenario=float(cfg.rain_scenario_intensity) if cfg.rain_scenario_enabled else 0.0,
+        rain_start=int(cfg.rain_scenario_start_step),
+        rain_end=int(cfg.rain_scenario_end_step),
+        lightning_enabled=bool(cfg.lightning_enabled),
+        lightning_f=float(cfg.f),
+        lightning_max_strikes=int(cfg.lightning_max_strikes_per_event),
+        lightning_cooldown_steps=int(cfg.lightning_cooldown_steps),
+    )
 
-        self.grid = next_g
-        self.step_count += 1
-        self.burning_cells_history.append(self._burning_cells_count())
-        return self.grid
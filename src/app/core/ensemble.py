@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from src.app.core.config import CAConfig
+from src.app.core.constants import (
+    BARRIER,
+    BURNING1,
+    BURNING2,
+    BURNING3,
+    BURNT,
+    DAMPEN_BIT,
+    EMPTY,
+    EXTINGUISH_BIT,
+    IGNITE_BIT,
+    TREE_CONIF,
+    TREE_DECID,
+)
+from src.app.core.engine import (
+    CACheckpoint,
+    ForestFireCA,
+    apply_transitions,
+    compile_step_plan,
+    initial_grid,
+    set_transition_bit,
+    skip_uniform_draws,
+)
+
+
+class ForestFireEnsemble:
+    """Independent forest fire runs of one grid shape, advanced together as a ``(runs, H, W)`` stack.
+
+    Member ``i`` follows ``ForestFireCA(cfgs[i])`` exactly: it owns a generator seeded from its
+    config and consumes it in the same order as the dense reference step, so a member's
+    trajectory is identical to the single-run engine with the same seed. Every other part of the
+    step (neighbour ignition, lightning bookkeeping, rain, transitions and counters) runs once
+    over the whole stack. Parameters may differ per member; the grid shape may not.
+
+    Members leave the stack through ``retire``; the stack is compacted so later steps only touch
+    the members still running. Rows of ``grids``, ``members`` and ``burning_counts()`` refer to
+    the running members in stack order.
+    """
+
+    _LUT_STATES = 8
+
+    def __init__(self, cfgs: Sequence[CAConfig]):
+        if not cfgs:
+            raise ValueError("ForestFireEnsemble needs at least one member config")
+        shapes = {(int(cfg.height), int(cfg.width)) for cfg in cfgs}
+        if len(shapes) != 1:
+            raise ValueError(f"Ensemble members must share one grid shape, got {sorted(shapes)}")
+        for cfg in cfgs:
+            if not self.supports(cfg):
+                raise ValueError(
+                    "ForestFireEnsemble only runs the dense per_direction step with sequential draws "
+                    f"(got ignition_mode={cfg.ignition_mode!r}, tile_size={cfg.tile_size!r}, "
+                    f"strip_rows={cfg.strip_rows!r}, rng_mode={cfg.rng_mode!r})"
+                )
+
+        self.cfgs = list(cfgs)
+        n = len(self.cfgs)
+        h, w = shapes.pop()
+        self.shape = (h, w)
+        self.step_count = 0
+
+        self._rngs = [np.random.default_rng(cfg.seed) for cfg in self.cfgs]
+        self._pads = [np.zeros((n, h + 2, w + 2), dtype=np.uint8) for _ in range(2)]
+        self._front = 0
+        for i, (cfg, rng) in enumerate(zip(self.cfgs, self._rngs)):
+            self._pads[0][i, 1:-1, 1:-1] = initial_grid(cfg, rng)
+
+        cells_padded = (h + 2) * (w + 2)
+        cells = h * w
+        self._scratch = {
+            "lut_index": np.zeros(n * cells_padded, dtype=np.intp),
+            "stage_factor": np.zeros(n * cells_padded, dtype=np.float32),
+            "flamm": np.zeros(n * cells, dtype=np.float32),
+            "p_eff": np.zeros(n * cells, dtype=np.float32),
+            "uniform": np.zeros(n * cells, dtype=np.float64),
+            "is_tree": np.zeros(n * cells, dtype=bool),
+            "candidates": np.zeros(n * cells, dtype=bool),
+            "hits": np.zeros(n * cells, dtype=bool),
+            "ignite": np.zeros(n * cells, dtype=bool),
+            "code": np.zeros(n * cells, dtype=np.uint8),
+            "code_bits": np.zeros(n * cells, dtype=np.uint8),
+        }
+        # Row offsets into the flattened per-member lookup tables.
+        self._lut_offsets = (np.arange(n, dtype=np.intp) * self._LUT_STATES)[:, None, None]
+
+        # Per-slot state and parameters; every array is reindexed together when the stack is compacted.
+        self.members = np.arange(n)
+        self._counts = np.stack(
+            [np.bincount(self._pads[0][i, 1:-1, 1:-1].ravel(), minlength=8) for i in range(n)]
+        ).astype(np.int64)
+        self._cooldown = np.zeros(n, dtype=np.int64)
+        plans = [compile_step_plan(cfg) for cfg in self.cfgs]
+        self._stage_tables = np.stack([plan.stage_factors for plan in plans])
+        self._flamm_tables = np.stack([plan.flammability for plan in plans])
+        self._wind = np.array([plan.wind for plan in plans], dtype=np.float64)
+        self._dry_base = np.array([plan.dryness_base for plan in plans], dtype=np.float64)
+        self._rain_manual = np.array([plan.rain_manual for plan in plans], dtype=np.float64)
+        self._rain_scenario = np.array([plan.rain_scenario for plan in plans], dtype=np.float64)
+        self._rain_start = np.array([plan.rain_start for plan in plans], dtype=np.int64)
+        self._rain_end = np.array([plan.rain_end for plan in plans], dtype=np.int64)
+        self._f = np.array([plan.lightning_f for plan in plans], dtype=np.float64)
+        self._lightning_enabled = np.array([plan.lightning_enabled for plan in plans], dtype=bool)
+        self._max_strikes = np.array([plan.lightning_max_strikes for plan in plans], dtype=np.int64)
+        self._cooldown_steps = np.array([plan.lightning_cooldown_steps for plan in plans], dtype=np.int64)
+
+        # Per-member results, indexed by member rather than by stack slot.
+        self.initial_tree_cells = self._counts[:, TREE_DECID] + self._counts[:, TREE_CONIF]
+        self.step_counts = np.zeros(n, dtype=np.int64)
+        self._final_grids = np.zeros((n, h, w), dtype=np.uint8)
+        self._final_counts = np.zeros((n, 8), dtype=np.int64)
+        self._history: list[np.ndarray] = [self._burning(self._counts)]
+
+    @staticmethod
+    def supports(cfg: CAConfig) -> bool:
+        """Whether ``cfg`` uses the dense reference step that the ensemble reproduces."""
+        return (
+            str(cfg.ignition_mode) == "per_direction"
+            and int(cfg.tile_size) <= 0
+            and int(cfg.strip_rows) <= 0
+            and str(cfg.rng_mode) == "sequential"
+        )
+
+    @property
+    def size(self) -> int:
+        """Number of members still in the stack."""
+        return int(self.members.size)
+
+    @property
+    def grids(self) -> np.ndarray:
+        return self._pads[self._front][:self.size, 1:-1, 1:-1]
+
+    @staticmethod
+    def _burning(counts: np.ndarray) -> np.ndarray:
+        return counts[:, BURNING1] + counts[:, BURNING2] + counts[:, BURNING3]
+
+    def burning_counts(self) -> np.ndarray:
+        return self._burning(self._counts)
+
+    def _buffer(self, name: str, shape: tuple[int, ...]) -> np.ndarray:
+        """C-contiguous view of a preallocated scratch buffer with the given shape."""
+        size = 1
+        for extent in shape:
+            size *= extent
+        return self._scratch[name][:size].reshape(shape)
+
+    def ignite_nearest_center(self) -> np.ndarray:
+        """Ignite, in every member, the tree nearest to the grid centre.
+
+        Distances are Manhattan with row-major tie-breaking, as in the single-run runner.
+        Returns a boolean per stack slot telling whether the member had a tree to ignite.
+        """
+        n = self.size
+        h, w = self.shape
+        g = self.grids
+        rows, cols = np.indices((h, w))
+        distance = (np.abs(rows - h // 2) + np.abs(cols - w // 2)).ravel()
+        no_tree = h + w
+        is_tree = np.take(ForestFireCA._TREE_TABLE, g, mode="clip").reshape(n, -1)
+        masked = np.where(is_tree, distance, no_tree)
+        cell = masked.argmin(axis=1)
+        slots = np.arange(n)
+        ignited = masked[slots, cell] < no_tree
+
+        slots = slots[ignited]
+        row, col = np.divmod(cell[ignited], w)
+        previous = g[slots, row, col]
+        self._counts[slots, previous] -= 1
+        self._counts[slots, BURNING1] += 1
+        g[slots, row, col] = BURNING1
+        return ignited
+
+    def retire(self, done: np.ndarray):
+        """Record the final state of the members flagged in ``done`` and drop them from the stack."""
+        done = np.asarray(done, dtype=bool)
+        if not done.any():
+            return
+        finished = self.members[done]
+        self._final_grids[finished] = self.grids[done]
+        self._final_counts[finished] = self._counts[done]
+        self.step_counts[finished] = self.step_count
+
+        keep = np.flatnonzero(~done)
+        k = keep.size
+        front = self._pads[self._front]
+        front[:k] = front[keep]
+        self._rngs = [self._rngs[i] for i in keep]
+        for name in (
+            "members", "_counts", "_cooldown", "_stage_tables", "_flamm_tables", "_wind", "_dry_base",
+            "_rain_manual", "_rain_scenario", "_rain_start", "_rain_end", "_f", "_lightning_enabled",
+            "_max_strikes", "_cooldown_steps",
+        ):
+            setattr(self, name, getattr(self, name)[keep])
+        self._lut_offsets = self._lut_offsets[:k]
+
+    def checkpoint(self, slot: int) -> CACheckpoint:
+        """State of the running member in ``slot``, restorable with ``ForestFireCA.from_checkpoint``."""
+        member = int(self.members[slot])
+        return CACheckpoint(
+            grid=self.grids[slot].copy(),
+            rng_state=self._rngs[slot].bit_generator.state,
+            step_count=self.step_count,
+            lightning_cooldown=int(self._cooldown[slot]),
+            initial_tree_cells=int(self.initial_tree_cells[member]),
+            burning_cells_history=[int(column[member]) for column in self._history],
+        )
+
+    def burning_history(self, member: int) -> list[int]:
+        return [int(column[member]) for column in self._history[:int(self.step_counts[member]) + 1]]
+
+    def final_grid(self, member: int) -> np.ndarray:
+        return self._final_grids[member]
+
+    @property
+    def final_grids(self) -> np.ndarray:
+        """Final ``(members, H, W)`` grids, indexed by member."""
+        return self._final_grids
+
+    def final_counts(self, member: int) -> dict[str, int]:
+        counts = self._final_counts[member]
+        return {
+            "empty": int(counts[EMPTY]),
+            "decid": int(counts[TREE_DECID]),
+            "conif": int(counts[TREE_CONIF]),
+            "burning": int(counts[BURNING1] + counts[BURNING2] + counts[BURNING3]),
+            "barrier": int(counts[BARRIER]),
+            "burnt": int(counts[BURNT]),
+        }
+
+    def _rain(self) -> np.ndarray:
+        step = self.step_count
+        in_window = (self._rain_start <= step) & (step < self._rain_end) & (self._rain_end > self._rain_start)
+        return np.clip(self._rain_manual + np.where(in_window, self._rain_scenario, 0.0), 0.0, 1.0)
+
+    def _ignite(self, dryness: np.ndarray) -> np.ndarray:
+        """Neighbour ignitions for the whole stack; each member draws only for directions it needs."""
+        n = self.size
+        h, w = self.shape
+        pad = self._pads[self._front][:n]
+        g = pad[:, 1:-1, 1:-1]
+        shape = (n, h, w)
+
+        lut_index = self._buffer("lut_index", pad.shape)
+        np.add(pad, self._lut_offsets, out=lut_index)
+        src = self._buffer("stage_factor", pad.shape)
+        np.take(self._stage_tables.ravel(), lut_index, out=src, mode="clip")
+        flamm = self._buffer("flamm", shape)
+        np.take(self._flamm_tables.ravel(), lut_index[:, 1:-1, 1:-1], out=flamm, mode="clip")
+        is_tree = self._buffer("is_tree", shape)
+        np.take(ForestFireCA._TREE_TABLE, g, out=is_tree, mode="clip")
+
+        candidates = self._buffer("candidates", shape)
+        p_eff = self._buffer("p_eff", shape)
+        uniform = self._buffer("uniform", shape)
+        hits = self._buffer("hits", shape)
+        ignite = self._buffer("ignite", shape)
+        ignite.fill(False)
+        for d, (dx, dy) in enumerate(ForestFireCA._DIRS):
+            src_factor = src[:, 1 - dx:1 - dx + h, 1 - dy:1 - dy + w]
+            np.greater(src_factor, 0.0, out=candidates)
+            np.logical_and(candidates, is_tree, out=candidates)
+            drawing = np.flatnonzero(candidates.reshape(n, -1).any(axis=1))
+            if drawing.size == 0:
+                continue
+
+            factor = (self._wind[:, d] * dryness).astype(np.float32)
+            np.multiply(flamm, factor[:, None, None], out=p_eff)
+            np.multiply(p_eff, src_factor, out=p_eff)
+            np.clip(p_eff, 0.0, 1.0, out=p_eff)
+            for slot in drawing:
+                self._rngs[slot].random(out=uniform[slot])
+            # Members without candidates keep stale draws, which the candidate mask discards.
+            np.less(uniform, p_eff, out=hits)
+            np.logical_and(hits, candidates, out=hits)
+            np.logical_or(ignite, hits, out=ignite)
+        return ignite
+
+    def _lightning(self, rain: np.ndarray, dryness: np.ndarray, ignite: np.ndarray):
+        """Cooldowns, event draws and strike selection for the stack; strikes are written into ``ignite``."""
+        cooling = self._cooldown > 0
+        self._cooldown[cooling] -= 1
+        ready = np.flatnonzero(self._lightning_enabled & ~cooling)
+        if ready.size == 0:
+            return
+
+        event_prob = np.clip(self._f[ready] * (1.0 - rain[ready]) ** 2, 0.0, 1.0)
+        fired = np.array(
+            [slot for slot, p in zip(ready, event_prob) if self._rngs[slot].random() < p], dtype=np.intp
+        )
+        if fired.size == 0:
+            return
+
+        eligible_count = self._counts[fired, TREE_DECID] + self._counts[fired, TREE_CONIF]
+        max_k = np.minimum(self._max_strikes[fired], eligible_count)
+        fired, max_k = fired[max_k > 0], max_k[max_k > 0]
+        if fired.size == 0:
+            return
+
+        n = self.size
+        eligible = self._buffer("is_tree", (n, self.shape[0] * self.shape[1]))[fired]
+        flamm = self._buffer("flamm", (n, self.shape[0] * self.shape[1]))[fired]
+        weights = np.clip(dryness[fired].astype(np.float32)[:, None] * flamm, 0.0, 1.0)
+        flat_ignite = ignite.reshape(n, -1)
+        for j, slot in enumerate(fired):
+            rng = self._rngs[slot]
+            k = int(rng.integers(1, int(max_k[j]) + 1))
+            cells = np.flatnonzero(eligible[j])
+            member_weights = weights[j, cells].astype(np.float64)
+            total = member_weights.sum()
+            if total <= 0:
+                continue
+            member_weights /= total
+            flat_ignite[slot, rng.choice(cells, size=k, replace=False, p=member_weights)] = True
+            self._cooldown[slot] = self._cooldown_steps[slot]
+
+    def step(self) -> np.ndarray:
+        n = self.size
+        if n == 0:
+            return self.grids
+        shape = (n, *self.shape)
+        rain = self._rain()
+        dryness = np.clip(self._dry_base * (1.0 - rain), 0.0, 1.0)
+
+        ignite = self._ignite(dryness)
+        self._lightning(rain, dryness, ignite)
+
+        g = self._pads[self._front][:n, 1:-1, 1:-1]
+        uniform = self._buffer("uniform", shape)
+        outcome = self._buffer("hits", shape)
+        code = self._buffer("code", shape)
+        bits = self._buffer("code_bits", shape)
+        np.multiply(ignite.view(np.uint8), IGNITE_BIT, out=code)
+        np.bitwise_or(code, g, out=code)
+        # Members without rain cannot be dampened or extinguished, so their draws are only skipped over.
+        dry = rain <= 0.0
+        for bit, scale in ((DAMPEN_BIT, 0.25), (EXTINGUISH_BIT, 0.50)):
+            for slot in range(n):
+                if not (dry[slot] and skip_uniform_draws(self._rngs[slot], uniform[slot].size)):
+                    self._rngs[slot].random(out=uniform[slot])
+            np.less(uniform, (scale * rain)[:, None, None], out=outcome)
+            set_transition_bit(code, outcome, bit, bits)
+
+        out = self._pads[1 - self._front][:n, 1:-1, 1:-1]
+        self._counts += apply_transitions(code, g, out, outcome, members=n)
+
+        self._front = 1 - self._front
+        self.step_count += 1
+        column = np.zeros(len(self.cfgs), dtype=np.int64)
+        column[self.members] = self.burning_counts()
+        self._history.append(column)
+        return self.grids
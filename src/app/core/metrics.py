@@ -69,6 +69,7 @@ def calculate_fire_metrics(
     final_counts: dict[str, int],
     *,
     burnt_mask: object | None = None,
+    spatial_metrics: dict[str, int | float] | None = None,
 ) -> dict[str, int | float]:
     final_burnt = int(final_counts.get("burnt", 0))
     metrics = {
@@ -78,7 +79,9 @@ def calculate_fire_metrics(
         "fire_duration": fire_duration(burning_cells),
         "auc": area_under_curve(burning_cells),
     }
-    if burnt_mask is not None:
+    if spatial_metrics is not None:
+        metrics.update(spatial_metrics)
+    elif burnt_mask is not None:
         from src.app.core.spatial_metrics import burned_spatial_metrics
 
         metrics.update(burned_spatial_metrics(burnt_mask))
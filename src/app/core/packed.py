@@ -0,0 +1,405 @@
+"""Bit-packed forest fire engine for very large maps.
+
+Cell states fit in three bits, so the grid is kept as three bitplanes of packed ``uint64`` words
+(bit ``k`` of every state in plane ``k``): 3/8 of a byte per cell, instead of the uint8 grid pair
+and the dozen full-size scratch arrays of the dense step. Spread candidates and state transitions
+are computed on whole words; random numbers are drawn only at the cells next to fire, which
+``rng_mode="counter"`` makes possible because every draw is addressed by its cell.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from src.app.core.config import CAConfig
+from src.app.core.constants import (
+    BARRIER,
+    BURNING1,
+    BURNING2,
+    BURNING3,
+    BURNING_STATES,
+    BURNT,
+    EMPTY,
+    TREE_CONIF,
+    TREE_DECID,
+)
+from src.app.core.counter_rng import (
+    COMBINED_IGNITION,
+    DAMPEN,
+    EXTINGUISH,
+    LIGHTNING,
+    CounterStreams,
+    counter_uniform,
+)
+from src.app.core.engine import (
+    CACheckpoint,
+    ForestFireCA,
+    StepPlan,
+    compile_step_plan,
+    skip_uniform_draws,
+)
+from src.app.core.metrics import calculate_fire_metrics
+
+_PLANES = 3
+_ONE = np.uint64(1)
+_TOP_BIT = np.uint64(63)
+# Rows converted per block between the packed and the uint8 layout, bounding the temporaries.
+_BLOCK_ROWS = 1024
+
+
+def pack_grid(grid: np.ndarray) -> np.ndarray:
+    """Bitplanes ``(3, H, ceil(W / 64))`` of a uint8 state grid; column ``c`` is bit ``c % 64`` of word ``c // 64``."""
+    grid = np.asarray(grid, dtype=np.uint8)
+    h, w = grid.shape
+    words = -(-w // 64)
+    planes = np.zeros((_PLANES, h, words), dtype=np.uint64)
+    for r0 in range(0, h, _BLOCK_ROWS):
+        _pack_rows(grid[r0:r0 + _BLOCK_ROWS], planes[:, r0:r0 + _BLOCK_ROWS])
+    return planes
+
+
+def unpack_grid(planes: np.ndarray, width: int) -> np.ndarray:
+    """The uint8 state grid of bitplanes from ``pack_grid``."""
+    _, h, _ = planes.shape
+    grid = np.zeros((h, width), dtype=np.uint8)
+    for r0 in range(0, h, _BLOCK_ROWS):
+        block = grid[r0:r0 + _BLOCK_ROWS]
+        for k in range(_PLANES):
+            words = np.ascontiguousarray(planes[k, r0:r0 + _BLOCK_ROWS], dtype="<u8")
+            bits = np.unpackbits(words.view(np.uint8), axis=1, bitorder="little")[:, :width]
+            block |= bits << k
+    return grid
+
+
+def _pack_rows(block: np.ndarray, out: np.ndarray):
+    rows, w = block.shape
+    padded = np.zeros((rows, out.shape[2] * 64), dtype=bool)
+    for k in range(_PLANES):
+        np.not_equal(block & (1 << k), 0, out=padded[:, :w])
+        out[k] = np.packbits(padded, axis=1, bitorder="little").view("<u8")
+
+
+def _cells(mask: np.ndarray, width: int) -> np.ndarray:
+    """Ascending flat cell indices (``row * width + col``) of the set bits of a packed mask."""
+    flat = mask.ravel()
+    nonzero = np.flatnonzero(flat)
+    if nonzero.size == 0:
+        return nonzero
+    bits = np.unpackbits(flat[nonzero].astype("<u8").view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    word, bit = np.nonzero(bits)
+    rows, blocks = np.divmod(nonzero[word], mask.shape[1])
+    return rows * width + blocks * 64 + bit
+
+
+def _mask(cells: np.ndarray, shape: tuple[int, int], width: int) -> np.ndarray:
+    """Packed mask with the bits of flat ``cells`` set."""
+    mask = np.zeros(shape, dtype=np.uint64)
+    rows, cols = np.divmod(cells, width)
+    np.bitwise_or.at(mask.ravel(), rows * shape[1] + cols // 64, np.left_shift(_ONE, (cols % 64).astype(np.uint64)))
+    return mask
+
+
+def _bits_at(mask: np.ndarray, cells: np.ndarray, width: int) -> np.ndarray:
+    rows, cols = np.divmod(cells, width)
+    words = mask.ravel()[rows * mask.shape[1] + cols // 64]
+    return (words >> (cols % 64).astype(np.uint64)) & _ONE != 0
+
+
+def _shift(mask: np.ndarray, dx: int, dy: int, valid: np.ndarray) -> np.ndarray:
+    """``out[r, c] = mask[r - dx, c - dy]``, zero where that cell lies outside the grid."""
+    out = np.zeros_like(mask)
+    h = mask.shape[0]
+    src = mask[max(0, -dx):h - max(0, dx)]
+    dst = out[max(0, dx):h - max(0, -dx)]
+    if dy == 0:
+        dst[...] = src
+    elif dy == 1:
+        np.left_shift(src, _ONE, out=dst)
+        dst[:, 1:] |= src[:, :-1] >> _TOP_BIT
+        # The top column may have been shifted into the padding bits of the last word.
+        dst &= valid
+    else:
+        np.right_shift(src, _ONE, out=dst)
+        dst[:, :-1] |= src[:, 1:] << _TOP_BIT
+    return out
+
+
+class PackedForestFireCA:
+    """``ForestFireCA`` on packed bitplanes, for maps whose dense step would not fit in memory.
+
+    Requires ``rng_mode="counter"``; for one config it then follows ``ForestFireCA(cfg)`` bit for
+    bit (``tile_size``, ``strip_rows`` and ``threads`` do not apply). Between steps only the planes
+    persist; a step adds packed masks and index arrays over the cells next to fire. ``grid`` unpacks
+    to the uint8 layout for the GUI, and ``checkpoint()`` / ``from_checkpoint()`` move a run between
+    this engine and ``ForestFireCA``.
+    """
+
+    def __init__(self, cfg: CAConfig):
+        self._configure(cfg)
+        self.rng = np.random.default_rng(cfg.seed)
+        self.planes = self._initial_planes()
+        self.step_count = 0
+        self._lightning_cooldown = 0
+        self.initial_tree_cells = self._counts[TREE_DECID] + self._counts[TREE_CONIF]
+        self.burning_cells_history = [self._burning_cells_count()]
+
+    def _configure(self, cfg: CAConfig):
+        self.cfg = cfg
+        self._plan_cache: tuple[CAConfig, int, StepPlan] | None = None
+        if not self.plan.counter_draws:
+            raise ValueError(f"PackedForestFireCA needs rng_mode='counter' (got rng_mode={cfg.rng_mode!r})")
+        self._counter = CounterStreams(cfg.seed)
+        self.shape = (int(cfg.height), int(cfg.width))
+        h, w = self.shape
+        words = -(-w // 64)
+        # Bits of the last word that hold real columns.
+        self._valid = np.full(words, ~np.uint64(0), dtype=np.uint64)
+        if w % 64:
+            self._valid[-1] = (_ONE << np.uint64(w % 64)) - _ONE
+        self._counts = [0] * 8
+
+    @property
+    def plan(self) -> StepPlan:
+        cached = self._plan_cache
+        if cached is None or cached[0] is not self.cfg or cached[1] != self.cfg.revision:
+            cached = (self.cfg, self.cfg.revision, compile_step_plan(self.cfg))
+            self._plan_cache = cached
+        return cached[2]
+
+    def _initial_planes(self) -> np.ndarray:
+        """``initial_grid(cfg, rng)`` built and packed a block of rows at a time, leaving ``rng`` where it would."""
+        h, w = self.shape
+        conif_rng = np.random.default_rng()
+        conif_rng.bit_generator.state = self.rng.bit_generator.state
+        # The conifer draws follow all H * W tree draws in the reference stream; a freshly seeded
+        # generator holds no buffered half, so the skip always succeeds.
+        skip_uniform_draws(conif_rng, h * w)
+
+        density = float(np.clip(self.cfg.init_tree_density, 0.0, 1.0))
+        conif_ratio = float(np.clip(self.cfg.conifer_ratio, 0.0, 1.0))
+        planes = np.zeros((_PLANES, h, -(-w // 64)), dtype=np.uint64)
+        for r0 in range(0, h, _BLOCK_ROWS):
+            rows = min(_BLOCK_ROWS, h - r0)
+            has_tree = self.rng.random((rows, w)) < density
+            is_conif = has_tree & (conif_rng.random((rows, w)) < conif_ratio)
+            # TREE_CONIF is TREE_DECID + 1.
+            block = has_tree.astype(np.uint8) + is_conif
+            _pack_rows(block, planes[:, r0:r0 + rows])
+            for state, count in enumerate(np.bincount(block.ravel(), minlength=8).tolist()):
+                self._counts[state] += count
+        self.rng.bit_generator.state = conif_rng.bit_generator.state
+        return planes
+
+    @property
+    def grid(self) -> np.ndarray:
+        """The current states in the uint8 layout of ``ForestFireCA.grid`` (a new array)."""
+        return unpack_grid(self.planes, self.shape[1])
+
+    def checkpoint(self) -> CACheckpoint:
+        return CACheckpoint(
+            grid=self.grid,
+            rng_state=self.rng.bit_generator.state,
+            step_count=self.step_count,
+            lightning_cooldown=self._lightning_cooldown,
+            initial_tree_cells=self.initial_tree_cells,
+            burning_cells_history=list(self.burning_cells_history),
+        )
+
+    @classmethod
+    def from_checkpoint(cls, cfg: CAConfig, checkpoint: CACheckpoint) -> PackedForestFireCA:
+        """Engine for ``cfg`` in the state captured by ``checkpoint`` (e.g. from ``ForestFireCA``)."""
+        ca = cls.__new__(cls)
+        ca._configure(cfg)
+        if checkpoint.grid.shape != ca.shape:
+            raise ValueError(f"Checkpoint grid {checkpoint.grid.shape} does not match config grid {ca.shape}")
+        ca.rng = np.random.default_rng(cfg.seed)
+        ca.rng.bit_generator.state = checkpoint.rng_state
+        ca.planes = pack_grid(checkpoint.grid)
+        ca._counts = np.bincount(np.asarray(checkpoint.grid, dtype=np.uint8).ravel(), minlength=8).tolist()
+        ca.step_count = int(checkpoint.step_count)
+        ca._lightning_cooldown = int(checkpoint.lightning_cooldown)
+        ca.initial_tree_cells = int(checkpoint.initial_tree_cells)
+        ca.burning_cells_history = list(checkpoint.burning_cells_history)
+        return ca
+
+    def has_active_fire(self) -> bool:
+        return self._burning_cells_count() > 0
+
+    def _burning_cells_count(self) -> int:
+        counts = self._counts
+        return counts[BURNING1] + counts[BURNING2] + counts[BURNING3]
+
+    def cell_counts(self) -> dict[str, int]:
+        counts = self._counts
+        return {
+            "empty": counts[EMPTY],
+            "decid": counts[TREE_DECID],
+            "conif": counts[TREE_CONIF],
+            "burning": self._burning_cells_count(),
+            "barrier": counts[BARRIER],
+            "burnt": counts[BURNT],
+        }
+
+    def finalize_run_metrics(self) -> dict[str, int | float]:
+        return calculate_fire_metrics(
+            burning_cells=self.burning_cells_history,
+            initial_tree_cells=self.initial_tree_cells,
+            final_counts=self.cell_counts(),
+            burnt_mask=unpack_grid(self.planes, self.shape[1]) == BURNT,
+        )
+
+    def ignite(self, row: int, col: int):
+        h, w = self.shape
+        if 0 <= row < h and 0 <= col < w:
+            cell = np.array([row * w + col])
+            decid, conif, *_ = self._state_masks()
+            for state, trees in ((TREE_DECID, decid), (TREE_CONIF, conif)):
+                if _bits_at(trees, cell, w)[0]:
+                    self._set_burning1(_mask(cell, trees.shape, w))
+                    self._counts[state] -= 1
+                    self._counts[BURNING1] += 1
+
+    def _set_burning1(self, mask: np.ndarray):
+        # BURNING1 is 0b011.
+        p0, p1, p2 = self.planes
+        p0 |= mask
+        p1 |= mask
+        p2 &= ~mask
+
+    def _state_masks(self) -> tuple[np.ndarray, ...]:
+        """Packed masks of DECID, CONIF, BURNING1, BURNING2 and BURNING3 cells."""
+        p0, p1, p2 = self.planes
+        n0, n1, n2 = ~p0, ~p1, ~p2
+        return p0 & n1 & n2, n0 & p1 & n2, p0 & p1 & n2, n0 & n1 & p2, p0 & n1 & p2
+
+    def _spread_prob(self, tree_state: int, stage: int, p_wind: float, dryness_eff: float) -> np.ndarray:
+        """One-element float32 ``p_eff`` of the dense kernel, computed with the same operations."""
+        plan = self.plan
+        p_eff = plan.flammability[tree_state:tree_state + 1].copy()
+        np.multiply(p_eff, p_wind * dryness_eff if plan.wind_enabled else dryness_eff, out=p_eff)
+        np.multiply(p_eff, plan.stage_factors[stage:stage + 1], out=p_eff)
+        np.clip(p_eff, 0.0, 1.0, out=p_eff)
+        return p_eff
+
+    def _ignitions(self, keys: np.ndarray, dryness_eff: float, masks: tuple[np.ndarray, ...]) -> np.ndarray:
+        """Flat indices of the trees that catch fire from a neighbour this step."""
+        plan = self.plan
+        w = self.shape[1]
+        decid, conif, *sources = masks
+        stages = [(stage, source) for stage, source in zip(BURNING_STATES, sources) if source.any()]
+        hits: list[np.ndarray] = []
+        exposure: list[tuple[np.ndarray, np.ndarray]] = []
+        for direction, ((dx, dy), p_wind) in enumerate(zip(ForestFireCA._DIRS, plan.wind)):
+            for stage, source in stages:
+                reach = _shift(source, dx, dy, self._valid)
+                for tree_state, trees in ((TREE_DECID, decid), (TREE_CONIF, conif)):
+                    # Every cell has one neighbour per direction, so each candidate falls in one group.
+                    cells = _cells(reach & trees, w)
+                    if cells.size == 0:
+                        continue
+                    p_eff = self._spread_prob(tree_state, stage, p_wind, dryness_eff)
+                    if plan.combined_draws:
+                        survival = np.empty(1, dtype=np.float64)
+                        np.subtract(1.0, p_eff, out=survival)
+                        exposure.append((cells, np.broadcast_to(survival, cells.shape)))
+                        continue
+                    hits.append(cells[counter_uniform(keys[direction], cells) < p_eff[0]])
+
+        if plan.combined_draws and exposure:
+            cells = np.concatenate([cells for cells, _ in exposure])
+            factors = np.concatenate([factors for _, factors in exposure])
+            # A stable sort keeps each cell's factors in direction order, as the dense kernel multiplies them.
+            order = np.argsort(cells, kind="stable")
+            cells, factors = cells[order], factors[order]
+            starts = np.flatnonzero(np.concatenate(([True], cells[1:] != cells[:-1])))
+            survival = np.multiply.reduceat(factors, starts)
+            cells = cells[starts]
+            exposed = survival < 1.0
+            cells, survival = cells[exposed], survival[exposed]
+            hits.append(cells[counter_uniform(keys[COMBINED_IGNITION], cells) < 1.0 - survival])
+        if not hits:
+            return np.empty(0, dtype=np.intp)
+        return np.unique(np.concatenate(hits))
+
+    def _lightning_event(self, rain: float, dryness_eff: float, decid: np.ndarray, conif: np.ndarray) -> np.ndarray:
+        """``ForestFireCA._lightning_event`` with the eligible trees read from the planes."""
+        no_strikes = np.empty(0, dtype=np.intp)
+        plan = self.plan
+        if not plan.lightning_enabled or self._lightning_cooldown > 0:
+            self._lightning_cooldown = max(0, self._lightning_cooldown - 1)
+            return no_strikes
+
+        rng = self._counter.generator(self.step_count, LIGHTNING)
+        event_prob = float(np.clip(plan.lightning_f * (1.0 - rain) ** 2, 0.0, 1.0))
+        if rng.random() >= event_prob:
+            return no_strikes
+
+        w = self.shape[1]
+        eligible = _cells(decid | conif, w)
+        if eligible.size == 0:
+            return no_strikes
+        max_k = min(plan.lightning_max_strikes, eligible.size)
+        if max_k <= 0:
+            return no_strikes
+        k = int(rng.integers(1, max_k + 1))
+
+        states = np.where(_bits_at(conif, eligible, w), TREE_CONIF, TREE_DECID)
+        flamm = plan.flammability[states]
+        weights = np.clip(dryness_eff * flamm, 0.0, 1.0).astype(np.float32).astype(np.float64)
+        total = weights.sum()
+        if total <= 0:
+            return no_strikes
+        weights /= total
+        chosen = rng.choice(eligible, size=k, replace=False, p=weights)
+        self._lightning_cooldown = plan.lightning_cooldown_steps
+        return chosen
+
+    def step(self):
+        plan = self.plan
+        w = self.shape[1]
+        keys = self._counter.keys(self.step_count)
+        rain = plan.rain_at(self.step_count)
+        dryness_eff = float(np.clip(plan.dryness_base * (1.0 - rain), 0.0, 1.0))
+        masks = self._state_masks()
+        decid, conif, b1, b2, b3 = masks
+
+        ignited = np.union1d(
+            self._ignitions(keys, dryness_eff, masks),
+            self._lightning_event(rain, dryness_eff, decid, conif),
+        )
+        dampened = extinguished = np.empty(0, dtype=np.intp)
+        if rain > 0.0:
+            cells = _cells(b1, w)
+            dampened = cells[counter_uniform(keys[DAMPEN], cells) < 0.25 * rain]
+            cells = _cells(b2, w)
+            extinguished = cells[counter_uniform(keys[EXTINGUISH], cells) < 0.50 * rain]
+
+        # The rules of constants.next_state: every burning cell moves on, ignited trees start burning.
+        shape = b1.shape
+        ignite = _mask(ignited, shape, w)
+        dampen = _mask(dampened, shape, w)
+        extinguish = _mask(extinguished, shape, w)
+        to_b2 = b1 & ~dampen
+        to_b3 = (b1 & dampen) | (b2 & ~extinguish)
+        to_burnt = (b2 & extinguish) | b3
+        keep = ~(ignite | b1 | b2 | b3)
+        p0, p1, p2 = self.planes
+        # BURNING1 = 0b011, BURNING2 = 0b100, BURNING3 = 0b101, BURNT = 0b111.
+        p0 &= keep
+        p0 |= ignite | to_b3 | to_burnt
+        p1 &= keep
+        p1 |= ignite | to_burnt
+        p2 &= keep
+        p2 |= to_b2 | to_b3 | to_burnt
+
+        n_ignited_conif = int(np.count_nonzero(_bits_at(conif, ignited, w)))
+        counts = self._counts
+        counts[BURNT] += counts[BURNING3] + extinguished.size
+        counts[BURNING3] = dampened.size + counts[BURNING2] - extinguished.size
+        counts[BURNING2] = counts[BURNING1] - dampened.size
+        counts[BURNING1] = ignited.size
+        counts[TREE_CONIF] -= n_ignited_conif
+        counts[TREE_DECID] -= ignited.size - n_ignited_conif
+
+        self.step_count += 1
+        self.burning_cells_history.append(self._burning_cells_count())
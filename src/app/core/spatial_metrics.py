@@ -3,82 +3,124 @@ from __future__ import annotations
 import numpy as np
 
 
-_COMPONENT_DIRS_8 = (
-    (-1, -1), (-1, 0), (-1, 1),
-    (0, -1),           (0, 1),
-    (1, -1),  (1, 0),  (1, 1),
-)
-
-
-def _burned_perimeter(mask: np.ndarray) -> int:
-    """Return perimeter using 4-neighbour exposed edges."""
-    top_edges = np.count_nonzero(mask[0, :]) + np.count_nonzero(mask[1:, :] & ~mask[:-1, :])
-    bottom_edges = np.count_nonzero(mask[-1, :]) + np.count_nonzero(mask[:-1, :] & ~mask[1:, :])
-    left_edges = np.count_nonzero(mask[:, 0]) + np.count_nonzero(mask[:, 1:] & ~mask[:, :-1])
-    right_edges = np.count_nonzero(mask[:, -1]) + np.count_nonzero(mask[:, :-1] & ~mask[:, 1:])
-    return int(top_edges + bottom_edges + left_edges + right_edges)
+def _burned_perimeter(mask: np.ndarray) -> np.ndarray:
+    """Return perimeter using 4-neighbour exposed edges, per mask over the last two axes."""
+    cells = (-2, -1)
+    top_edges = np.count_nonzero(mask[..., 0, :], axis=-1)
+    top_edges += np.count_nonzero(mask[..., 1:, :] & ~mask[..., :-1, :], axis=cells)
+    bottom_edges = np.count_nonzero(mask[..., -1, :], axis=-1)
+    bottom_edges += np.count_nonzero(mask[..., :-1, :] & ~mask[..., 1:, :], axis=cells)
+    left_edges = np.count_nonzero(mask[..., :, 0], axis=-1)
+    left_edges += np.count_nonzero(mask[..., :, 1:] & ~mask[..., :, :-1], axis=cells)
+    right_edges = np.count_nonzero(mask[..., :, -1], axis=-1)
+    right_edges += np.count_nonzero(mask[..., :, :-1] & ~mask[..., :, 1:], axis=cells)
+    return top_edges + bottom_edges + left_edges + right_edges
+
+
+def _row_runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Run-length encode a 2D mask row by row: (row, start, end) of every run, end exclusive."""
+    rows, w = mask.shape
+    padded = np.zeros((rows, w + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded.ravel())
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    # Every row is padded on both sides, so starts and ends pair up within a row.
+    row, start = np.divmod(starts, w + 2)
+    return row, start, ends - row * (w + 2)
+
+
+def _run_links(row: np.ndarray, start: np.ndarray, end: np.ndarray, stride: int) -> tuple[np.ndarray, np.ndarray]:
+    """Pairs of runs on adjacent rows that touch under 8-connectivity.
+
+    Runs are in row-major order and disjoint within a row, so the runs of row ``r - 1`` touching a
+    run ``[s, e)`` of row ``r`` form one contiguous range: ends ``>= s`` and starts ``<= e``.
+    """
+    start_key = row * stride + start
+    end_key = row * stride + end
+    above = (row - 1) * stride
+    lo = np.searchsorted(end_key, above + start, side="left")
+    hi = np.searchsorted(start_key, above + end, side="right")
+    count = np.maximum(hi - lo, 0)
+    below = np.repeat(np.arange(row.size), count)
+    offsets = np.arange(int(count.sum())) - np.repeat(np.cumsum(count) - count, count)
+    return np.repeat(lo, count) + offsets, below
+
+
+def _union_roots(n: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Root of every node after joining the pairs ``(a, b)``: hook larger roots onto smaller, then compress."""
+    parent = np.arange(n)
+    while a.size:
+        root_a = parent[a]
+        root_b = parent[b]
+        differ = root_a != root_b
+        a, b, root_a, root_b = a[differ], b[differ], root_a[differ], root_b[differ]
+        if not a.size:
+            break
+        np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+    return parent
+
+
+def _component_stats(masks: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Number of 8-connected components and size of the largest one, per mask of a (n, H, W) stack."""
+    n, h, w = masks.shape
+    # An empty separator row after every mask keeps runs of different masks from touching.
+    stacked = np.zeros((n, h + 1, w), dtype=bool)
+    stacked[:, :h] = masks
+    row, start, end = _row_runs(stacked.reshape(n * (h + 1), w))
+
+    components = np.zeros(n, dtype=np.int64)
+    largest = np.zeros(n, dtype=np.int64)
+    if row.size == 0:
+        return components, largest
+
+    above, below = _run_links(row, start, end, stride=w + 2)
+    roots = _union_roots(row.size, above, below)
+    sizes = np.bincount(roots, weights=end - start, minlength=row.size).astype(np.int64)
+    is_root = roots == np.arange(row.size)
+    member = row[is_root] // (h + 1)
+    components += np.bincount(member, minlength=n)
+    np.maximum.at(largest, member, sizes[is_root])
+    return components, largest
+
+
+def burned_spatial_metrics_stack(burnt_masks: np.ndarray) -> list[dict[str, int | float]]:
+    """``burned_spatial_metrics`` for every mask of a ``(n, H, W)`` stack, labelled in one pass."""
+    masks = np.asarray(burnt_masks, dtype=bool)
+    if masks.ndim != 3:
+        raise ValueError("burnt_masks must be a 3D array")
+
+    empty = {"burned_components": 0, "largest_cluster_share": 0.0, "shape_complexity": 0.0}
+    n, h, w = masks.shape
+    if h == 0 or w == 0:
+        return [dict(empty) for _ in range(n)]
+
+    burnt_area = np.count_nonzero(masks, axis=(1, 2))
+    components, largest = _component_stats(masks)
+    perimeter = _burned_perimeter(masks)
+
+    results: list[dict[str, int | float]] = []
+    for area, n_components, largest_component, edges in zip(burnt_area, components, largest, perimeter):
+        if area == 0:
+            results.append(dict(empty))
+            continue
+        results.append(
+            {
+                "burned_components": int(n_components),
+                "largest_cluster_share": float(int(largest_component) / int(area)),
+                "shape_complexity": float(int(edges) / int(area)),
+            }
+        )
+    return results
 
 
 def burned_spatial_metrics(burnt_mask: np.ndarray) -> dict[str, int | float]:
     mask = np.asarray(burnt_mask, dtype=bool)
     if mask.ndim != 2:
         raise ValueError("burnt_mask must be a 2D array")
-
-    burnt_area = int(np.count_nonzero(mask))
-    if burnt_area == 0:
-        return {
-            "burned_components": 0,
-            "largest_cluster_share": 0.0,
-            "shape_complexity": 0.0,
-        }
-
-    visited = np.zeros_like(mask, dtype=bool)
-    components = 0
-    largest_component = 0
-    h, w = mask.shape
-
-    # Iterate only through burnt cells to reduce Python-level loop work.
-    burnt_coords = np.argwhere(mask)
-
-    # Fixed-size stacks avoid per-node tuple allocations in Python lists.
-    stack_rows = np.empty(burnt_area, dtype=np.int32)
-    stack_cols = np.empty(burnt_area, dtype=np.int32)
-
-    for row, col in burnt_coords:
-        if visited[row, col]:
-            continue
-
-        components += 1
-        visited[row, col] = True
-        component_size = 0
-        stack_size = 1
-        stack_rows[0] = row
-        stack_cols[0] = col
-
-        while stack_size:
-            stack_size -= 1
-            cr = stack_rows[stack_size]
-            cc = stack_cols[stack_size]
-            component_size += 1
-
-            for dr, dc in _COMPONENT_DIRS_8:
-                nr = cr + dr
-                nc = cc + dc
-                if nr < 0 or nr >= h or nc < 0 or nc >= w:
-                    continue
-                if not mask[nr, nc] or visited[nr, nc]:
-                    continue
-                visited[nr, nc] = True
-                stack_rows[stack_size] = nr
-                stack_cols[stack_size] = nc
-                stack_size += 1
-
-        largest_component = max(largest_component, component_size)
-
-    perimeter = _burned_perimeter(mask)
-
-    return {
-        "burned_components": int(components),
-        "largest_cluster_share": float(largest_component / burnt_area),
-        "shape_complexity": float(perimeter / burnt_area),
-    }
+    return burned_spatial_metrics_stack(mask[None])[0]
@@ -1,25 +1,55 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from copy import deepcopy
 from dataclasses import dataclass
+import hashlib
 from itertools import combinations
+import math
 import re
-from statistics import mean
-from typing import Any
+from typing import Any, Callable, Hashable, TypeVar
+
+import numpy as np
 
 from src.app.experiments.statistics import (
     _benjamini_hochberg,
-    _bootstrap_corr_ci,
     _bootstrap_mean_ci,
-    _bootstrap_slope_ci,
+    _bootstrap_pearson_matrix_ci,
+    _certifiable_p_value,
     _clamp_01,
-    _cliffs_delta,
     _cliffs_delta_label,
-    _linear_slope,
-    _pearson_corr,
+    _cliffs_delta_sorted,
+    _exact_mean,
+    _pearson_matrix,
     _percentile,
-    _pearson_p_value,
-    _permutation_test_mean_diff,
+    _pearson_p_value_n,
+    _sequential_permutation_test,
+    _sorted_sample,
+)
+
+
+# "audit": overall and per-scenario aggregates only (no bootstrap CIs), for quick lookups such as
+# the censoring audit; "summary": adds bootstrap CIs; "full": adds pairwise tests, correlations
+# and interaction surfaces, everything the report needs.
+ANALYSIS_PROFILES = ("audit", "summary", "full")
+
+# Columns that per-scenario aggregates read; their fingerprint keys the cached scenario stats.
+_SCENARIO_STAT_VALUES = (
+    "baf",
+    "auc_normalized",
+    "peak_fire_fraction",
+    "peak_fire_size",
+    "auc",
+    "burned_components",
+    "largest_cluster_share",
+    "shape_complexity",
+    "max_spread_rate",
+    "time_to_extinguish",
 )
+_SCENARIO_STAT_FLAGS = ("critical", "truncated_by_max_steps", "no_ignition")
+
+_T = TypeVar("_T")
+_K = TypeVar("_K", bound=Hashable)
 
 
 @dataclass(frozen=True)
@@ -40,6 +70,61 @@ class AnalysisSummary:
     interaction_surfaces: list[dict[str, Any]]
 
 
+class AnalysisCache:
+    """In-memory memo of per-scenario analysis results across ``analyze_results`` calls.
+
+    Entries are keyed on a fingerprint of the rows they were computed from plus the settings that
+    affect them, so passing one cache to successive calls (e.g. censoring-audit rounds that replace
+    the runs of a few scenarios) recomputes only the scenarios whose rows changed and the pairwise
+    tests involving them. Least recently used entries are dropped beyond ``max_entries``.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = int(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        return self.get_or_compute_many({None: key}, lambda _: {None: compute()})[None]
+
+    def get_or_compute_many(
+        self,
+        keys: dict[_K, Hashable],
+        compute: Callable[[list[_K]], dict[_K, _T]],
+    ) -> dict[_K, _T]:
+        """Look up ``keys`` by name; ``compute`` gets the missing names in one call, so they can be batched."""
+        missing = [name for name, key in keys.items() if key not in self._entries]
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        computed = compute(missing) if missing else {}
+        for name in missing:
+            self._entries[keys[name]] = computed[name]
+        results: dict[_K, _T] = {}
+        for name, key in keys.items():
+            self._entries.move_to_end(key)
+            # Callers may mutate what they get back (e.g. BH columns), so never hand out the stored object.
+            results[name] = deepcopy(self._entries[key])
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return results
+
+
+def _memoized(cache: AnalysisCache | None, key: Hashable, compute: Callable[[], _T]) -> _T:
+    return compute() if cache is None else cache.get_or_compute(key, compute)
+
+
+def _memoized_many(
+    cache: AnalysisCache | None,
+    names: list[_K],
+    key: Callable[[_K], Hashable],
+    compute: Callable[[list[_K]], dict[_K, _T]],
+) -> dict[_K, _T]:
+    if cache is None:
+        return compute(names)
+    return cache.get_or_compute_many({name: key(name) for name in names}, compute)
+
+
 def _format_p_value(value: float) -> str:
     if value < 0.0001:
         return "<1e-4"
@@ -84,44 +169,134 @@ def _attach_bh_q_values(
     return enriched
 
 
-def _normalize_01(values: list[float]) -> list[float]:
-    if not values:
-        return []
-    lo = min(values)
-    hi = max(values)
-    if hi == lo:
-        return [0.0 for _ in values]
-    span = hi - lo
-    return [_clamp_01((value - lo) / span) for value in values]
+class _ResultColumns:
+    """Column-oriented view of result rows that every ``analyze_results`` stage reads from.
+
+    A value column is extracted once per key as a float64 array (``float(row.get(key, 0.0))``) and
+    a flag column as a boolean mask (``bool(row.get(key, False))``). Scenario names are encoded as
+    integer codes in first-appearance order, so per-scenario and per-family stages are index takes
+    over shared arrays instead of new lists of dicts.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        self.rows = rows
+        self._values: dict[str, np.ndarray] = {}
+        self._flags: dict[str, np.ndarray] = {}
+        codes: dict[str, int] = {}
+        self.scenario_codes = np.fromiter(
+            (codes.setdefault(str(row["scenario"]), len(codes)) for row in rows),
+            dtype=np.intp,
+            count=len(rows),
+        )
+        self.scenario_names = list(codes)
+        self.censored = self.flag("truncated_by_max_steps")
+        self.no_ignition = self.flag("no_ignition")
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def values(self, key: str) -> np.ndarray:
+        column = self._values.get(key)
+        if column is None:
+            column = np.array(
+                [float(row.get(key, 0.0)) for row in self.rows], dtype=np.float64
+            )
+            self._values[key] = column
+        return column
+
+    def flag(self, key: str) -> np.ndarray:
+        column = self._flags.get(key)
+        if column is None:
+            column = np.array(
+                [bool(row.get(key, False)) for row in self.rows], dtype=bool
+            )
+            self._flags[key] = column
+        return column
+
+    def numeric_mask(self, key: str) -> np.ndarray:
+        """Rows whose ``key`` holds a real number (bools excluded)."""
+        return np.array(
+            [
+                isinstance(value, (int, float)) and not isinstance(value, bool)
+                for value in (row.get(key) for row in self.rows)
+            ],
+            dtype=bool,
+        )
+
+    def bool_mask(self, key: str) -> np.ndarray:
+        return np.array(
+            [isinstance(row.get(key), bool) for row in self.rows], dtype=bool
+        )
+
+    def param_keys(self) -> tuple[list[str], list[str]]:
+        """Sorted ``param_*`` keys holding numbers and holding bools in at least one row."""
+        continuous: list[str] = []
+        binary: list[str] = []
+        keys = set().union(*self.rows) if self.rows else set()
+        for key in sorted(key for key in keys if key.startswith("param_")):
+            value_types = {type(row[key]) for row in self.rows if key in row}
+            if any(
+                issubclass(value_type, (int, float)) and not issubclass(value_type, bool)
+                for value_type in value_types
+            ):
+                continuous.append(key)
+            if any(issubclass(value_type, bool) for value_type in value_types):
+                binary.append(key)
+        return continuous, binary
+
+    def groups(self) -> dict[str, np.ndarray]:
+        """Row indices (in row order) of each scenario, keyed in first-appearance order."""
+        order = np.argsort(self.scenario_codes, kind="stable")
+        counts = np.bincount(self.scenario_codes, minlength=len(self.scenario_names))
+        return dict(
+            zip(self.scenario_names, np.split(order, np.cumsum(counts)[:-1]))
+        )
+
+    def fingerprint(
+        self,
+        index: np.ndarray,
+        value_keys: tuple[str, ...] | list[str],
+        flag_keys: tuple[str, ...] | list[str] = (),
+    ) -> str:
+        """Digest of the given columns over rows ``index``, for keying ``AnalysisCache`` entries."""
+        digest = hashlib.blake2b(digest_size=16)
+        for key in value_keys:
+            digest.update(key.encode("utf-8") + b"\0")
+            digest.update(self.values(key)[index].tobytes())
+        for key in flag_keys:
+            digest.update(key.encode("utf-8") + b"\1")
+            digest.update(self.flag(key)[index].tobytes())
+        return digest.hexdigest()
 
+    def matrix(self, keys: list[str]) -> np.ndarray:
+        """Value columns of ``keys`` side by side, shape (rows, len(keys))."""
+        if not keys:
+            return np.empty((len(self), 0), dtype=np.float64)
+        return np.stack([self.values(key) for key in keys], axis=-1)
 
-def _uncensored_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    return [row for row in rows if not bool(row.get("truncated_by_max_steps", False))]
 
+def _share(mask: np.ndarray) -> float:
+    return float(int(np.count_nonzero(mask)) / mask.size) if mask.size else 0.0
 
-def _ignited_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    return [row for row in rows if not bool(row.get("no_ignition", False))]
 
+def _row_means(components: np.ndarray) -> np.ndarray:
+    """Per-row mean of a small 2D block, rounded like ``statistics.mean`` of each row.
 
-def _mean_metric(rows: list[dict[str, Any]], key: str) -> float:
-    values = [float(row.get(key, 0.0)) for row in rows]
-    return float(mean(values)) if values else 0.0
+    ``math.fsum`` rounds the row sum once and dividing by the (power-of-two) column count of the
+    risk-score block is exact, so the result matches the original per-row ``mean`` bit for bit.
+    """
+    sums = np.array([math.fsum(parts) for parts in components.tolist()], dtype=np.float64)
+    return sums / components.shape[1]
 
 
 def _kaplan_meier_tte_metrics(
-    rows: list[dict[str, Any]],
+    times: np.ndarray,
+    events: np.ndarray,
     *,
     horizons: tuple[float, ...] = (200.0,),
 ) -> dict[str, Any]:
-    observations = [
-        (
-            float(row.get("time_to_extinguish", 0.0)),
-            not bool(row.get("truncated_by_max_steps", False)),
-        )
-        for row in rows
-        if not bool(row.get("no_ignition", False))
-    ]
-    if not observations:
+    """Kaplan-Meier summary of ``time_to_extinguish`` for ignited runs (``events`` = not censored)."""
+    if times.size == 0:
         return {
             "tte_survival_sample_size": 0,
             "time_to_extinguish_survival_median": 0.0,
@@ -132,29 +307,26 @@ def _kaplan_meier_tte_metrics(
             },
         }
 
-    by_time: dict[float, dict[str, int]] = {}
-    for time_value, is_event in observations:
-        bucket = by_time.setdefault(time_value, {"events": 0, "censored": 0})
-        if is_event:
-            bucket["events"] += 1
-        else:
-            bucket["censored"] += 1
+    unique_times, inverse = np.unique(times, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    event_counts = np.bincount(inverse[events], minlength=unique_times.size)
+    totals = np.bincount(inverse, minlength=unique_times.size)
 
-    n_at_risk = len(observations)
+    n_at_risk = int(times.size)
     survival = 1.0
     survival_after_event_time: dict[float, float] = {}
     median_time: float | None = None
-    for time_value in sorted(by_time.keys()):
-        events = by_time[time_value]["events"]
-        censored = by_time[time_value]["censored"]
-        if n_at_risk > 0 and events > 0:
-            survival *= max(0.0, 1.0 - float(events / n_at_risk))
+    for time_value, events_at, total_at in zip(
+        unique_times.tolist(), event_counts.tolist(), totals.tolist()
+    ):
+        if n_at_risk > 0 and events_at > 0:
+            survival *= max(0.0, 1.0 - float(events_at / n_at_risk))
             survival_after_event_time[time_value] = survival
             if median_time is None and survival <= 0.5:
                 median_time = time_value
-        n_at_risk -= events + censored
+        n_at_risk -= total_at
 
-    max_observed_time = max(time_value for time_value, _ in observations)
+    max_observed_time = float(unique_times[-1])
     survival_probabilities: dict[str, float] = {}
     event_times = sorted(survival_after_event_time.keys())
     for horizon in horizons:
@@ -166,7 +338,7 @@ def _kaplan_meier_tte_metrics(
         survival_probabilities[str(int(horizon))] = float(_clamp_01(horizon_survival))
 
     return {
-        "tte_survival_sample_size": len(observations),
+        "tte_survival_sample_size": int(times.size),
         "time_to_extinguish_survival_median": float(
             median_time if median_time is not None else max_observed_time
         ),
@@ -176,48 +348,119 @@ def _kaplan_meier_tte_metrics(
     }
 
 
-def _critical_share(rows: list[dict[str, Any]]) -> float:
-    return (
-        float(sum(bool(row.get("critical", False)) for row in rows) / len(rows))
-        if rows
-        else 0.0
+def _pairwise_test_row(
+    name_a: str,
+    name_b: str,
+    values_a: np.ndarray,
+    values_b: np.ndarray,
+    sorted_a: np.ndarray,
+    sorted_b: np.ndarray,
+    *,
+    metric_key: str,
+    n_resamples: int,
+    seed: int,
+    stop_below: float | None,
+    stop_above: float | None,
+) -> dict[str, Any]:
+    mean_a = _exact_mean(values_a)
+    mean_b = _exact_mean(values_b)
+    p_value, permutations_used = _sequential_permutation_test(
+        values_a,
+        values_b,
+        max_resamples=n_resamples,
+        seed=seed,
+        stop_below=stop_below,
+        stop_above=stop_above,
     )
+    delta = _cliffs_delta_sorted(sorted_a, sorted_b, len(values_a), len(values_b))
+    return {
+        "scenario_a": name_a,
+        "scenario_b": name_b,
+        "metric": metric_key,
+        "n_a": len(values_a),
+        "n_b": len(values_b),
+        "mean_a": mean_a,
+        "mean_b": mean_b,
+        "mean_diff": float(mean_a - mean_b),
+        "p_value": p_value,
+        "permutations_used": int(permutations_used),
+        "effect_cliffs_delta": float(delta),
+        "effect_label": _cliffs_delta_label(delta),
+    }
 
 
 def _pairwise_significance_by_metric(
-    by_scenario: dict[str, list[dict[str, Any]]],
+    columns: _ResultColumns,
     *,
     metric_key: str,
     n_resamples: int = 2000,
     seed: int = 42,
+    fdr: float = 0.05,
+    sequential: bool = True,
+    cache: AnalysisCache | None = None,
 ) -> list[dict[str, Any]]:
-    scenario_names = sorted(by_scenario.keys())
+    groups = columns.groups()
+    scenario_names = sorted(groups)
+    metric_values = columns.values(metric_key)
+    values = {name: metric_values[groups[name]] for name in scenario_names}
+    pairs = [
+        (idx, name_a, name_b)
+        for idx, (name_a, name_b) in enumerate(combinations(scenario_names, 2))
+        if values[name_a].size and values[name_b].size
+    ]
+    # Each sample is sorted at most once and shared by every pair it takes part in.
+    sorted_values: dict[str, np.ndarray] = {}
+
+    def sorted_sample(name: str) -> np.ndarray:
+        if name not in sorted_values:
+            sorted_values[name] = _sorted_sample(values[name])
+        return sorted_values[name]
+
+    fingerprints = (
+        {name: columns.fingerprint(groups[name], [metric_key]) for name in scenario_names}
+        if cache is not None
+        else {}
+    )
+    # A BH step-up threshold lies between fdr / m and fdr, so a p-value clearly outside that
+    # range cannot change any decision and its permutation loop can stop early. Stopping inside
+    # that range would report a coarse p-value and could lose a discovery, so the lower bound stays
+    # at fdr / m. Only when fdr / m is below what the full budget can certify (a reported p-value is
+    # at least 1 / (n_resamples + 1)) is it raised to that level, which no decision can depend on.
+    stop_below = (
+        max(fdr / max(1, len(pairs)), _certifiable_p_value(max(1, n_resamples))) if sequential else None
+    )
+    stop_above = fdr if sequential else None
     rows: list[dict[str, Any]] = []
-    for idx, (name_a, name_b) in enumerate(combinations(scenario_names, 2)):
-        values_a = [float(item.get(metric_key, 0.0)) for item in by_scenario[name_a]]
-        values_b = [float(item.get(metric_key, 0.0)) for item in by_scenario[name_b]]
-        if not values_a or not values_b:
-            continue
-        mean_a = float(mean(values_a))
-        mean_b = float(mean(values_b))
-        p_value = _permutation_test_mean_diff(
-            values_a, values_b, n_resamples=n_resamples, seed=seed + idx
-        )
-        delta = _cliffs_delta(values_a, values_b)
+    for idx, name_a, name_b in pairs:
         rows.append(
-            {
-                "scenario_a": name_a,
-                "scenario_b": name_b,
-                "metric": metric_key,
-                "n_a": len(values_a),
-                "n_b": len(values_b),
-                "mean_a": mean_a,
-                "mean_b": mean_b,
-                "mean_diff": float(mean_a - mean_b),
-                "p_value": p_value,
-                "effect_cliffs_delta": float(delta),
-                "effect_label": _cliffs_delta_label(delta),
-            }
+            _memoized(
+                cache,
+                (
+                    "pairwise",
+                    metric_key,
+                    name_a,
+                    name_b,
+                    fingerprints.get(name_a),
+                    fingerprints.get(name_b),
+                    n_resamples,
+                    seed + idx,
+                    stop_below,
+                    stop_above,
+                ),
+                lambda: _pairwise_test_row(
+                    name_a,
+                    name_b,
+                    values[name_a],
+                    values[name_b],
+                    sorted_sample(name_a),
+                    sorted_sample(name_b),
+                    metric_key=metric_key,
+                    n_resamples=n_resamples,
+                    seed=seed + idx,
+                    stop_below=stop_below,
+                    stop_above=stop_above,
+                ),
+            )
         )
     adjusted = _benjamini_hochberg([float(row["p_value"]) for row in rows])
     for row, p_adj in zip(rows, adjusted):
@@ -256,83 +499,62 @@ def _select_top_baf_params(
 
 
 def _build_interaction_surface(
-    rows: list[dict[str, Any]],
+    columns: _ResultColumns,
     *,
     param_x: str,
     param_y: str,
     critical_baf_threshold: float,
 ) -> dict[str, Any] | None:
-    filtered = [
-        row
-        for row in rows
-        if isinstance(row.get(param_x), (int, float))
-        and not isinstance(row.get(param_x), bool)
-        and isinstance(row.get(param_y), (int, float))
-        and not isinstance(row.get(param_y), bool)
-    ]
-    if not filtered:
+    filtered = columns.numeric_mask(param_x) & columns.numeric_mask(param_y)
+    if not filtered.any():
         return None
 
-    x_values = sorted({float(row.get(param_x, 0.0)) for row in filtered})
-    y_values = sorted({float(row.get(param_y, 0.0)) for row in filtered})
+    x = columns.values(param_x)[filtered]
+    y = columns.values(param_y)[filtered]
+    x_values = np.unique(x).tolist()
+    y_values = np.unique(y).tolist()
     if len(x_values) < 2 or len(y_values) < 2:
         return None
 
-    grouped: dict[tuple[float, float], list[dict[str, Any]]] = {}
-    for row in filtered:
-        x = float(row.get(param_x, 0.0))
-        y = float(row.get(param_y, 0.0))
-        grouped.setdefault((x, y), []).append(row)
+    # Cell code = y index * len(x_values) + x index; group baf values per cell in row order.
+    cells = np.searchsorted(y_values, y) * len(x_values) + np.searchsorted(x_values, x)
+    cell_counts = np.bincount(cells, minlength=len(x_values) * len(y_values))
+    cell_baf = np.split(
+        columns.values("baf")[filtered][np.argsort(cells, kind="stable")],
+        np.cumsum(cell_counts)[:-1],
+    )
 
     mean_baf_grid: list[list[float | None]] = []
     catastrophic_grid: list[list[float | None]] = []
     covered_cells = 0
-    for y in y_values:
+    for y_idx in range(len(y_values)):
         baf_row: list[float | None] = []
         crit_row: list[float | None] = []
-        for x in x_values:
-            cell_rows = grouped.get((x, y), [])
-            if not cell_rows:
+        for x_idx in range(len(x_values)):
+            baf_values = cell_baf[y_idx * len(x_values) + x_idx]
+            if not baf_values.size:
                 baf_row.append(None)
                 crit_row.append(None)
                 continue
             covered_cells += 1
-            baf_values = [float(item.get("baf", 0.0)) for item in cell_rows]
-            baf_mean = float(mean(baf_values)) if baf_values else 0.0
-            catastrophic_probability = (
-                float(
-                    sum(value >= critical_baf_threshold for value in baf_values)
-                    / len(baf_values)
-                )
-                if baf_values
-                else 0.0
-            )
-            baf_row.append(baf_mean)
-            crit_row.append(catastrophic_probability)
+            baf_row.append(_exact_mean(baf_values))
+            crit_row.append(_share(baf_values >= critical_baf_threshold))
         mean_baf_grid.append(baf_row)
         catastrophic_grid.append(crit_row)
 
     if covered_cells < 4:
         return None
 
-    x_lo, x_hi = x_values[0], x_values[-1]
-    y_lo, y_hi = y_values[0], y_values[-1]
-
     corners = {
-        "f00": grouped.get((x_lo, y_lo), []),
-        "f10": grouped.get((x_hi, y_lo), []),
-        "f01": grouped.get((x_lo, y_hi), []),
-        "f11": grouped.get((x_hi, y_hi), []),
+        "f00": mean_baf_grid[0][0],
+        "f10": mean_baf_grid[0][-1],
+        "f01": mean_baf_grid[-1][0],
+        "f11": mean_baf_grid[-1][-1],
     }
     interaction_score_baf = 0.0
-    if all(corners.values()):
-        corner_means = {
-            key: float(mean(float(item.get("baf", 0.0)) for item in values))
-            for key, values in corners.items()
-        }
+    if all(value is not None for value in corners.values()):
         interaction_score_baf = abs(
-            (corner_means["f11"] - corner_means["f10"])
-            - (corner_means["f01"] - corner_means["f00"])
+            (corners["f11"] - corners["f10"]) - (corners["f01"] - corners["f00"])
         )
 
     coverage = float(covered_cells / (len(x_values) * len(y_values)))
@@ -350,6 +572,102 @@ def _build_interaction_surface(
     }
 
 
+def _scenario_stats(
+    columns: _ResultColumns,
+    index: np.ndarray,
+    tte_global_norm: np.ndarray,
+    *,
+    with_ci: bool,
+    horizons: tuple[float, ...],
+) -> dict[str, Any]:
+    """Per-scenario aggregates over rows ``index``; ``tte_global_norm`` is already restricted to them."""
+    def local(key: str) -> np.ndarray:
+        return columns.values(key)[index]
+
+    local_baf = local("baf")
+    local_auc_norm = local("auc_normalized")
+    local_critical = columns.flag("critical")[index]
+    local_tte = local("time_to_extinguish")
+    local_uncensored = ~columns.censored[index]
+    local_ignited = ~columns.no_ignition[index]
+    # Per-run risk of ignited runs: mean of the clamped baf, auc/peak fractions and global TTE.
+    run_risk_scores = _row_means(
+        np.clip(
+            np.column_stack(
+                [local_baf, local_auc_norm, local("peak_fire_fraction"), tte_global_norm]
+            )[local_ignited],
+            0.0,
+            1.0,
+        )
+    )
+    run_risk_scores_uncensored = run_risk_scores[local_uncensored[local_ignited]]
+    baf_ci: dict[str, float] = {}
+    risk_ci: dict[str, float] = {}
+    if with_ci:
+        baf_ci["baf_mean_ci_low"], baf_ci["baf_mean_ci_high"] = _bootstrap_mean_ci(
+            local_baf, confidence=0.95
+        )
+        risk_ci["risk_score_mean_ci_low"], risk_ci["risk_score_mean_ci_high"] = (
+            _bootstrap_mean_ci(run_risk_scores, confidence=0.95)
+        )
+    stats: dict[str, Any] = {
+        "runs": int(index.size),
+        "baf_mean": _exact_mean(local_baf),
+        "baf_mean_all": _exact_mean(local_baf),
+        "baf_mean_uncensored": _exact_mean(local_baf[local_uncensored]),
+        **baf_ci,
+        "baf_p95": _percentile(local_baf, 0.95),
+        "baf_p75": _percentile(local_baf, 0.75),
+        "baf_p50": _percentile(local_baf, 0.50),
+        "baf_p25": _percentile(local_baf, 0.25),
+        "peak_fire_size_mean": _exact_mean(local("peak_fire_size")),
+        "auc_mean": _exact_mean(local("auc")),
+        "peak_fire_fraction_mean": _exact_mean(local("peak_fire_fraction")),
+        "auc_normalized_mean": _exact_mean(local_auc_norm),
+        "auc_normalized_mean_all": _exact_mean(local_auc_norm),
+        "auc_normalized_mean_uncensored": _exact_mean(
+            local_auc_norm[local_uncensored]
+        ),
+        "burned_components_mean": _exact_mean(local("burned_components")),
+        "burned_components_mean_uncensored": _exact_mean(
+            local("burned_components")[local_uncensored]
+        ),
+        "largest_cluster_share_mean": _exact_mean(local("largest_cluster_share")),
+        "largest_cluster_share_mean_uncensored": _exact_mean(
+            local("largest_cluster_share")[local_uncensored]
+        ),
+        "shape_complexity_mean": _exact_mean(local("shape_complexity")),
+        "shape_complexity_mean_uncensored": _exact_mean(
+            local("shape_complexity")[local_uncensored]
+        ),
+        "critical_count": int(np.count_nonzero(local_critical)),
+        "critical_mean_all": _share(local_critical),
+        "critical_mean_uncensored": _share(local_critical[local_uncensored]),
+        "critical_share": _share(local_critical),
+        "critical_share_uncensored": _share(local_critical[local_uncensored]),
+        "censored_share": _share(~local_uncensored),
+        "max_spread_rate_mean": _exact_mean(local("max_spread_rate")),
+        "time_to_extinguish_mean": _exact_mean(local_tte[local_ignited]),
+        "time_to_extinguish_mean_all": _exact_mean(local_tte),
+        "time_to_extinguish_mean_uncensored": _exact_mean(
+            local_tte[local_ignited & local_uncensored]
+        ),
+        "risk_score_mean": _exact_mean(run_risk_scores),
+        "risk_score_mean_uncensored": _exact_mean(run_risk_scores_uncensored),
+        **risk_ci,
+        "no_ignition_count": int(np.count_nonzero(~local_ignited)),
+        "no_ignition_share": _share(~local_ignited),
+    }
+    stats.update(
+        _kaplan_meier_tte_metrics(
+            local_tte[local_ignited],
+            local_uncensored[local_ignited],
+            horizons=horizons,
+        )
+    )
+    return stats
+
+
 def analyze_results(
     rows: list[dict[str, Any]],
     *,
@@ -358,258 +676,108 @@ def analyze_results(
     correlation_top_n: int = 10,
     scenario_correlation_min_runs: int = 5,
     significance_permutations: int = 2000,
+    profile: str = "full",
+    cache: AnalysisCache | None = None,
 ) -> AnalysisSummary:
+    if profile not in ANALYSIS_PROFILES:
+        raise ValueError(
+            f"Unknown analysis profile: {profile!r} (expected one of {', '.join(ANALYSIS_PROFILES)})"
+        )
     tte_survival_horizons = (200.0,)
-    working_rows = [dict(row) for row in rows]
-    ignited_rows = _ignited_rows(working_rows)
-
-    uncensored_all = _uncensored_rows(working_rows)
-    uncensored_ignited = _uncensored_rows(ignited_rows)
-    global_tte_rows = uncensored_ignited if uncensored_ignited else ignited_rows
-    global_tte_values = [
-        float(row.get("time_to_extinguish", 0.0)) for row in global_tte_rows
-    ]
-    global_tte_norm = _normalize_01(global_tte_values)
-    global_tte_norm_by_run_id = {
-        str(row.get("run_id", f"row_{idx}")): norm
-        for idx, (row, norm) in enumerate(zip(global_tte_rows, global_tte_norm))
-    }
-
-    by_scenario: dict[str, list[dict[str, Any]]] = {}
-    for row in working_rows:
-        by_scenario.setdefault(str(row["scenario"]), []).append(row)
-
-    baf_values = [float(row.get("baf", 0.0)) for row in working_rows]
-    censored_runs_count = int(
-        sum(bool(row.get("truncated_by_max_steps", False)) for row in working_rows)
-    )
-    censored_runs_share = (
-        float(censored_runs_count / len(working_rows)) if working_rows else 0.0
-    )
-    no_ignition_runs_count = int(
-        sum(bool(row.get("no_ignition", False)) for row in working_rows)
-    )
-    no_ignition_runs_share = (
-        float(no_ignition_runs_count / len(working_rows)) if working_rows else 0.0
-    )
-    tte_min = min(global_tte_values) if global_tte_values else 0.0
-    tte_max = max(global_tte_values) if global_tte_values else 0.0
+    columns = _ResultColumns(rows)
+    groups = columns.groups()
+    ignited = ~columns.no_ignition
+    uncensored = ~columns.censored
+    uncensored_ignited = ignited & uncensored
+
+    tte = columns.values("time_to_extinguish")
+    global_tte_values = tte[uncensored_ignited if uncensored_ignited.any() else ignited]
+    tte_min = float(global_tte_values.min()) if global_tte_values.size else 0.0
+    tte_max = float(global_tte_values.max()) if global_tte_values.size else 0.0
     tte_span = tte_max - tte_min
-    for row in working_rows:
-        run_id = str(row.get("run_id", ""))
-        if run_id in global_tte_norm_by_run_id:
-            row["time_to_extinguish_global_norm"] = float(
-                global_tte_norm_by_run_id[run_id]
-            )
-            continue
-        if bool(row.get("no_ignition", False)):
-            row["time_to_extinguish_global_norm"] = 0.0
-            continue
-        if tte_span == 0.0:
-            row["time_to_extinguish_global_norm"] = 0.0
-            continue
-        tte_value = float(row.get("time_to_extinguish", 0.0))
-        row["time_to_extinguish_global_norm"] = _clamp_01(
-            (tte_value - tte_min) / tte_span
-        )
+    if tte_span == 0.0:
+        tte_global_norm = np.zeros(len(columns), dtype=np.float64)
+    else:
+        tte_global_norm = np.clip((tte - tte_min) / tte_span, 0.0, 1.0)
+        tte_global_norm[columns.no_ignition] = 0.0
+
+    baf = columns.values("baf")
+    auc_norm = columns.values("auc_normalized")
+    components = columns.values("burned_components")
+    largest_cluster_share = columns.values("largest_cluster_share")
+    shape_complexity = columns.values("shape_complexity")
+    critical = columns.flag("critical")
+    censored_runs_count = int(np.count_nonzero(columns.censored))
+    no_ignition_runs_count = int(np.count_nonzero(columns.no_ignition))
     overall = {
-        "runs_total": len(working_rows),
-        "baf_mean": float(mean(baf_values)) if baf_values else 0.0,
-        "baf_mean_all": float(mean(baf_values)) if baf_values else 0.0,
-        "baf_mean_uncensored": _mean_metric(uncensored_all, "baf"),
-        "auc_normalized_mean": _mean_metric(working_rows, "auc_normalized"),
-        "auc_normalized_mean_all": _mean_metric(working_rows, "auc_normalized"),
-        "auc_normalized_mean_uncensored": _mean_metric(
-            uncensored_all, "auc_normalized"
-        ),
-        "burned_components_mean": _mean_metric(working_rows, "burned_components"),
-        "burned_components_mean_all": _mean_metric(working_rows, "burned_components"),
-        "burned_components_mean_uncensored": _mean_metric(
-            uncensored_all, "burned_components"
-        ),
-        "largest_cluster_share_mean": _mean_metric(
-            working_rows, "largest_cluster_share"
-        ),
-        "largest_cluster_share_mean_all": _mean_metric(
-            working_rows, "largest_cluster_share"
-        ),
-        "largest_cluster_share_mean_uncensored": _mean_metric(
-            uncensored_all, "largest_cluster_share"
-        ),
-        "shape_complexity_mean": _mean_metric(working_rows, "shape_complexity"),
-        "shape_complexity_mean_all": _mean_metric(working_rows, "shape_complexity"),
-        "shape_complexity_mean_uncensored": _mean_metric(
-            uncensored_all, "shape_complexity"
-        ),
-        "time_to_extinguish_mean": _mean_metric(ignited_rows, "time_to_extinguish"),
-        "time_to_extinguish_mean_all": _mean_metric(working_rows, "time_to_extinguish"),
-        "time_to_extinguish_mean_uncensored": _mean_metric(
-            uncensored_ignited, "time_to_extinguish"
-        ),
-        "critical_mean_all": _critical_share(working_rows),
-        "critical_mean_uncensored": _critical_share(uncensored_all),
-        "critical_share": _critical_share(working_rows),
-        "critical_share_uncensored": _critical_share(uncensored_all),
-        "baf_p95": _percentile(baf_values, 0.95),
-        "baf_p75": _percentile(baf_values, 0.75),
-        "baf_p50": _percentile(baf_values, 0.50),
-        "baf_p25": _percentile(baf_values, 0.25),
-        "baf_p99": _percentile(baf_values, 0.99),
-        "catastrophic_probability": (
-            float(
-                sum(v >= critical_baf_threshold for v in baf_values) / len(baf_values)
-            )
-            if baf_values
-            else 0.0
+        "runs_total": len(columns),
+        "baf_mean": _exact_mean(baf),
+        "baf_mean_all": _exact_mean(baf),
+        "baf_mean_uncensored": _exact_mean(baf[uncensored]),
+        "auc_normalized_mean": _exact_mean(auc_norm),
+        "auc_normalized_mean_all": _exact_mean(auc_norm),
+        "auc_normalized_mean_uncensored": _exact_mean(auc_norm[uncensored]),
+        "burned_components_mean": _exact_mean(components),
+        "burned_components_mean_all": _exact_mean(components),
+        "burned_components_mean_uncensored": _exact_mean(components[uncensored]),
+        "largest_cluster_share_mean": _exact_mean(largest_cluster_share),
+        "largest_cluster_share_mean_all": _exact_mean(largest_cluster_share),
+        "largest_cluster_share_mean_uncensored": _exact_mean(
+            largest_cluster_share[uncensored]
         ),
+        "shape_complexity_mean": _exact_mean(shape_complexity),
+        "shape_complexity_mean_all": _exact_mean(shape_complexity),
+        "shape_complexity_mean_uncensored": _exact_mean(shape_complexity[uncensored]),
+        "time_to_extinguish_mean": _exact_mean(tte[ignited]),
+        "time_to_extinguish_mean_all": _exact_mean(tte),
+        "time_to_extinguish_mean_uncensored": _exact_mean(tte[uncensored_ignited]),
+        "critical_mean_all": _share(critical),
+        "critical_mean_uncensored": _share(critical[uncensored]),
+        "critical_share": _share(critical),
+        "critical_share_uncensored": _share(critical[uncensored]),
+        "baf_p95": _percentile(baf, 0.95),
+        "baf_p75": _percentile(baf, 0.75),
+        "baf_p50": _percentile(baf, 0.50),
+        "baf_p25": _percentile(baf, 0.25),
+        "baf_p99": _percentile(baf, 0.99),
+        "catastrophic_probability": _share(baf >= critical_baf_threshold),
         "critical_baf_threshold": critical_baf_threshold,
         "scenario_ranking_metric": ranking_metric,
         "censored_runs_count": censored_runs_count,
-        "censored_runs_share": censored_runs_share,
+        "censored_runs_share": _share(columns.censored),
         "no_ignition_runs_count": no_ignition_runs_count,
-        "no_ignition_runs_share": no_ignition_runs_share,
+        "no_ignition_runs_share": _share(columns.no_ignition),
         "time_to_extinguish_norm_scope": (
-            "uncensored_ignited_only" if uncensored_ignited else "ignited_runs"
+            "uncensored_ignited_only" if uncensored_ignited.any() else "ignited_runs"
         ),
         "time_to_extinguish_global_min": tte_min,
         "time_to_extinguish_global_max": tte_max,
     }
     overall.update(
-        _kaplan_meier_tte_metrics(working_rows, horizons=tte_survival_horizons)
+        _kaplan_meier_tte_metrics(
+            tte[ignited], uncensored[ignited], horizons=tte_survival_horizons
+        )
     )
 
     scenario_stats: dict[str, dict[str, Any]] = {}
-    for scenario_name, items in by_scenario.items():
-        local_baf = [float(item.get("baf", 0.0)) for item in items]
-        local_peak = [float(item.get("peak_fire_size", 0.0)) for item in items]
-        local_auc = [float(item.get("auc", 0.0)) for item in items]
-        local_peak_norm = [float(item.get("peak_fire_fraction", 0.0)) for item in items]
-        local_auc_norm = [float(item.get("auc_normalized", 0.0)) for item in items]
-        local_components = [float(item.get("burned_components", 0.0)) for item in items]
-        local_largest_cluster_share = [
-            float(item.get("largest_cluster_share", 0.0)) for item in items
-        ]
-        local_shape_complexity = [
-            float(item.get("shape_complexity", 0.0)) for item in items
-        ]
-        uncensored_items = _uncensored_rows(items)
-        ignited_items = _ignited_rows(items)
-        uncensored_ignited_items = _uncensored_rows(ignited_items)
-        run_tte_global_norm = [
-            float(item.get("time_to_extinguish_global_norm", 0.0)) for item in items
-        ]
-        run_risk_scores = [
-            float(
-                mean(
-                    [
-                        _clamp_01(baf),
-                        _clamp_01(auc_norm),
-                        _clamp_01(peak_norm),
-                        _clamp_01(tte_global_norm),
-                    ]
-                )
-            )
-            for item, baf, auc_norm, peak_norm, tte_global_norm in zip(
-                items, local_baf, local_auc_norm, local_peak_norm, run_tte_global_norm
-            )
-            if not bool(item.get("no_ignition", False))
-        ]
-        run_risk_scores_uncensored = [
-            score
-            for item, score in zip(ignited_items, run_risk_scores)
-            if not bool(item.get("truncated_by_max_steps", False))
-        ]
-        baf_mean_ci_low, baf_mean_ci_high = _bootstrap_mean_ci(
-            local_baf, confidence=0.95
-        )
-        risk_mean_ci_low, risk_mean_ci_high = _bootstrap_mean_ci(
-            run_risk_scores, confidence=0.95
-        )
-        scenario_stats[scenario_name] = {
-            "runs": len(items),
-            "baf_mean": float(mean(local_baf)) if local_baf else 0.0,
-            "baf_mean_all": float(mean(local_baf)) if local_baf else 0.0,
-            "baf_mean_uncensored": _mean_metric(uncensored_items, "baf"),
-            "baf_mean_ci_low": baf_mean_ci_low,
-            "baf_mean_ci_high": baf_mean_ci_high,
-            "baf_p95": _percentile(local_baf, 0.95),
-            "baf_p75": _percentile(local_baf, 0.75),
-            "baf_p50": _percentile(local_baf, 0.50),
-            "baf_p25": _percentile(local_baf, 0.25),
-            "peak_fire_size_mean": float(mean(local_peak)) if local_peak else 0.0,
-            "auc_mean": float(mean(local_auc)) if local_auc else 0.0,
-            "peak_fire_fraction_mean": (
-                float(mean(local_peak_norm)) if local_peak_norm else 0.0
-            ),
-            "auc_normalized_mean": (
-                float(mean(local_auc_norm)) if local_auc_norm else 0.0
+    for scenario_name, index in groups.items():
+        scenario_stats[scenario_name] = _memoized(
+            cache,
+            (
+                "scenario_stats",
+                scenario_name,
+                columns.fingerprint(index, _SCENARIO_STAT_VALUES, _SCENARIO_STAT_FLAGS),
+                tte_min,
+                tte_max,
+                profile != "audit",
             ),
-            "auc_normalized_mean_all": (
-                float(mean(local_auc_norm)) if local_auc_norm else 0.0
+            lambda: _scenario_stats(
+                columns,
+                index,
+                tte_global_norm[index],
+                with_ci=profile != "audit",
+                horizons=tte_survival_horizons,
             ),
-            "auc_normalized_mean_uncensored": _mean_metric(
-                uncensored_items, "auc_normalized"
-            ),
-            "burned_components_mean": (
-                float(mean(local_components)) if local_components else 0.0
-            ),
-            "burned_components_mean_uncensored": _mean_metric(
-                uncensored_items, "burned_components"
-            ),
-            "largest_cluster_share_mean": (
-                float(mean(local_largest_cluster_share))
-                if local_largest_cluster_share
-                else 0.0
-            ),
-            "largest_cluster_share_mean_uncensored": _mean_metric(
-                uncensored_items, "largest_cluster_share"
-            ),
-            "shape_complexity_mean": (
-                float(mean(local_shape_complexity)) if local_shape_complexity else 0.0
-            ),
-            "shape_complexity_mean_uncensored": _mean_metric(
-                uncensored_items, "shape_complexity"
-            ),
-            "critical_count": int(
-                sum(bool(item.get("critical", False)) for item in items)
-            ),
-            "critical_mean_all": _critical_share(items),
-            "critical_mean_uncensored": _critical_share(uncensored_items),
-            "critical_share": _critical_share(items),
-            "critical_share_uncensored": _critical_share(uncensored_items),
-            "censored_share": float(
-                sum(bool(item.get("truncated_by_max_steps", False)) for item in items)
-                / len(items)
-            ),
-            "max_spread_rate_mean": float(
-                mean(float(item.get("max_spread_rate", 0.0)) for item in items)
-            ),
-            "time_to_extinguish_mean": _mean_metric(
-                ignited_items, "time_to_extinguish"
-            ),
-            "time_to_extinguish_mean_all": float(
-                mean(float(item.get("time_to_extinguish", 0.0)) for item in items)
-            ),
-            "time_to_extinguish_mean_uncensored": _mean_metric(
-                uncensored_ignited_items, "time_to_extinguish"
-            ),
-            "risk_score_mean": float(mean(run_risk_scores)) if run_risk_scores else 0.0,
-            "risk_score_mean_uncensored": (
-                float(mean(run_risk_scores_uncensored))
-                if run_risk_scores_uncensored
-                else 0.0
-            ),
-            "risk_score_mean_ci_low": risk_mean_ci_low,
-            "risk_score_mean_ci_high": risk_mean_ci_high,
-            "no_ignition_count": int(
-                sum(bool(item.get("no_ignition", False)) for item in items)
-            ),
-            "no_ignition_share": float(
-                sum(bool(item.get("no_ignition", False)) for item in items) / len(items)
-            ),
-        }
-        scenario_stats[scenario_name].update(
-            _kaplan_meier_tte_metrics(items, horizons=tte_survival_horizons)
         )
 
     ranking = sorted(
@@ -645,18 +813,38 @@ def analyze_results(
         reverse=True,
     )
 
+    if profile != "full":
+        return AnalysisSummary(
+            overall=overall,
+            by_scenario=scenario_stats,
+            scenario_ranking=ranking,
+            continuous_param_correlations=[],
+            continuous_param_correlations_controlled=[],
+            binary_param_effects=[],
+            correlations=[],
+            controlled_correlations=[],
+            correlations_by_scenario={},
+            correlations_by_scenario_diagnostics={},
+            correlations_by_family={},
+            correlations_by_family_diagnostics={},
+            scenario_pairwise_significance={},
+            interaction_surfaces=[],
+        )
+
     pairwise_significance = {
         "baf": _pairwise_significance_by_metric(
-            by_scenario,
+            columns,
             metric_key="baf",
             n_resamples=significance_permutations,
             seed=91,
+            cache=cache,
         ),
         "auc_normalized": _pairwise_significance_by_metric(
-            by_scenario,
+            columns,
             metric_key="auc_normalized",
             n_resamples=significance_permutations,
             seed=191,
+            cache=cache,
         ),
     }
     overall["pairwise_significance_tests"] = {
@@ -668,6 +856,9 @@ def analyze_results(
                     for item in rows_for_metric
                 )
             ),
+            "permutations_used": int(
+                sum(int(item.get("permutations_used", 0)) for item in rows_for_metric)
+            ),
         }
         for metric, rows_for_metric in pairwise_significance.items()
     }
@@ -675,24 +866,7 @@ def analyze_results(
         max(1, significance_permutations)
     )
 
-    continuous_param_keys = sorted(
-        {
-            key
-            for row in working_rows
-            for key in row
-            if key.startswith("param_")
-            and isinstance(row[key], (int, float))
-            and not isinstance(row[key], bool)
-        }
-    )
-    binary_param_keys = sorted(
-        {
-            key
-            for row in working_rows
-            for key in row
-            if key.startswith("param_") and isinstance(row[key], bool)
-        }
-    )
+    continuous_param_keys, binary_param_keys = columns.param_keys()
     metric_keys = [
         "baf",
         "peak_fire_size",
@@ -704,20 +878,19 @@ def analyze_results(
         "shape_complexity",
     ]
     continuous_param_correlations = _collect_top_correlations(
-        working_rows,
+        columns,
         continuous_param_keys,
         metric_keys,
         top_n=correlation_top_n,
     )
     continuous_param_correlations_controlled = _collect_controlled_top_correlations(
-        working_rows,
-        by_scenario,
+        columns,
         continuous_param_keys,
         metric_keys,
         top_n=correlation_top_n,
     )
     binary_param_effects = _collect_binary_param_effects(
-        working_rows,
+        columns,
         binary_param_keys,
         metric_keys,
         top_n=correlation_top_n,
@@ -726,7 +899,7 @@ def analyze_results(
     top_baf_params = _select_top_baf_params(continuous_param_correlations, top_k=2)
     if len(top_baf_params) == 2:
         surface = _build_interaction_surface(
-            working_rows,
+            columns,
             param_x=top_baf_params[0],
             param_y=top_baf_params[1],
             critical_baf_threshold=critical_baf_threshold,
@@ -746,108 +919,137 @@ def analyze_results(
             primary_surface["interaction_score_baf"]
         )
 
-    correlations_by_scenario: dict[str, list[dict[str, float | str | bool]]] = {}
+    param_matrix = columns.matrix(continuous_param_keys)
+    metric_matrix = columns.matrix(metric_keys)
     correlations_by_scenario_diagnostics: dict[str, dict[str, Any]] = {}
-    for scenario_name, scenario_rows in by_scenario.items():
-        non_constant_params = _count_non_constant_params(
-            scenario_rows, continuous_param_keys
-        )
-        constant_params = [
-            pkey for pkey in continuous_param_keys if pkey not in non_constant_params
-        ]
+    scenario_index: dict[str, np.ndarray] = {}
+    for scenario_name, index in groups.items():
+        param_varies = np.ptp(param_matrix[index], axis=0) > 0
         correlations_by_scenario_diagnostics[scenario_name] = {
-            "runs": len(scenario_rows),
+            "runs": int(index.size),
             "min_runs_required": scenario_correlation_min_runs,
-            "non_constant_param_count": len(non_constant_params),
+            "non_constant_param_count": int(np.count_nonzero(param_varies)),
             "total_param_count": len(continuous_param_keys),
-            "constant_param_keys": constant_params,
+            "constant_param_keys": [
+                pkey
+                for pkey, varies in zip(continuous_param_keys, param_varies)
+                if not varies
+            ],
         }
-        if len(scenario_rows) < scenario_correlation_min_runs:
-            continue
-        correlations_by_scenario[scenario_name] = _collect_top_correlations(
-            scenario_rows,
-            continuous_param_keys,
-            metric_keys,
-            top_n=correlation_top_n,
+        if index.size >= scenario_correlation_min_runs:
+            scenario_index[scenario_name] = index
+
+    def compute_scenario_tables(names: list[str]) -> dict[str, list[dict[str, float | str | bool]]]:
+        computed: dict[str, list[dict[str, float | str | bool]]] = {}
+        for bucket, stacked in _stack_by_size({name: scenario_index[name] for name in names}):
+            tables = _correlation_tables(
+                param_matrix[stacked],
+                metric_matrix[stacked],
+                [continuous_param_keys] * len(bucket),
+                metric_keys,
+            )
+            computed.update(zip(bucket, tables))
+        return computed
+
+    scenario_tables = _memoized_many(
+        cache,
+        list(scenario_index),
+        lambda name: (
+            "scenario_correlations",
+            name,
+            columns.fingerprint(scenario_index[name], continuous_param_keys + metric_keys),
+            tuple(continuous_param_keys),
+            tuple(metric_keys),
+        ),
+        compute_scenario_tables,
+    )
+    correlations_by_scenario = {
+        name: _sort_correlations(
+            scenario_tables[name], ranking_mode="q_then_abs_r", top_n=correlation_top_n
         )
+        for name in scenario_index
+    }
 
-    family_rows: dict[tuple[str, str], list[dict[str, Any]]] = {}
-    non_ofat_family_rows: dict[str, list[dict[str, Any]]] = {}
-    for row in working_rows:
-        scenario_name = str(row.get("scenario", ""))
+    family_index: dict[tuple[str, str], list[np.ndarray]] = {}
+    non_ofat_family_runs: dict[str, int] = {}
+    for scenario_name, index in groups.items():
         parsed = _parse_ofat_scenario_name(scenario_name)
         if parsed:
             base_name, varied_param_name, _ = parsed
-            family_rows.setdefault((base_name, varied_param_name), []).append(row)
+            family_index.setdefault((base_name, varied_param_name), []).append(index)
         else:
-            non_ofat_family_rows.setdefault(scenario_name, []).append(row)
+            non_ofat_family_runs[scenario_name] = int(index.size)
 
     family_metric_keys = ["baf", "auc_normalized", "time_to_extinguish"]
-    correlations_by_family: dict[str, list[dict[str, float | str | bool]]] = {}
     correlations_by_family_diagnostics: dict[str, dict[str, Any]] = {}
-    for (base_name, varied_param_name), items in family_rows.items():
+    family_rows: dict[str, np.ndarray] = {}
+    family_param_keys: dict[str, str] = {}
+    for (base_name, varied_param_name), indices in family_index.items():
+        index = np.sort(np.concatenate(indices))
         family_name = f"{base_name} / {varied_param_name}"
         varied_param_key = f"param_{varied_param_name}"
-        non_constant_params = _count_non_constant_params(items, [varied_param_key])
-        constant_params = [varied_param_key] if not non_constant_params else []
+        varies = bool(np.ptp(columns.values(varied_param_key)[index]) > 0)
         correlations_by_family_diagnostics[family_name] = {
-            "runs": len(items),
+            "runs": int(index.size),
             "min_runs_required": scenario_correlation_min_runs,
-            "non_constant_param_count": len(non_constant_params),
+            "non_constant_param_count": int(varies),
             "total_param_count": 1,
-            "constant_param_keys": constant_params,
+            "constant_param_keys": [] if varies else [varied_param_key],
             "ofat_base_name": base_name,
             "ofat_varied_param_name": varied_param_name,
         }
-        if len(items) < scenario_correlation_min_runs:
-            continue
-
-        family_corrs: list[dict[str, float | str | bool]] = []
-        family_test_rows: list[tuple[int, float]] = []
-        for pkey in non_constant_params:
-            px = [float(row.get(pkey, 0.0)) for row in items]
-            for mkey in family_metric_keys:
-                my = [float(row.get(mkey, 0.0)) for row in items]
-                corr = _pearson_corr(px, my)
-                slope = _linear_slope(px, my)
-                if corr is None or slope is None:
-                    continue
-                corr_ci_low, corr_ci_high = _bootstrap_corr_ci(
-                    px, my, confidence=0.95, n_resamples=1000
-                )
-                slope_ci_low, slope_ci_high = _bootstrap_slope_ci(
-                    px, my, confidence=0.95, n_resamples=1000
-                )
-                p_value = _pearson_p_value(px, my, corr)
-                row_idx = len(family_corrs)
-                family_corrs.append(
-                    {
-                        "param_key": pkey,
-                        "metric_key": mkey,
-                        "r": float(corr),
-                        "r_ci_low": float(corr_ci_low),
-                        "r_ci_high": float(corr_ci_high),
-                        "p_value": float(p_value),
-                        "slope": float(slope),
-                        "slope_ci_low": float(slope_ci_low),
-                        "slope_ci_high": float(slope_ci_high),
-                    }
-                )
-                family_test_rows.append((row_idx, p_value))
-        if family_corrs:
-            q_values = _benjamini_hochberg([item[1] for item in family_test_rows])
-            for (row_idx, _), q_value in zip(family_test_rows, q_values):
-                family_corrs[row_idx]["q_value"] = float(q_value)
-                family_corrs[row_idx]["q_le_005"] = bool(q_value <= 0.05)
+        if index.size >= scenario_correlation_min_runs:
+            family_rows[family_name] = index
+            family_param_keys[family_name] = varied_param_key
+
+    family_metric_matrix = columns.matrix(family_metric_keys)
+
+    def compute_family_tables(names: list[str]) -> dict[str, list[dict[str, float | str | bool]]]:
+        computed: dict[str, list[dict[str, float | str | bool]]] = {}
+        for bucket, stacked in _stack_by_size({name: family_rows[name] for name in names}):
+            varied_values = np.stack(
+                [
+                    columns.values(family_param_keys[name])[index]
+                    for name, index in zip(bucket, stacked)
+                ]
+            )
+            tables = _correlation_tables(
+                varied_values[..., None],
+                family_metric_matrix[stacked],
+                [[family_param_keys[name]] for name in bucket],
+                family_metric_keys,
+                slopes=True,
+            )
+            computed.update(zip(bucket, tables))
+        return computed
+
+    family_tables = _memoized_many(
+        cache,
+        list(family_rows),
+        lambda name: (
+            "family_correlations",
+            name,
+            columns.fingerprint(
+                family_rows[name], [family_param_keys[name], *family_metric_keys]
+            ),
+            family_param_keys[name],
+            tuple(family_metric_keys),
+        ),
+        compute_family_tables,
+    )
+    correlations_by_family: dict[str, list[dict[str, float | str | bool]]] = {}
+    for family_name in family_rows:
         family_corrs = _sort_correlations(
-            family_corrs, ranking_mode="q_then_abs_r", top_n=correlation_top_n
+            family_tables[family_name],
+            ranking_mode="q_then_abs_r",
+            top_n=correlation_top_n,
         )
         if family_corrs:
             correlations_by_family[family_name] = family_corrs
 
-    for scenario_name, items in non_ofat_family_rows.items():
+    for scenario_name, runs in non_ofat_family_runs.items():
         correlations_by_family_diagnostics[scenario_name] = {
-            "runs": len(items),
+            "runs": runs,
             "min_runs_required": scenario_correlation_min_runs,
             "non_constant_param_count": 0,
             "total_param_count": 0,
@@ -873,111 +1075,135 @@ def analyze_results(
     )
 
 
+def _stack_by_size(
+    index_by_group: dict[str, np.ndarray],
+) -> list[tuple[list[str], np.ndarray]]:
+    """Bucket groups by run count; each bucket carries its names and a (groups, runs) row index."""
+    buckets: dict[int, list[str]] = {}
+    for name, index in index_by_group.items():
+        buckets.setdefault(int(index.size), []).append(name)
+    return [
+        (names, np.stack([index_by_group[name] for name in names]))
+        for names in buckets.values()
+    ]
+
+
+def _correlation_tables(
+    params: np.ndarray,
+    metrics: np.ndarray,
+    param_keys: list[list[str]],
+    metric_keys: list[str],
+    *,
+    slopes: bool = False,
+) -> list[list[dict[str, float | str | bool]]]:
+    """Correlation rows with BH q-values for each group of ``params`` (g, n, p) and ``metrics`` (g, n, m).
+
+    ``param_keys[g]`` names the p columns of group g. Rows are param-major and pairs with a constant
+    column are skipped. The r matrix, p-values and bootstrap CIs (sharing one resample index
+    matrix) are computed for all groups and pairs at once.
+    """
+    corr, slope = _pearson_matrix(params, metrics)
+    # Only columns that take part in at least one defined r are worth resampling.
+    defined = ~np.isnan(corr)
+    param_used = defined.any(axis=(0, 2))
+    metric_used = defined.any(axis=(0, 1))
+    corr_low = np.zeros_like(corr)
+    corr_high = np.zeros_like(corr)
+    slope_low = np.zeros_like(slope)
+    slope_high = np.zeros_like(slope)
+    if defined.any():
+        used = np.ix_(np.arange(corr.shape[0]), param_used, metric_used)
+        (
+            (corr_low[used], corr_high[used]),
+            (slope_low[used], slope_high[used]),
+        ) = _bootstrap_pearson_matrix_ci(
+            params[..., param_used],
+            metrics[..., metric_used],
+            confidence=0.95,
+            n_resamples=1000,
+        )
+    runs = params.shape[-2]
+    tables: list[list[dict[str, float | str | bool]]] = []
+    for group, group_param_keys in enumerate(param_keys):
+        rows: list[dict[str, float | str | bool]] = []
+        for i, pkey in enumerate(group_param_keys):
+            for j, mkey in enumerate(metric_keys):
+                r = float(corr[group, i, j])
+                if math.isnan(r) or (slopes and math.isnan(slope[group, i, j])):
+                    continue
+                row: dict[str, float | str | bool] = {
+                    "param_key": pkey,
+                    "metric_key": mkey,
+                    "r": r,
+                    "r_ci_low": float(corr_low[group, i, j]),
+                    "r_ci_high": float(corr_high[group, i, j]),
+                    "p_value": float(_pearson_p_value_n(runs, r)),
+                }
+                if slopes:
+                    row["slope"] = float(slope[group, i, j])
+                    row["slope_ci_low"] = float(slope_low[group, i, j])
+                    row["slope_ci_high"] = float(slope_high[group, i, j])
+                rows.append(row)
+        tables.append(_attach_bh_q_values(rows))
+    return tables
+
+
 def _collect_top_correlations(
-    rows: list[dict[str, Any]],
+    columns: _ResultColumns,
     numeric_param_keys: list[str],
     metric_keys: list[str],
     *,
     top_n: int,
 ) -> list[dict[str, float | str | bool]]:
-    correlations: list[dict[str, float | str | bool]] = []
-    for pkey in numeric_param_keys:
-        px = [float(row.get(pkey, 0.0)) for row in rows]
-        if not px:
-            continue
-        for mkey in metric_keys:
-            my = [float(row.get(mkey, 0.0)) for row in rows]
-            corr = _pearson_corr(px, my)
-            if corr is None:
-                continue
-            ci_low, ci_high = _bootstrap_corr_ci(
-                px, my, confidence=0.95, n_resamples=1000
-            )
-            p_value = _pearson_p_value(px, my, corr)
-            correlations.append(
-                {
-                    "param_key": pkey,
-                    "metric_key": mkey,
-                    "r": float(corr),
-                    "r_ci_low": float(ci_low),
-                    "r_ci_high": float(ci_high),
-                    "p_value": float(p_value),
-                }
-            )
-    correlations = _attach_bh_q_values(correlations)
+    if not len(columns):
+        return []
+    correlations = _correlation_tables(
+        columns.matrix(numeric_param_keys)[None],
+        columns.matrix(metric_keys)[None],
+        [numeric_param_keys],
+        metric_keys,
+    )[0]
     return _sort_correlations(correlations, ranking_mode="q_then_abs_r", top_n=top_n)
 
 
-def _count_non_constant_params(
-    rows: list[dict[str, Any]], numeric_param_keys: list[str]
-) -> list[str]:
-    non_constant: list[str] = []
-    for pkey in numeric_param_keys:
-        values = [float(row.get(pkey, 0.0)) for row in rows]
-        if not values:
-            continue
-        vmin = min(values)
-        vmax = max(values)
-        if vmax > vmin:
-            non_constant.append(pkey)
-    return non_constant
+def _demean_by_group(values: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Subtract each group's column means from ``values`` (rows, k); ``codes`` must cover 0..groups-1.
+
+    Means are clipped into the group's [min, max], so a column that is constant within a group
+    becomes exactly zero there instead of rounding noise.
+    """
+    counts = np.bincount(codes)
+    order = np.argsort(codes, kind="stable")
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    grouped = values[order]
+    means = np.clip(
+        np.add.reduceat(grouped, starts, axis=0) / counts[:, None],
+        np.minimum.reduceat(grouped, starts, axis=0),
+        np.maximum.reduceat(grouped, starts, axis=0),
+    )
+    return values - means[codes]
 
 
 def _collect_controlled_top_correlations(
-    rows: list[dict[str, Any]],
-    by_scenario: dict[str, list[dict[str, Any]]],
+    columns: _ResultColumns,
     numeric_param_keys: list[str],
     metric_keys: list[str],
     *,
     top_n: int,
 ) -> list[dict[str, float | str | bool]]:
-    scenario_means: dict[str, dict[str, float]] = {}
-    keys_for_demean = numeric_param_keys + metric_keys
-    for scenario_name, scenario_rows in by_scenario.items():
-        scenario_means[scenario_name] = {}
-        for key in keys_for_demean:
-            values = [float(row.get(key, 0.0)) for row in scenario_rows]
-            scenario_means[scenario_name][key] = float(mean(values)) if values else 0.0
-
-    correlations: list[dict[str, float | str | bool]] = []
-    for pkey in numeric_param_keys:
-        px = [
-            float(row.get(pkey, 0.0)) - scenario_means[str(row["scenario"])][pkey]
-            for row in rows
-            if str(row["scenario"]) in scenario_means
-        ]
-        if not px:
-            continue
-        for mkey in metric_keys:
-            my = [
-                float(row.get(mkey, 0.0)) - scenario_means[str(row["scenario"])][mkey]
-                for row in rows
-                if str(row["scenario"]) in scenario_means
-            ]
-            corr = _pearson_corr(px, my)
-            if corr is None:
-                continue
-            ci_low, ci_high = _bootstrap_corr_ci(
-                px, my, confidence=0.95, n_resamples=1000
-            )
-            p_value = _pearson_p_value(px, my, corr)
-            correlations.append(
-                {
-                    "param_key": pkey,
-                    "metric_key": mkey,
-                    "r": float(corr),
-                    "r_ci_low": float(ci_low),
-                    "r_ci_high": float(ci_high),
-                    "p_value": float(p_value),
-                }
-            )
-
-    correlations = _attach_bh_q_values(correlations)
+    if not len(columns):
+        return []
+    correlations = _correlation_tables(
+        _demean_by_group(columns.matrix(numeric_param_keys), columns.scenario_codes)[None],
+        _demean_by_group(columns.matrix(metric_keys), columns.scenario_codes)[None],
+        [numeric_param_keys],
+        metric_keys,
+    )[0]
     return _sort_correlations(correlations, ranking_mode="q_then_abs_r", top_n=top_n)
 
 
 def _collect_binary_param_effects(
-    rows: list[dict[str, Any]],
+    columns: _ResultColumns,
     binary_param_keys: list[str],
     metric_keys: list[str],
     *,
@@ -985,26 +1211,35 @@ def _collect_binary_param_effects(
 ) -> list[tuple[str, str, float, float, float, float]]:
     effects: list[tuple[str, str, float, float, float, float]] = []
     for pkey in binary_param_keys:
-        bool_rows = [row for row in rows if isinstance(row.get(pkey), bool)]
-        if not bool_rows:
+        is_bool = columns.bool_mask(pkey)
+        if not is_bool.any():
             continue
-        px = [1.0 if bool(row.get(pkey, False)) else 0.0 for row in bool_rows]
-        if len(set(px)) < 2:
+        is_true = columns.flag(pkey)[is_bool]
+        if is_true.all() or not is_true.any():
             continue
-        for mkey in metric_keys:
-            my = [float(row.get(mkey, 0.0)) for row in bool_rows]
-            true_values = [y for x, y in zip(px, my) if x == 1.0]
-            false_values = [y for x, y in zip(px, my) if x == 0.0]
-            if not true_values or not false_values:
-                continue
-            mean_diff = float(mean(true_values) - mean(false_values))
-            point_biserial = _pearson_corr(px, my)
-            if point_biserial is None:
+        px = is_true.astype(np.float64)[:, None]
+        metric_values = columns.matrix(metric_keys)[is_bool]
+        point_biserial, _ = _pearson_matrix(px, metric_values)
+        (ci_low, ci_high), _ = _bootstrap_pearson_matrix_ci(
+            px, metric_values, confidence=0.95, n_resamples=1000
+        )
+        for j, mkey in enumerate(metric_keys):
+            if math.isnan(point_biserial[0, j]):
                 continue
-            ci_low, ci_high = _bootstrap_corr_ci(
-                px, my, confidence=0.95, n_resamples=1000
+            values = metric_values[:, j]
+            mean_diff = float(
+                _exact_mean(values[is_true]) - _exact_mean(values[~is_true])
+            )
+            effects.append(
+                (
+                    pkey,
+                    mkey,
+                    mean_diff,
+                    float(point_biserial[0, j]),
+                    float(ci_low[0, j]),
+                    float(ci_high[0, j]),
+                )
             )
-            effects.append((pkey, mkey, mean_diff, point_biserial, ci_low, ci_high))
 
     effects.sort(key=lambda item: abs(item[3]), reverse=True)
     return effects[:top_n]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from dataclasses import fields
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from src.app.core.config import CAConfig
+
+
+# Bump whenever the simulation model or the metrics change, so stale entries stop matching.
+ENGINE_VERSION = "ca-1"
+
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Config fields that only control how a run is executed, not its trajectory or metrics.
+_EXECUTION_ONLY_FIELDS = frozenset({"threads"})
+
+
+def _canonical_config(cfg: CAConfig) -> dict[str, Any]:
+    """Config values normalised so equal simulations hash equally (e.g. ``0`` vs ``0.0`` from YAML).
+
+    Execution-only fields such as ``threads`` are left out.
+    """
+    defaults = CAConfig()
+    canonical: dict[str, Any] = {}
+    for item in fields(CAConfig):
+        if item.name in _EXECUTION_ONLY_FIELDS:
+            continue
+        value = getattr(cfg, item.name)
+        default = getattr(defaults, item.name)
+        if isinstance(default, float) and isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+        elif isinstance(value, (tuple, list)):
+            value = [float(v) for v in value]
+        canonical[item.name] = value
+    return canonical
+
+
+class RunCache:
+    """On-disk cache of per-run metrics, one JSON file per content hash.
+
+    Entries are keyed on the canonical config (including the seed, but not ``threads``),
+    ``max_steps``, ``critical_baf_threshold`` and ``ENGINE_VERSION``. A hit refreshes the
+    entry's modification time; once the directory exceeds ``max_bytes`` the least recently
+    used entries are removed.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(cfg: CAConfig, max_steps: int, critical_baf_threshold: float) -> str:
+        payload = {
+            "engine_version": ENGINE_VERSION,
+            "config": _canonical_config(cfg),
+            "max_steps": int(max_steps),
+            "critical_baf_threshold": float(critical_baf_threshold),
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            metrics = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return metrics
+
+    def put(self, key: str, metrics: dict[str, Any]):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(metrics, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
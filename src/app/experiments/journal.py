@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+from src.app.core.config import CAConfig
+from src.app.experiments.cache import ENGINE_VERSION, RunCache
+from src.app.experiments.runner import ExperimentResult
+from src.app.experiments.scenarios import ScenarioDefinition
+
+
+def batch_fingerprint(
+    *,
+    defaults: dict[str, Any],
+    scenarios: list[ScenarioDefinition],
+    base_seed: int,
+    max_steps: int,
+    critical_baf_threshold: float,
+    common_random_numbers: bool = False,
+) -> dict[str, Any]:
+    """Everything a journaled run depends on besides its run id, for ``ResultJournal(fingerprint=...)``.
+
+    Each scenario contributes the canonical hash of its merged config (see ``RunCache.key``).
+    """
+    return {
+        "engine_version": ENGINE_VERSION,
+        "base_seed": int(base_seed),
+        "max_steps": int(max_steps),
+        "critical_baf_threshold": float(critical_baf_threshold),
+        "common_random_numbers": bool(common_random_numbers),
+        "configs": {
+            scenario.name: RunCache.key(
+                CAConfig(**{**defaults, **scenario.params, "seed": None}), max_steps, critical_baf_threshold
+            )
+            for scenario in scenarios
+        },
+    }
+
+
+class ResultJournal:
+    """Append-only JSON-lines log of finished runs, flushed to disk every ``flush_every`` results.
+
+    Each line holds one run (id, scenario, seed, params, metrics), so a crashed batch keeps every
+    flushed run and ``--resume`` can skip them. A partially written last line is ignored on read.
+
+    With a ``fingerprint`` (see ``batch_fingerprint``) the journal records the batch it belongs to,
+    and resuming raises ``ValueError`` if an earlier fingerprint disagrees: seed, step budget,
+    threshold and engine version must match, and so must the config of every scenario both batches
+    contain (scenarios may be added).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        resume: bool = False,
+        flush_every: int = 64,
+        fingerprint: dict[str, Any] | None = None,
+    ):
+        self.path = Path(path)
+        self.flush_every = max(1, int(flush_every))
+        self._pending: list[str] = []
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self.path.exists():
+            self._drop_partial_line()
+            if fingerprint is not None:
+                self._check_fingerprint(fingerprint)
+        else:
+            self.path.write_text("", encoding="utf-8")
+        if fingerprint is not None:
+            self._pending.append(json.dumps({"fingerprint": fingerprint}, sort_keys=True))
+            self.flush()
+
+    def _check_fingerprint(self, fingerprint: dict[str, Any]):
+        # Compare in JSON form, as the recorded fingerprints were stored.
+        current = json.loads(json.dumps(fingerprint))
+        has_runs = has_fingerprint = False
+        # Every resume appends its own fingerprint, so all of them are checked.
+        for _, record in self._records():
+            if "run_id" in record:
+                has_runs = True
+                continue
+            recorded = record.get("fingerprint")
+            if not isinstance(recorded, dict):
+                continue
+            has_fingerprint = True
+            mismatched = sorted(
+                key
+                for key in set(recorded) | set(current)
+                if key != "configs" and recorded.get(key) != current.get(key)
+            )
+            configs, recorded_configs = current.get("configs", {}), recorded.get("configs", {})
+            mismatched += sorted(
+                f"configs.{name}" for name in set(configs) & set(recorded_configs)
+                if configs[name] != recorded_configs[name]
+            )
+            if mismatched:
+                raise ValueError(f"{self.path} was written by a different batch (mismatched: {', '.join(mismatched)})")
+        if has_runs and not has_fingerprint:
+            raise ValueError(f"{self.path} records no batch fingerprint, so its runs cannot be matched to this batch")
+
+    def _drop_partial_line(self):
+        with self.path.open("rb+") as fp:
+            data = fp.read()
+            end = data.rfind(b"\n") + 1
+            if end != len(data):
+                fp.truncate(end)
+
+    def append(self, result: ExperimentResult):
+        record = {
+            "run_id": result.run_id,
+            "scenario": result.scenario,
+            "seed": result.seed,
+            "params": result.params,
+            "metrics": result.metrics,
+        }
+        self._pending.append(json.dumps(record, sort_keys=True))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        with self.path.open("a", encoding="utf-8") as fp:
+            fp.write("\n".join(self._pending) + "\n")
+            fp.flush()
+            os.fsync(fp.fileno())
+        self._pending.clear()
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self) -> ResultJournal:
+        return self
+
+    def __exit__(self, *exc_info: object):
+        self.close()
+
+    def read(self) -> Iterator[ExperimentResult]:
+        """Yield journaled runs in file order; later records for a run id replace earlier ones."""
+        self.flush()
+        latest: dict[str, int] = {}
+        for line_no, record in self._runs():
+            latest[str(record["run_id"])] = line_no
+        for line_no, record in self._runs():
+            if latest[str(record["run_id"])] == line_no:
+                yield ExperimentResult(
+                    run_id=str(record["run_id"]),
+                    scenario=str(record["scenario"]),
+                    seed=int(record["seed"]),
+                    params=dict(record["params"]),
+                    metrics=dict(record["metrics"]),
+                )
+
+    def run_ids(self) -> set[str]:
+        self.flush()
+        return {str(record["run_id"]) for _, record in self._runs()}
+
+    def _runs(self) -> Iterator[tuple[int, dict]]:
+        return ((line_no, record) for line_no, record in self._records() if "run_id" in record)
+
+    def _records(self) -> Iterator[tuple[int, dict]]:
+        with self.path.open("r", encoding="utf-8") as fp:
+            for line_no, line in enumerate(fp):
+                try:
+                    yield line_no, json.loads(line)
+                except ValueError:
+                    continue
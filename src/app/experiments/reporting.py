@@ -239,6 +239,8 @@ def generate_report(
             md_lines.append(
                 f"- Re-run scenarios: {', '.join(round_info.get('rerun_scenarios', [])) or 'none'}"
             )
+            if "resumed_runs" in round_info:
+                md_lines.append(f"- Resumed censored runs: {int(round_info['resumed_runs'])}")
             for scenario_delta in round_info.get("scenario_deltas", []):
                 md_lines.append(
                     "- "
@@ -330,7 +332,8 @@ def generate_report(
     md_lines.append("## Scenario pairwise significance tests")
     md_lines.append(
         f"- Method: two-sided permutation test on mean differences "
-        f"({summary.overall.get('pairwise_significance_permutations', 0)} resamples), "
+        f"(up to {summary.overall.get('pairwise_significance_permutations', 0)} resamples per pair, "
+        "sequential early stopping), "
         "Benjamini–Hochberg correction, and Cliff's delta effect size."
     )
     md_lines.append("### baf")
@@ -644,6 +647,8 @@ def generate_report(
                 "<p>Re-run scenarios: "
                 f"{', '.join(round_info.get('rerun_scenarios', [])) or 'none'}</p>"
             )
+            if "resumed_runs" in round_info:
+                html_lines.append(f"<p>Resumed censored runs: {int(round_info['resumed_runs'])}</p>")
             html_lines.append("<ul>")
             for scenario_delta in round_info.get("scenario_deltas", []):
                 html_lines.append(
@@ -749,7 +754,8 @@ def generate_report(
     html_lines.append("</ol><h2>Scenario pairwise significance tests</h2>")
     html_lines.append(
         "<p>Method: two-sided permutation test on mean differences "
-        f"({summary.overall.get('pairwise_significance_permutations', 0)} resamples), "
+        f"(up to {summary.overall.get('pairwise_significance_permutations', 0)} resamples per pair, "
+        "sequential early stopping), "
         "Benjamini–Hochberg correction, and Cliff's delta effect size.</p>"
     )
     html_lines.append("<h3>baf</h3><ul>")
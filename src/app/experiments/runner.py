@@ -1,20 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
 import csv
-from typing import Any
+import hashlib
+from itertools import islice, repeat
+from typing import Any, Callable, Collection, Iterator, Sequence
 
 import numpy as np
 
 from src.app.core.config import CAConfig
-from src.app.core.constants import TREE_STATES
-from src.app.core.engine import ForestFireCA
-from src.app.core.metrics import calculate_derived_metrics
+from src.app.core.constants import BURNT, TREE_STATES
+from src.app.core.engine import CACheckpoint, ForestFireCA
+from src.app.core.ensemble import ForestFireEnsemble
+from src.app.core.metrics import calculate_derived_metrics, calculate_fire_metrics
+from src.app.core.spatial_metrics import burned_spatial_metrics_stack
+from src.app.experiments.cache import RunCache
 from src.app.experiments.scenarios import ScenarioDefinition
 
 
+ENGINES = ("serial", "ensemble")
+
+# Upper bound on cells held by one ensemble stack; larger buckets are split into chunks.
+_ENSEMBLE_MAX_CELLS = 1 << 22
+
+# Runs simulated per chunk when streaming results, and rows per CSV/Parquet write batch.
+_STREAM_CHUNK_RUNS = 1024
+_PERSIST_BATCH_ROWS = 4096
+
+
 @dataclass(frozen=True)
 class ExperimentResult:
     run_id: str
@@ -22,6 +38,9 @@ class ExperimentResult:
     seed: int
     params: dict[str, Any]
     metrics: dict[str, Any]
+    # ``CACheckpoint.to_bytes()`` of a run truncated by max_steps, when checkpoints were requested and the
+    # run was simulated (not read from the cache or a journal); never persisted.
+    checkpoint: bytes | None = field(default=None, repr=False, compare=False)
 
 
 def _first_ignition_point(ca: ForestFireCA) -> tuple[int, int] | None:
@@ -49,66 +68,468 @@ def _with_spatial_metric_defaults(metrics: dict[str, Any]) -> dict[str, Any]:
     return normalized
 
 
-def _no_ignition_result(ca: ForestFireCA, critical_baf_threshold: float) -> dict[str, Any]:
-    final_metrics = _with_spatial_metric_defaults(ca.finalize_run_metrics())
-    series = [int(v) for v in ca.burning_cells_history]
+def _run_metrics(
+    *,
+    ignition_succeeded: bool,
+    truncated_by_max_steps: bool,
+    burning_cells: list[int],
+    step_count: int,
+    initial_tree_cells: int,
+    final_counts: dict[str, int],
+    critical_baf_threshold: float,
+    burnt_mask: np.ndarray | None = None,
+    spatial_metrics: dict[str, int | float] | None = None,
+) -> dict[str, Any]:
+    final_metrics = _with_spatial_metric_defaults(
+        calculate_fire_metrics(
+            burning_cells=burning_cells,
+            initial_tree_cells=initial_tree_cells,
+            final_counts=final_counts,
+            burnt_mask=burnt_mask,
+            spatial_metrics=spatial_metrics,
+        )
+    )
+    series = [int(v) for v in burning_cells]
     return {
-        "ignition_succeeded": False,
-        "no_ignition": True,
-        "truncated_by_max_steps": False,
+        "ignition_succeeded": ignition_succeeded,
+        "no_ignition": not ignition_succeeded,
+        "truncated_by_max_steps": truncated_by_max_steps,
         **final_metrics,
         **calculate_derived_metrics(
             burning_cells=series,
-            step_count=ca.step_count,
-            initial_tree_cells=ca.initial_tree_cells,
+            step_count=step_count,
+            initial_tree_cells=initial_tree_cells,
             critical_baf_threshold=critical_baf_threshold,
             baf=float(final_metrics.get("baf", 0.0)),
-            steps_total_or_fire_horizon=ca.step_count,
+            steps_total_or_fire_horizon=step_count,
         ),
     }
 
 
-def _simulate_single_run(cfg: CAConfig, max_steps: int, critical_baf_threshold: float) -> dict[str, Any]:
+def _ca_metrics(
+    ca: ForestFireCA,
+    *,
+    ignition_succeeded: bool,
+    truncated_by_max_steps: bool,
+    critical_baf_threshold: float,
+) -> dict[str, Any]:
+    return _run_metrics(
+        ignition_succeeded=ignition_succeeded,
+        truncated_by_max_steps=truncated_by_max_steps,
+        burning_cells=ca.burning_cells_history,
+        step_count=ca.step_count,
+        initial_tree_cells=ca.initial_tree_cells,
+        final_counts=ca.cell_counts(),
+        burnt_mask=(ca.grid == BURNT),
+        critical_baf_threshold=critical_baf_threshold,
+    )
+
+
+def _no_ignition_result(ca: ForestFireCA, critical_baf_threshold: float) -> dict[str, Any]:
+    return _ca_metrics(
+        ca,
+        ignition_succeeded=False,
+        truncated_by_max_steps=False,
+        critical_baf_threshold=critical_baf_threshold,
+    )
+
+
+def _advance(ca: ForestFireCA, steps: int) -> bool:
+    """Step while fire is active, at most ``steps`` times; return whether the run was truncated."""
+    for _ in range(steps):
+        if not ca.has_active_fire():
+            return False
+        ca.step()
+    return ca.has_active_fire()
+
+
+def _run_single(
+    cfg: CAConfig,
+    max_steps: int,
+    critical_baf_threshold: float,
+    keep_checkpoint: bool = False,
+) -> tuple[dict[str, Any], bytes | None]:
     ca = ForestFireCA(cfg)
     ignition_point = _first_ignition_point(ca)
 
     if ignition_point is None:
-        return _no_ignition_result(ca, critical_baf_threshold)
+        return _no_ignition_result(ca, critical_baf_threshold), None
 
     ignite_row, ignite_col = ignition_point
     ca.ignite(ignite_row, ignite_col)
 
-    fire_started = ca.has_active_fire()
-    if not fire_started:
-        return _no_ignition_result(ca, critical_baf_threshold)
+    if not ca.has_active_fire():
+        return _no_ignition_result(ca, critical_baf_threshold), None
+
+    truncated_by_max_steps = _advance(ca, max_steps)
+    return _finished_run(ca, truncated_by_max_steps, critical_baf_threshold, keep_checkpoint)
+
+
+def _resume_single(
+    cfg: CAConfig,
+    checkpoint: CACheckpoint | bytes,
+    max_steps: int,
+    critical_baf_threshold: float,
+    keep_checkpoint: bool = False,
+) -> tuple[dict[str, Any], bytes | None]:
+    """Continue a run from ``checkpoint`` up to ``max_steps`` steps in total."""
+    ca = ForestFireCA(cfg)
+    ca.restore(checkpoint)
+    truncated_by_max_steps = _advance(ca, max_steps - ca.step_count)
+    return _finished_run(ca, truncated_by_max_steps, critical_baf_threshold, keep_checkpoint)
+
+
+def _finished_run(
+    ca: ForestFireCA,
+    truncated_by_max_steps: bool,
+    critical_baf_threshold: float,
+    keep_checkpoint: bool,
+) -> tuple[dict[str, Any], bytes | None]:
+    metrics = _ca_metrics(
+        ca,
+        ignition_succeeded=True,
+        truncated_by_max_steps=truncated_by_max_steps,
+        critical_baf_threshold=critical_baf_threshold,
+    )
+    return metrics, (ca.snapshot() if keep_checkpoint and truncated_by_max_steps else None)
+
+
+def _simulate_single_run(cfg: CAConfig, max_steps: int, critical_baf_threshold: float) -> dict[str, Any]:
+    return _run_single(cfg, max_steps, critical_baf_threshold)[0]
+
+
+def _simulate_ensemble(
+    cfgs: list[CAConfig],
+    max_steps: int,
+    critical_baf_threshold: float,
+    keep_checkpoints: bool = False,
+) -> list[tuple[dict[str, Any], bytes | None]]:
+    """Run same-shape configs as one ensemble; results match ``_run_single`` per config."""
+    ensemble = ForestFireEnsemble(cfgs)
+    ignited = ensemble.ignite_nearest_center()
+    ensemble.retire(~ignited)
 
-    loop_exhausted = True
     for _ in range(max_steps):
-        if fire_started and not ca.has_active_fire():
-            loop_exhausted = False
+        ensemble.retire(ensemble.burning_counts() == 0)
+        if ensemble.size == 0:
             break
-        ca.step()
-        fire_started = fire_started or ca.has_active_fire()
+        ensemble.step()
+
+    truncated = np.zeros(len(cfgs), dtype=bool)
+    truncated[ensemble.members] = ensemble.burning_counts() > 0
+    checkpoints: list[bytes | None] = [None] * len(cfgs)
+    if keep_checkpoints:
+        for slot, member in enumerate(ensemble.members):
+            if truncated[member]:
+                checkpoints[member] = ensemble.checkpoint(slot).to_bytes()
+    ensemble.retire(np.ones(ensemble.size, dtype=bool))
+    spatial = burned_spatial_metrics_stack(ensemble.final_grids == BURNT)
+
+    return [
+        (
+            _run_metrics(
+                ignition_succeeded=bool(ignited[member]),
+                truncated_by_max_steps=bool(truncated[member]),
+                burning_cells=ensemble.burning_history(member),
+                step_count=int(ensemble.step_counts[member]),
+                initial_tree_cells=int(ensemble.initial_tree_cells[member]),
+                final_counts=ensemble.final_counts(member),
+                critical_baf_threshold=critical_baf_threshold,
+                spatial_metrics=spatial[member],
+            ),
+            checkpoints[member],
+        )
+        for member in range(len(cfgs))
+    ]
 
-    truncated_by_max_steps = bool(loop_exhausted and fire_started and ca.has_active_fire())
 
-    final_metrics = _with_spatial_metric_defaults(ca.finalize_run_metrics())
-    series = [int(v) for v in ca.burning_cells_history]
+def _divergence_step(cfg: CAConfig) -> int | None:
+    """First step at which ``cfg`` can behave differently from ``_prefix_config(cfg)``; ``None`` if never.
 
-    return {
-        "ignition_succeeded": True,
-        "no_ignition": False,
-        "truncated_by_max_steps": truncated_by_max_steps,
-        **final_metrics,
-        **calculate_derived_metrics(
-            burning_cells=series,
-            step_count=ca.step_count,
-            initial_tree_cells=ca.initial_tree_cells,
+    Only the rain scenario window acts late in a run: before its start the rain intensity, and with it
+    every draw, is the same as without the window.
+    """
+    if not cfg.rain_scenario_enabled:
+        return None
+    start = int(cfg.rain_scenario_start_step)
+    if int(cfg.rain_scenario_end_step) <= start:
+        return None
+    manual = float(cfg.rain_intensity) if cfg.rain_enabled else 0.0
+    if np.clip(manual + float(cfg.rain_scenario_intensity), 0.0, 1.0) == np.clip(manual, 0.0, 1.0):
+        return None
+    return max(0, start)
+
+
+def _prefix_config(cfg: CAConfig) -> CAConfig:
+    """``cfg`` without its late-acting parameters; runs that agree on it share steps before they diverge."""
+    defaults = CAConfig()
+    return replace(
+        cfg,
+        rain_scenario_enabled=False,
+        rain_scenario_start_step=defaults.rain_scenario_start_step,
+        rain_scenario_end_step=defaults.rain_scenario_end_step,
+        rain_scenario_intensity=defaults.rain_scenario_intensity,
+    )
+
+
+def _shared_prefix_groups(cfgs: list[CAConfig], indices: list[int]) -> tuple[list[list[int]], list[int]]:
+    """Split ``indices`` into groups of two or more runs with a common prefix, and the remaining runs."""
+    by_prefix: dict[str, list[int]] = {}
+    rest: list[int] = []
+    for index in indices:
+        if _divergence_step(cfgs[index]) == 0:
+            rest.append(index)
+        else:
+            # The seed is part of the prefix config, so only runs drawing the same numbers are grouped.
+            by_prefix.setdefault(repr(_prefix_config(cfgs[index])), []).append(index)
+    groups = [group for group in by_prefix.values() if len(group) > 1]
+    rest.extend(index for group in by_prefix.values() if len(group) == 1 for index in group)
+    return groups, sorted(rest)
+
+
+def _run_shared_prefix(
+    cfgs: list[CAConfig],
+    max_steps: int,
+    critical_baf_threshold: float,
+    keep_checkpoints: bool = False,
+) -> list[tuple[dict[str, Any], bytes | None]]:
+    """Run configs that agree up to their first divergence step once up to it, then continue each from a checkpoint.
+
+    Results match ``_run_single`` per config.
+    """
+    divergence = [step for step in map(_divergence_step, cfgs) if step is not None]
+    prefix_steps = min([max_steps, *divergence])
+    ca = ForestFireCA(cfgs[0])
+    ignition_point = _first_ignition_point(ca)
+    if ignition_point is not None:
+        ca.ignite(*ignition_point)
+    if ignition_point is None or not ca.has_active_fire():
+        metrics = _no_ignition_result(ca, critical_baf_threshold)
+        return [(dict(metrics), None) for _ in cfgs]
+
+    truncated_by_max_steps = _advance(ca, prefix_steps)
+    if not truncated_by_max_steps or prefix_steps == max_steps:
+        # The fire ended (or the budget ran out) before any member diverged: all runs end here.
+        metrics, checkpoint = _finished_run(ca, truncated_by_max_steps, critical_baf_threshold, keep_checkpoints)
+        return [(dict(metrics), checkpoint) for _ in cfgs]
+    checkpoint = ca.checkpoint()
+    return [_resume_single(cfg, checkpoint, max_steps, critical_baf_threshold, keep_checkpoints) for cfg in cfgs]
+
+
+def _plan_tasks(
+    cfgs: list[CAConfig],
+    checkpoints: list[bytes | None],
+    *,
+    engine: str,
+    workers: int,
+) -> list[tuple[str, list[int]]]:
+    """Split runs into independent work units of ``(kind, config indices)``.
+
+    With the serial engine, fresh runs that share a seed and differ only in late-acting parameters
+    become ``"prefix"`` units that simulate their common first steps once.
+    """
+    tasks: list[tuple[str, list[int]]] = []
+    buckets: dict[tuple[int, int], list[int]] = {}
+    fresh = [index for index in range(len(cfgs)) if checkpoints[index] is None]
+    if engine == "serial":
+        prefix_groups, fresh = _shared_prefix_groups(cfgs, fresh)
+        tasks.extend(("prefix", group) for group in prefix_groups)
+    fresh_set = set(fresh)
+    for index, cfg in enumerate(cfgs):
+        if checkpoints[index] is not None:
+            tasks.append(("resume", [index]))
+        elif index not in fresh_set:
+            continue
+        elif engine == "ensemble" and ForestFireEnsemble.supports(cfg):
+            buckets.setdefault((int(cfg.height), int(cfg.width)), []).append(index)
+        else:
+            tasks.append(("serial", [index]))
+
+    for (height, width), indices in buckets.items():
+        chunk = max(1, _ENSEMBLE_MAX_CELLS // max(1, height * width))
+        # Keep every worker busy when a single bucket dominates the batch.
+        chunk = min(chunk, -(-len(indices) // max(1, workers)))
+        for start in range(0, len(indices), chunk):
+            tasks.append(("ensemble", indices[start:start + chunk]))
+    return tasks
+
+
+def _simulate_task(
+    kind: str,
+    cfgs: list[CAConfig],
+    checkpoints: list[bytes | None],
+    max_steps: int,
+    critical_baf_threshold: float,
+    keep_checkpoints: bool,
+) -> list[tuple[dict[str, Any], bytes | None]]:
+    """Run one work unit; module-level so process-pool workers can unpickle it.
+
+    ``max_steps`` is the total step budget; ``"resume"`` units only run what their checkpoint has left.
+    """
+    if kind == "ensemble":
+        return _simulate_ensemble(cfgs, max_steps, critical_baf_threshold, keep_checkpoints)
+    if kind == "prefix":
+        return _run_shared_prefix(cfgs, max_steps, critical_baf_threshold, keep_checkpoints)
+    if kind == "resume":
+        return [
+            _resume_single(cfg, checkpoint, max_steps, critical_baf_threshold, keep_checkpoints)
+            for cfg, checkpoint in zip(cfgs, checkpoints)
+        ]
+    return [_run_single(cfg, max_steps, critical_baf_threshold, keep_checkpoints) for cfg in cfgs]
+
+
+def _simulate_runs(
+    cfgs: list[CAConfig],
+    *,
+    engine: str,
+    max_steps: int,
+    critical_baf_threshold: float,
+    workers: int = 1,
+    checkpoints: list[bytes | None] | None = None,
+    keep_checkpoints: bool = False,
+    cache: RunCache | None = None,
+) -> list[tuple[dict[str, Any], bytes | None]]:
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine!r} (expected one of {', '.join(ENGINES)})")
+    if checkpoints is None:
+        checkpoints = [None] * len(cfgs)
+    if cache is None:
+        return _simulate_uncached(
+            cfgs,
+            checkpoints,
+            engine=engine,
+            max_steps=max_steps,
             critical_baf_threshold=critical_baf_threshold,
-            baf=float(final_metrics.get("baf", 0.0)),
-            steps_total_or_fire_horizon=ca.step_count,
-        ),
-    }
+            workers=workers,
+            keep_checkpoints=keep_checkpoints,
+        )
+
+    # A resumed run finishes exactly like a fresh run with the same budget, so both share one key.
+    keys = [cache.key(cfg, max_steps, critical_baf_threshold) for cfg in cfgs]
+    outcomes: list[tuple[dict[str, Any], bytes | None] | None] = [None] * len(cfgs)
+    pending: list[int] = []
+    for index, key in enumerate(keys):
+        metrics = cache.get(key)
+        # A cached truncated run carries no checkpoint; resume_truncated_runs simulates it from its seed
+        # only if the censor audit actually continues it.
+        if metrics is None:
+            pending.append(index)
+        else:
+            outcomes[index] = (metrics, None)
+
+    if pending:
+        simulated = _simulate_uncached(
+            [cfgs[i] for i in pending],
+            [checkpoints[i] for i in pending],
+            engine=engine,
+            max_steps=max_steps,
+            critical_baf_threshold=critical_baf_threshold,
+            workers=workers,
+            keep_checkpoints=keep_checkpoints,
+        )
+        for index, outcome in zip(pending, simulated):
+            outcomes[index] = outcome
+            cache.put(keys[index], outcome[0])
+        cache.evict()
+    return outcomes
+
+
+def _simulate_uncached(
+    cfgs: list[CAConfig],
+    checkpoints: list[bytes | None],
+    *,
+    engine: str,
+    max_steps: int,
+    critical_baf_threshold: float,
+    workers: int,
+    keep_checkpoints: bool,
+) -> list[tuple[dict[str, Any], bytes | None]]:
+    workers = max(1, int(workers))
+    tasks = _plan_tasks(cfgs, checkpoints, engine=engine, workers=workers)
+    task_args = (
+        [kind for kind, _ in tasks],
+        [[cfgs[i] for i in indices] for _, indices in tasks],
+        [[checkpoints[i] for i in indices] for _, indices in tasks],
+        repeat(max_steps),
+        repeat(critical_baf_threshold),
+        repeat(keep_checkpoints),
+    )
+
+    if workers == 1 or len(tasks) <= 1:
+        results = list(map(_simulate_task, *task_args))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            results = list(pool.map(_simulate_task, *task_args, chunksize=max(1, len(tasks) // (4 * workers))))
+
+    outcomes: list[tuple[dict[str, Any], bytes | None] | None] = [None] * len(cfgs)
+    for (_, indices), task_outcomes in zip(tasks, results):
+        for index, outcome in zip(indices, task_outcomes):
+            outcomes[index] = outcome
+    return outcomes
+
+
+def derive_run_seed(base_seed: int, scenario_name: str | None, run_index: int) -> int:
+    """Seed for one run, keyed on ``(base_seed, scenario, run_index)`` via ``SeedSequence``.
+
+    The seed does not depend on scenario order, batch composition or worker count. With
+    ``scenario_name=None`` run ``i`` gets the same seed in every scenario (common random numbers).
+    """
+    entropy = [int(base_seed) & 0xFFFFFFFFFFFFFFFF]
+    if scenario_name is not None:
+        entropy.append(int.from_bytes(hashlib.sha256(scenario_name.encode("utf-8")).digest()[:8], "little"))
+    sequence = np.random.SeedSequence([*entropy, int(run_index)])
+    return int(sequence.generate_state(1, dtype=np.uint32)[0] % np.iinfo(np.int32).max)
+
+
+def iter_experiments(
+    *,
+    defaults: dict[str, Any],
+    scenarios: list[ScenarioDefinition],
+    runs_per_scenario: int,
+    base_seed: int,
+    max_steps: int,
+    critical_baf_threshold: float,
+    engine: str = "serial",
+    workers: int = 1,
+    keep_checkpoints: bool = False,
+    cache: RunCache | None = None,
+    skip_run_ids: Collection[str] = (),
+    common_random_numbers: bool = False,
+) -> Iterator[ExperimentResult]:
+    """Yield results in ``run_experiments`` order, simulating ``_STREAM_CHUNK_RUNS`` runs at a time.
+
+    Runs whose id is in ``skip_run_ids`` are neither simulated nor yielded.
+    """
+
+    def planned() -> Iterator[tuple[ScenarioDefinition, int, int, dict[str, Any]]]:
+        for scenario in scenarios:
+            merged_params: dict[str, Any] = {**defaults, **scenario.params}
+            for run_index in range(runs_per_scenario):
+                if f"{scenario.name}-{run_index:04d}" in skip_run_ids:
+                    continue
+                seed_key = None if common_random_numbers else scenario.name
+                yield scenario, run_index, derive_run_seed(base_seed, seed_key, run_index), merged_params
+
+    runs = planned()
+    while chunk := list(islice(runs, _STREAM_CHUNK_RUNS)):
+        outcomes = _simulate_runs(
+            [CAConfig(**{**merged_params, "seed": seed}) for _, _, seed, merged_params in chunk],
+            engine=engine,
+            max_steps=max_steps,
+            critical_baf_threshold=critical_baf_threshold,
+            workers=workers,
+            keep_checkpoints=keep_checkpoints,
+            cache=cache,
+        )
+        for (scenario, run_index, seed, merged_params), (metrics, checkpoint) in zip(chunk, outcomes):
+            yield ExperimentResult(
+                run_id=f"{scenario.name}-{run_index:04d}",
+                scenario=scenario.name,
+                seed=seed,
+                params=merged_params,
+                metrics=metrics,
+                checkpoint=checkpoint,
+            )
 
 
 def run_experiments(
@@ -119,65 +540,172 @@ def run_experiments(
     base_seed: int,
     max_steps: int,
     critical_baf_threshold: float,
+    engine: str = "serial",
+    workers: int = 1,
+    keep_checkpoints: bool = False,
+    cache: RunCache | None = None,
+    common_random_numbers: bool = False,
 ) -> list[ExperimentResult]:
-    rng = np.random.default_rng(base_seed)
-    all_results: list[ExperimentResult] = []
-
-    for scenario in scenarios:
-        merged_params: dict[str, Any] = {**defaults, **scenario.params}
-        for run_index in range(runs_per_scenario):
-            seed = int(rng.integers(0, np.iinfo(np.int32).max))
-            cfg = CAConfig(**{**merged_params, "seed": seed})
-            metrics = _simulate_single_run(cfg, max_steps=max_steps, critical_baf_threshold=critical_baf_threshold)
-
-            all_results.append(
-                ExperimentResult(
-                    run_id=f"{scenario.name}-{run_index:04d}",
-                    scenario=scenario.name,
-                    seed=seed,
-                    params=merged_params,
-                    metrics=metrics,
-                )
-            )
-    return all_results
+    """Run every scenario ``runs_per_scenario`` times.
+
+    ``engine="ensemble"`` steps runs of equal grid shape together in a ``ForestFireEnsemble``;
+    seeds and per-run metrics are identical to the default ``"serial"`` engine.
+    ``workers > 1`` spreads runs over a process pool. Seeds come from ``derive_run_seed``, so
+    results and their order are identical for any worker count.
+    ``keep_checkpoints`` attaches a compressed ``CACheckpoint.to_bytes()`` blob to every simulated
+    run truncated by ``max_steps`` so ``resume_truncated_runs`` can continue it; runs served from the
+    cache carry none and are re-created from their seed only if they are resumed.
+    With a ``cache``, runs already simulated with the same config, seed and budget are not simulated again.
+    ``common_random_numbers`` gives run ``i`` of every scenario the same seed, so scenario differences
+    are not mixed with seed noise; serial runs that then differ only in late-acting parameters (the
+    rain scenario window) simulate their common first steps once.
+    """
+    return list(
+        iter_experiments(
+            defaults=defaults,
+            scenarios=scenarios,
+            runs_per_scenario=runs_per_scenario,
+            base_seed=base_seed,
+            max_steps=max_steps,
+            critical_baf_threshold=critical_baf_threshold,
+            engine=engine,
+            workers=workers,
+            keep_checkpoints=keep_checkpoints,
+            cache=cache,
+            common_random_numbers=common_random_numbers,
+        )
+    )
+
+
+def resume_truncated_runs(
+    results: list[ExperimentResult],
+    *,
+    max_steps: int,
+    critical_baf_threshold: float,
+    workers: int = 1,
+    keep_checkpoints: bool = False,
+    cache: RunCache | None = None,
+) -> list[ExperimentResult]:
+    """Continue every result truncated by its step budget until ``max_steps`` total steps.
+
+    Only truncated runs are simulated and returned. Runs with a checkpoint continue from it; runs
+    without one (read back from a journal or the cache) are simulated again from their seed. Both give the
+    result of a fresh run of the same seed with the larger step budget.
+    """
+    truncated = [result for result in results if result.metrics.get("truncated_by_max_steps")]
+    outcomes = _simulate_runs(
+        [CAConfig(**{**result.params, "seed": result.seed}) for result in truncated],
+        engine="serial",
+        max_steps=max_steps,
+        critical_baf_threshold=critical_baf_threshold,
+        workers=workers,
+        checkpoints=[result.checkpoint for result in truncated],
+        keep_checkpoints=keep_checkpoints,
+        cache=cache,
+    )
+    return [
+        replace(result, metrics=metrics, checkpoint=checkpoint)
+        for result, (metrics, checkpoint) in zip(truncated, outcomes)
+    ]
+
+
+def result_row(result: ExperimentResult) -> dict[str, Any]:
+    """Flat CSV/Parquet row for one result."""
+    row = {
+        "run_id": result.run_id,
+        "scenario": result.scenario,
+        "seed": result.seed,
+    }
+    row.update({f"param_{k}": v for k, v in result.params.items()})
+    row.update(result.metrics)
+    return row
+
+
+def persist_results(
+    results: Sequence[ExperimentResult],
+    output_dir: str | Path,
+    batch_size: int = _PERSIST_BATCH_ROWS,
+) -> tuple[Path, Path | None]:
+    """Write results as CSV and, when pyarrow is available, Parquet, ``batch_size`` rows at a time."""
 
+    def batches() -> Iterator[list[dict[str, Any]]]:
+        for start in range(0, len(results), batch_size):
+            yield [result_row(result) for result in results[start:start + batch_size]]
 
-def persist_results(results: list[ExperimentResult], output_dir: str | Path) -> tuple[Path, Path | None]:
+    return _persist_batches(batches, output_dir, batch_size)
+
+
+def persist_rows(
+    rows: Sequence[dict[str, Any]],
+    output_dir: str | Path,
+    batch_size: int = _PERSIST_BATCH_ROWS,
+) -> tuple[Path, Path | None]:
+    """``persist_results`` for rows already flattened by ``result_row``."""
+
+    def batches() -> Iterator[Sequence[dict[str, Any]]]:
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+    return _persist_batches(batches, output_dir, batch_size)
+
+
+def _persist_batches(
+    batches: Callable[[], Iterator[Sequence[dict[str, Any]]]],
+    output_dir: str | Path,
+    batch_size: int,
+) -> tuple[Path, Path | None]:
     ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    rows: list[dict[str, Any]] = []
-    for result in results:
-        row = {
-            "run_id": result.run_id,
-            "scenario": result.scenario,
-            "seed": result.seed,
-        }
-        row.update({f"param_{k}": v for k, v in result.params.items()})
-        row.update(result.metrics)
-        rows.append(row)
+    # First pass only collects the column set (and Parquet types); rows are rebuilt per batch.
+    columns: dict[str, Any] = {}
+    for batch in batches():
+        for row in batch:
+            for key, value in row.items():
+                previous = columns.get(key)
+                if previous is None or (isinstance(value, float) and type(previous) is int):
+                    columns[key] = value
+    fieldnames = sorted(columns)
 
     csv_path = output_path / f"experiment_results_{ts}.csv"
-    fieldnames = sorted({key for row in rows for key in row.keys()})
     with csv_path.open("w", newline="", encoding="utf-8") as fp:
         writer = csv.DictWriter(fp, fieldnames=fieldnames)
         writer.writeheader()
-        writer.writerows(rows)
+        for batch in batches():
+            writer.writerows(batch)
+            fp.flush()
 
-    parquet_path: Path | None = None
+    parquet_path: Path | None = output_path / f"experiment_results_{ts}.parquet"
     try:
-        import pandas as pd
-
-        frame = pd.DataFrame(rows)
-        parquet_path = output_path / f"experiment_results_{ts}.parquet"
-        frame.to_parquet(parquet_path, index=False)
+        _write_parquet(batches, parquet_path, columns, fieldnames, batch_size)
     except Exception:
+        parquet_path.unlink(missing_ok=True)
         parquet_path = None
 
     return csv_path, parquet_path
 
 
+def _write_parquet(
+    batches: Callable[[], Iterator[Sequence[dict[str, Any]]]],
+    path: Path,
+    columns: dict[str, Any],
+    fieldnames: list[str],
+    batch_size: int,
+):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sample = {
+        key: float(value) if type(value) is int and isinstance(columns[key], float) else value
+        for key, value in columns.items()
+    }
+    schema = pa.Table.from_pylist([{key: sample[key] for key in fieldnames}]).schema
+    with pq.ParquetWriter(path, schema) as writer:
+        for batch in batches():
+            writer.write_table(pa.Table.from_pylist(list(batch), schema=schema), row_group_size=batch_size)
+
+
 def results_to_dicts(results: list[ExperimentResult]) -> list[dict[str, Any]]:
     payload: list[dict[str, Any]] = []
     for result in results:
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import math
-from random import Random
 from statistics import mean
+from typing import Iterator
 
+import numpy as np
 
-def _percentile(values: list[float], q: float) -> float:
-    if not values:
+
+def _percentile(values: list[float] | np.ndarray, q: float) -> float:
+    if len(values) == 0:
         return 0.0
-    ordered = sorted(values)
+    ordered = np.sort(np.asarray(values, dtype=np.float64), kind="stable")
     if len(ordered) == 1:
         return float(ordered[0])
     q_clamped = _clamp_01(float(q))
@@ -18,11 +21,109 @@ def _percentile(values: list[float], q: float) -> float:
     if lower_idx == upper_idx:
         return float(ordered[lower_idx])
     fraction = pos - lower_idx
-    lower = ordered[lower_idx]
-    upper = ordered[upper_idx]
+    lower = float(ordered[lower_idx])
+    upper = float(ordered[upper_idx])
     return float(lower + fraction * (upper - lower))
 
 
+def _exact_mean(values: list[float] | np.ndarray) -> float:
+    """Mean rounded once from the exact sum, i.e. the float ``statistics.mean`` returns; 0.0 if empty.
+
+    The exact sum is accumulated as integers grouped by binary exponent, which takes a few NumPy
+    passes instead of one ``Fraction`` per value.
+    """
+    array = np.asarray(values, dtype=np.float64).ravel()
+    n = array.size
+    if n == 0:
+        return 0.0
+    if not np.isfinite(array).all():
+        return float(mean(array.tolist()))
+    mantissas, exponents = np.frexp(array)
+    numerators = (mantissas * float(1 << 53)).astype(np.int64)
+    # Split the 53-bit numerators so that per-exponent int64 sums cannot overflow.
+    high = numerators >> 26
+    low = numerators & ((1 << 26) - 1)
+    order = np.argsort(exponents, kind="stable")
+    unique_exponents, starts = np.unique(exponents[order], return_index=True)
+    high_sums = np.add.reduceat(high[order], starts)
+    low_sums = np.add.reduceat(low[order], starts)
+    base = int(unique_exponents[0])
+    total = 0
+    for exponent, high_sum, low_sum in zip(
+        unique_exponents.tolist(), high_sums.tolist(), low_sums.tolist()
+    ):
+        total += ((high_sum << 26) + low_sum) << (exponent - base)
+    # Every value is numerator * 2 ** (exponent - 53); int / int true division rounds once.
+    shift = base - 53
+    if shift >= 0:
+        return (total << shift) / n
+    return total / (n << -shift)
+
+
+# Element budget for one block of resampled values; bootstraps never materialise more at once.
+_BOOTSTRAP_BLOCK_ELEMENTS = 1 << 22
+# Largest resample index matrix that is drawn whole and memoised (16 MiB of int32, so the cache holds at
+# most 128 MiB); larger ones are drawn block by block on every use.
+_BOOTSTRAP_CACHED_ELEMENTS = 1 << 22
+
+
+@lru_cache(maxsize=8)
+def _bootstrap_indices(n: int, n_resamples: int, seed: int) -> np.ndarray:
+    """Resample index matrix of shape (n_resamples, n), drawn once per (n, n_resamples, seed).
+
+    Every bootstrap over samples of the same size reuses it, so CIs for all metrics of a scenario
+    see the same resamples and depend only on the data and ``seed``.
+    """
+    indices = np.random.default_rng(seed).integers(0, n, size=(max(1, int(n_resamples)), n), dtype=np.int32)
+    indices.setflags(write=False)
+    return indices
+
+
+def _bootstrap_index_blocks(n: int, n_resamples: int, seed: int, row_elements: int) -> Iterator[np.ndarray]:
+    """Consecutive row blocks of ``_bootstrap_indices(n, n_resamples, seed)``.
+
+    A block holds as many rows as fit ``_BOOTSTRAP_BLOCK_ELEMENTS`` when each row gathers
+    ``row_elements`` values. Matrices above ``_BOOTSTRAP_CACHED_ELEMENTS`` are neither kept whole
+    nor memoised.
+    """
+    n_resamples = max(1, int(n_resamples))
+    block = max(1, _BOOTSTRAP_BLOCK_ELEMENTS // max(1, int(row_elements)))
+    if n * n_resamples <= _BOOTSTRAP_CACHED_ELEMENTS:
+        indices = _bootstrap_indices(n, n_resamples, seed)
+        for start in range(0, n_resamples, block):
+            yield indices[start:start + block]
+        return
+    # Row blocks drawn one after another consume the stream exactly like one (n_resamples, n) draw.
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_resamples, block):
+        yield rng.integers(0, n, size=(min(block, n_resamples - start), n), dtype=np.int32)
+
+
+def _bootstrap_ci(samples: np.ndarray, confidence: float) -> tuple[float, float]:
+    alpha = (1.0 - confidence) / 2.0
+    return float(np.quantile(samples, _clamp_01(alpha))), float(np.quantile(samples, _clamp_01(1.0 - alpha)))
+
+
+def _resampled_pair_blocks(
+    xs: list[float],
+    ys: list[float],
+    n_resamples: int,
+    seed: int,
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """Per block of resamples: centered resampled x and y, and masks of the resamples where x and y vary."""
+    x = np.asarray(xs, dtype=np.float64)
+    y = np.asarray(ys, dtype=np.float64)
+    for idx in _bootstrap_index_blocks(len(xs), n_resamples, seed, row_elements=2 * len(xs)):
+        bx = x[idx]
+        by = y[idx]
+        # Compare extremes rather than the variance: a constant resample must not pass as tiny noise.
+        x_varies = np.ptp(bx, axis=1) > 0
+        y_varies = np.ptp(by, axis=1) > 0
+        bx -= bx.mean(axis=1, keepdims=True)
+        by -= by.mean(axis=1, keepdims=True)
+        yield bx, by, x_varies, y_varies
+
+
 def _bootstrap_mean_ci(
     values: list[float],
     *,
@@ -30,30 +131,24 @@ def _bootstrap_mean_ci(
     n_resamples: int = 2000,
     seed: int = 42,
 ) -> tuple[float, float]:
-    if not values:
+    if len(values) == 0:
         return 0.0, 0.0
     if len(values) == 1:
         value = float(values[0])
         return value, value
 
-    rng = Random(seed)
-    n = len(values)
-    sample_means = []
-    for _ in range(n_resamples):
-        sample = [values[rng.randrange(n)] for _ in range(n)]
-        sample_means.append(float(mean(sample)))
-
-    alpha = (1.0 - confidence) / 2.0
-    ci_low = _percentile(sample_means, alpha)
-    ci_high = _percentile(sample_means, 1.0 - alpha)
-    return ci_low, ci_high
+    array = np.asarray(values, dtype=np.float64)
+    sample_means = np.concatenate(
+        [array[idx].mean(axis=1) for idx in _bootstrap_index_blocks(array.size, n_resamples, seed, array.size)]
+    )
+    return _bootstrap_ci(sample_means, confidence)
 
 
 def _pearson_corr(xs: list[float], ys: list[float]) -> float | None:
     if not xs or not ys or len(xs) != len(ys):
         return None
-    x_mean = mean(xs)
-    y_mean = mean(ys)
+    x_mean = _exact_mean(xs)
+    y_mean = _exact_mean(ys)
     x_std = (sum((x - x_mean) ** 2 for x in xs) / len(xs)) ** 0.5
     y_std = (sum((y - y_mean) ** 2 for y in ys) / len(ys)) ** 0.5
     if x_std == 0.0 or y_std == 0.0:
@@ -63,8 +158,13 @@ def _pearson_corr(xs: list[float], ys: list[float]) -> float | None:
 
 
 def _pearson_p_value(xs: list[float], ys: list[float], corr: float) -> float:
-    n = len(xs)
-    if n != len(ys) or n < 3:
+    if len(xs) != len(ys):
+        return 1.0
+    return _pearson_p_value_n(len(xs), corr)
+
+
+def _pearson_p_value_n(n: int, corr: float) -> float:
+    if n < 3:
         return 1.0
     abs_corr = abs(float(corr))
     if abs_corr >= 1.0:
@@ -94,37 +194,29 @@ def _bootstrap_corr_ci(
             return 0.0, 0.0
         return corr, corr
 
-    rng = Random(seed)
-    n = len(xs)
-    sample_corrs: list[float] = []
-    for _ in range(n_resamples):
-        idxs = [rng.randrange(n) for _ in range(n)]
-        bxs = [xs[i] for i in idxs]
-        bys = [ys[i] for i in idxs]
-        corr = _pearson_corr(bxs, bys)
-        if corr is not None:
-            sample_corrs.append(corr)
-
-    if not sample_corrs:
+    sample_corrs = []
+    for bx, by, x_varies, y_varies in _resampled_pair_blocks(xs, ys, n_resamples, seed):
+        valid = x_varies & y_varies
+        bx, by = bx[valid], by[valid]
+        cov = np.einsum("ij,ij->i", bx, by)
+        sample_corrs.append(cov / np.sqrt(np.einsum("ij,ij->i", bx, bx) * np.einsum("ij,ij->i", by, by)))
+    samples = np.concatenate(sample_corrs)
+    if samples.size == 0:
         corr = _pearson_corr(xs, ys)
         if corr is None:
             return 0.0, 0.0
         return corr, corr
-
-    alpha = (1.0 - confidence) / 2.0
-    ci_low = _percentile(sample_corrs, alpha)
-    ci_high = _percentile(sample_corrs, 1.0 - alpha)
-    return ci_low, ci_high
+    return _bootstrap_ci(samples, confidence)
 
 
 def _linear_slope(xs: list[float], ys: list[float]) -> float | None:
     if not xs or not ys or len(xs) != len(ys):
         return None
-    x_mean = mean(xs)
+    x_mean = _exact_mean(xs)
     denom = sum((x - x_mean) ** 2 for x in xs)
     if denom == 0.0:
         return None
-    y_mean = mean(ys)
+    y_mean = _exact_mean(ys)
     numer = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
     return float(numer / denom)
 
@@ -145,50 +237,145 @@ def _bootstrap_slope_ci(
             return 0.0, 0.0
         return slope, slope
 
-    rng = Random(seed)
-    n = len(xs)
-    sample_slopes: list[float] = []
-    for _ in range(n_resamples):
-        idxs = [rng.randrange(n) for _ in range(n)]
-        bxs = [xs[i] for i in idxs]
-        bys = [ys[i] for i in idxs]
-        slope = _linear_slope(bxs, bys)
-        if slope is not None:
-            sample_slopes.append(slope)
-
-    if not sample_slopes:
+    sample_slopes = []
+    for bx, by, x_varies, _ in _resampled_pair_blocks(xs, ys, n_resamples, seed):
+        bx, by = bx[x_varies], by[x_varies]
+        sample_slopes.append(np.einsum("ij,ij->i", bx, by) / np.einsum("ij,ij->i", bx, bx))
+    samples = np.concatenate(sample_slopes)
+    if samples.size == 0:
         slope = _linear_slope(xs, ys)
         if slope is None:
             return 0.0, 0.0
         return slope, slope
-
+    return _bootstrap_ci(samples, confidence)
+
+
+def _pearson_matrix(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Pearson r and OLS slope of every column of ``x`` (..., n, p) against every column of ``y`` (..., n, m).
+
+    Returns two (..., p, m) arrays. Slopes are NaN where the x column is constant and r is also NaN
+    where the y column is constant.
+    """
+    return _pearson_matrix_rows(
+        np.ascontiguousarray(np.swapaxes(x, -1, -2), dtype=np.float64),
+        np.ascontiguousarray(np.swapaxes(y, -1, -2), dtype=np.float64),
+    )
+
+
+def _pearson_matrix_rows(xt: np.ndarray, yt: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """``_pearson_matrix`` on variables stored as rows: ``xt`` (..., p, n), ``yt`` (..., m, n)."""
+    shape = (*xt.shape[:-1], yt.shape[-2])
+    if xt.shape[-1] == 0:
+        return np.full(shape, np.nan), np.full(shape, np.nan)
+    # Constancy is judged on the raw extremes, so rounding in the means cannot fake a tiny variance.
+    x_varies = (np.ptp(xt, axis=-1) > 0)[..., :, None]
+    y_varies = (np.ptp(yt, axis=-1) > 0)[..., None, :]
+    xc = xt - xt.mean(axis=-1, keepdims=True)
+    yc = yt - yt.mean(axis=-1, keepdims=True)
+    cov = xc @ np.swapaxes(yc, -1, -2)
+    x_ss = np.square(xc).sum(axis=-1)[..., :, None]
+    y_ss = np.square(yc).sum(axis=-1)[..., None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.where(x_varies & y_varies, cov / np.sqrt(x_ss * y_ss), np.nan)
+        slope = np.where(x_varies, cov / x_ss, np.nan)
+    return corr, slope
+
+
+def _nan_quantile(samples: np.ndarray, q: float) -> np.ndarray:
+    """``np.quantile`` (linear) along axis 0 over the non-NaN entries; each column needs one."""
+    ordered = np.sort(samples, axis=0)
+    valid = np.count_nonzero(~np.isnan(samples), axis=0)
+    pos = (valid - 1) * q
+    lower = np.floor(pos).astype(np.intp)
+    upper = np.minimum(lower + 1, valid - 1)
+    t = pos - lower
+    a = np.take_along_axis(ordered, lower[None], axis=0)[0]
+    b = np.take_along_axis(ordered, upper[None], axis=0)[0]
+    # Same two-sided lerp as NumPy, so full columns reproduce np.quantile exactly.
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1.0 - t), a + diff * t)
+
+
+def _bootstrap_nan_ci(
+    samples: np.ndarray, point: np.ndarray, confidence: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Percentile CI over the non-NaN resamples; the point estimate (NaN -> 0.0) where there are none."""
+    samples = np.where(np.isnan(samples).all(axis=0), np.nan_to_num(point, nan=0.0), samples)
     alpha = (1.0 - confidence) / 2.0
-    ci_low = _percentile(sample_slopes, alpha)
-    ci_high = _percentile(sample_slopes, 1.0 - alpha)
-    return ci_low, ci_high
+    return _nan_quantile(samples, _clamp_01(alpha)), _nan_quantile(samples, _clamp_01(1.0 - alpha))
+
+
+def _bootstrap_pearson_matrix_ci(
+    x: np.ndarray,
+    y: np.ndarray,
+    *,
+    confidence: float = 0.95,
+    n_resamples: int = 1000,
+    seed: int = 42,
+) -> tuple[tuple[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]]:
+    """Bootstrap CIs of r and slope for all column pairs of ``x`` (..., n, p) and ``y`` (..., n, m).
+
+    Returns ``((r_low, r_high), (slope_low, slope_high))``, each (..., p, m). Every pair and every
+    leading group is resampled with the same ``_bootstrap_indices`` rows, so a pair's CI equals
+    ``_bootstrap_corr_ci`` / ``_bootstrap_slope_ci`` on its columns up to float rounding. Resamples
+    where a column is constant are skipped per pair, as in the scalar versions.
+    """
+    xt = np.ascontiguousarray(np.swapaxes(x, -1, -2), dtype=np.float64)
+    yt = np.ascontiguousarray(np.swapaxes(y, -1, -2), dtype=np.float64)
+    corr, slope = _pearson_matrix_rows(xt, yt)
+    n = xt.shape[-1]
+    if n < 2:
+        corr_point = np.nan_to_num(corr, nan=0.0)
+        slope_point = np.nan_to_num(slope, nan=0.0)
+        return (corr_point, corr_point), (slope_point, slope_point)
+    n_resamples = max(1, int(n_resamples))
+    resample_size = int(np.prod(xt.shape[:-1], dtype=np.int64) + np.prod(yt.shape[:-1], dtype=np.int64)) * n
+    corr_samples = np.empty((n_resamples, *corr.shape))
+    slope_samples = np.empty((n_resamples, *slope.shape))
+    stop = 0
+    for rows in _bootstrap_index_blocks(n, n_resamples, seed, resample_size):
+        start, stop = stop, stop + len(rows)
+        # (..., p, b, n) gathers -> (b, ..., p, n) resampled variables. Contiguous copies keep matmul on
+        # the same kernel whatever the leading shape, so a group's CI does not depend on its batch mates.
+        corr_samples[start:stop], slope_samples[start:stop] = _pearson_matrix_rows(
+            np.ascontiguousarray(np.moveaxis(xt[..., rows], -2, 0)),
+            np.ascontiguousarray(np.moveaxis(yt[..., rows], -2, 0)),
+        )
+    return _bootstrap_nan_ci(corr_samples, corr, confidence), _bootstrap_nan_ci(slope_samples, slope, confidence)
 
 
 def _clamp_01(value: float) -> float:
     return max(0.0, min(1.0, value))
 
 
-def _cliffs_delta(xs: list[float], ys: list[float]) -> float:
-    if not xs or not ys:
-        return 0.0
-    greater = 0
-    lower = 0
-    for x in xs:
-        for y in ys:
-            if x > y:
-                greater += 1
-            elif x < y:
-                lower += 1
-    denom = len(xs) * len(ys)
+def _sorted_sample(values: list[float]) -> np.ndarray:
+    """Sorted float copy of ``values`` without NaNs, which compare neither greater nor lower."""
+    array = np.asarray(values, dtype=np.float64)
+    return np.sort(array[~np.isnan(array)])
+
+
+def _cliffs_delta_sorted(xs_sorted: np.ndarray, ys_sorted: np.ndarray, n_x: int, n_y: int) -> float:
+    """Cliff's delta from samples prepared by ``_sorted_sample``; ``n_x``/``n_y`` are the original sizes.
+
+    For every x, ``searchsorted`` gives how many y are strictly lower and how many are not
+    greater, so ties count on neither side exactly as in a pairwise comparison.
+    """
+    denom = n_x * n_y
     if denom == 0:
         return 0.0
+    lower_than_x = np.searchsorted(ys_sorted, xs_sorted, side="left")
+    not_greater_than_x = np.searchsorted(ys_sorted, xs_sorted, side="right")
+    greater = int(lower_than_x.sum())
+    lower = int(ys_sorted.size * xs_sorted.size - not_greater_than_x.sum())
     return float((greater - lower) / denom)
 
 
+def _cliffs_delta(xs: list[float], ys: list[float]) -> float:
+    if not xs or not ys:
+        return 0.0
+    return _cliffs_delta_sorted(_sorted_sample(xs), _sorted_sample(ys), len(xs), len(ys))
+
+
 def _cliffs_delta_label(delta: float) -> str:
     ad = abs(float(delta))
     if ad < 0.147:
@@ -200,6 +387,71 @@ def _cliffs_delta_label(delta: float) -> str:
     return "large"
 
 
+def _wilson_bounds(successes: int, trials: int, z: float) -> tuple[float, float]:
+    if trials <= 0:
+        return 0.0, 1.0
+    z2 = z * z
+    center = (successes + z2 / 2.0) / (trials + z2)
+    half = z * math.sqrt(successes * (trials - successes) / trials + z2 / 4.0) / (trials + z2)
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def _certifiable_p_value(resamples: int, z: float = 3.0) -> float:
+    """Smallest level ``_sequential_permutation_test`` can stop below after ``resamples`` permutations.
+
+    It is the Wilson upper bound of a p-value with no extreme permutation at all.
+    """
+    return _wilson_bounds(0, max(1, int(resamples)), z)[1]
+
+
+def _sequential_permutation_test(
+    xs: list[float],
+    ys: list[float],
+    *,
+    max_resamples: int = 2000,
+    seed: int = 42,
+    stop_below: float | None = None,
+    stop_above: float | None = None,
+    block_size: int = 250,
+    z: float = 3.0,
+) -> tuple[float, int]:
+    """Two-sided permutation test on the mean difference; returns ``(p_value, permutations_used)``.
+
+    Permutations are drawn in blocks of ``block_size`` index rows. With ``stop_below``/``stop_above``
+    set, sampling stops early (Besag–Clifford style) once the Wilson bound of the Monte Carlo p-value
+    lies entirely below ``stop_below`` or above ``stop_above``, i.e. when more permutations could
+    not change which side of those thresholds the test falls on.
+    """
+    if len(xs) == 0 or len(ys) == 0:
+        return 1.0, 0
+    values = np.concatenate([np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)])
+    n = values.size
+    n_x = len(xs)
+    n_y = n - n_x
+    total = float(values.sum())
+    observed = abs(float(values[:n_x].mean() - values[n_x:].mean()))
+    # Permutations that reproduce the observed split must count as extreme despite rounding.
+    tolerance = 1e-9 * max(1.0, float(np.abs(values).max()))
+
+    rng = np.random.default_rng(seed)
+    max_resamples = max(1, int(max_resamples))
+    extreme = 0
+    used = 0
+    while used < max_resamples:
+        block = min(max(1, int(block_size)), max_resamples - used)
+        perms = rng.permuted(np.broadcast_to(np.arange(n), (block, n)), axis=1)
+        sum_x = values[perms[:, :n_x]].sum(axis=1)
+        diffs = sum_x / n_x - (total - sum_x) / n_y
+        extreme += int(np.count_nonzero(np.abs(diffs) >= observed - tolerance))
+        used += block
+        if stop_below is None and stop_above is None:
+            continue
+        low, high = _wilson_bounds(extreme, used, z)
+        if (stop_above is not None and low > stop_above) or (stop_below is not None and high < stop_below):
+            break
+    return float((extreme + 1) / (used + 1)), used
+
+
 def _permutation_test_mean_diff(
     xs: list[float],
     ys: list[float],
@@ -207,22 +459,7 @@ def _permutation_test_mean_diff(
     n_resamples: int = 2000,
     seed: int = 42,
 ) -> float:
-    if not xs or not ys:
-        return 1.0
-    observed = float(mean(xs) - mean(ys))
-    combined = [*xs, *ys]
-    n_x = len(xs)
-    rng = Random(seed)
-    extreme = 0
-    for _ in range(max(1, int(n_resamples))):
-        shuffled = list(combined)
-        rng.shuffle(shuffled)
-        perm_x = shuffled[:n_x]
-        perm_y = shuffled[n_x:]
-        perm_diff = float(mean(perm_x) - mean(perm_y))
-        if abs(perm_diff) >= abs(observed):
-            extreme += 1
-    return float((extreme + 1) / (max(1, int(n_resamples)) + 1))
+    return _sequential_permutation_test(xs, ys, max_resamples=n_resamples, seed=seed)[0]
 
 
 def _benjamini_hochberg(p_values: list[float]) -> list[float]:
@@ -26,7 +26,8 @@ class GridWidget(QWidget):
         self.setMouseTracking(True)
 
     def set_grid(self, grid: np.ndarray):
-        self._grid = grid
+        # ForestFireCA.grid is a view into buffers that later steps overwrite.
+        self._grid = np.array(grid, copy=True)
         self._rgb = PALETTE[grid]
         self.update()
 
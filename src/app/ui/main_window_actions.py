@@ -3,11 +3,14 @@ from __future__ import annotations
 from datetime import datetime
 from pathlib import Path
 
-import numpy as np
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QFileDialog
 
-from src.app.core.ca import CAConfig, ForestFireCA, TREE_CONIF, TREE_DECID
+from src.app.core.ca import CAConfig, ForestFireCA
+
+
+# Upper bound on steps one tick may jump over while the map waits for lightning.
+_IDLE_SKIP_MAX_STEPS = 10_000
 
 
 class MainWindowActionsMixin:
@@ -22,7 +25,8 @@ class MainWindowActionsMixin:
             return
 
         self.run_has_seen_fire = self.ca.has_active_fire()
-        has_trees = bool(np.any((self.ca.grid == TREE_DECID) | (self.ca.grid == TREE_CONIF)))
+        counts = self.ca.cell_counts()
+        has_trees = counts["decid"] + counts["conif"] > 0
 
         if not has_trees:
             self.statusBar().showMessage("На карті немає дерев для симуляції.", 3500)
@@ -47,7 +51,7 @@ class MainWindowActionsMixin:
         self._update_stats()
 
     def on_step(self):
-        self.on_tick()
+        self.on_tick(skip_idle=False)
 
     def on_reset(self):
         self.timer.stop()
@@ -104,14 +108,19 @@ class MainWindowActionsMixin:
         final_path.write_text(self.last_run_metrics_json, encoding="utf-8")
         self.statusBar().showMessage(f"Метрики збережено у файл: {final_path.resolve()}", 3500)
 
-    def on_tick(self):
-        self.ca.step()
+    def on_tick(self, skip_idle: bool = True):
+        if skip_idle and not self.ca.has_active_fire() and self.ca.lightning_strike_possible():
+            # Nothing burns: jump straight to the next lightning strike instead of ticking through idle steps.
+            self.ca.advance_idle(_IDLE_SKIP_MAX_STEPS)
+        else:
+            self.ca.step()
         self.grid_widget.set_grid(self.ca.grid)
         self._update_rain_status()
         self._update_stats()
 
         has_active_fire = self.ca.has_active_fire()
-        has_trees = bool(np.any((self.ca.grid == TREE_DECID) | (self.ca.grid == TREE_CONIF)))
+        counts = self.ca.cell_counts()
+        has_trees = counts["decid"] + counts["conif"] > 0
         has_future_ignition_sources = self.cfg.lightning_enabled and self.cfg.f > 0.0
 
         if has_active_fire:
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import random
+from statistics import mean
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.app.experiments.analysis import _ResultColumns
+from src.app.experiments.statistics import _exact_mean
+
+
+def test_exact_mean_matches_statistics_mean_bit_for_bit() -> None:
+    rng = random.Random(11)
+    for _ in range(500):
+        scale = 10.0 ** rng.randint(-300, 300)
+        values = [rng.gauss(0.0, 1.0) * scale for _ in range(rng.randint(1, 200))]
+        values += rng.choice([[], [0.0, -0.0], [1e300, -1e300], [5e-324]])
+        assert repr(_exact_mean(values)) == repr(mean(values))
+    assert _exact_mean([]) == 0.0
+
+
+def test_result_columns_group_rows_in_first_appearance_order() -> None:
+    rows = [
+        {"scenario": "b", "baf": 0.5, "param_rain": True, "param_humidity": 0.3},
+        {"scenario": "a", "baf": 0.25, "truncated_by_max_steps": True},
+        {"scenario": "b", "baf": 1.0, "no_ignition": True, "param_humidity": 1},
+    ]
+    columns = _ResultColumns(rows)
+
+    assert columns.values("baf").tolist() == [0.5, 0.25, 1.0]
+    assert columns.values("param_humidity").tolist() == [0.3, 0.0, 1.0]
+    assert columns.censored.tolist() == [False, True, False]
+    assert columns.no_ignition.tolist() == [False, False, True]
+    assert columns.param_keys() == (["param_humidity"], ["param_rain"])
+    assert columns.numeric_mask("param_humidity").tolist() == [True, False, True]
+
+    groups = columns.groups()
+    assert list(groups) == ["b", "a"]
+    assert groups["b"].tolist() == [0, 2]
+
+    assert columns.matrix(["baf", "param_humidity"])[groups["b"]].tolist() == [
+        [0.5, 0.3],
+        [1.0, 1.0],
+    ]
+    assert columns.matrix([]).shape == (3, 0)
@@ -6,7 +6,10 @@ from pathlib import Path
 import pytest
 
 from src.app.experiments.analysis import (
+    AnalysisCache,
+    _ResultColumns,
     _collect_top_correlations,
+    _pairwise_significance_by_metric,
     _sort_correlations,
     _parse_ofat_scenario_name,
     analyze_results,
@@ -638,6 +641,41 @@ def test_pairwise_significance_includes_bh_adjusted_p_values_and_effect_size() -
     assert overview["significant_bh_005"] == 3
 
 
+def test_pairwise_tests_keep_bh_decisions_with_many_scenarios() -> None:
+    # 72 scenarios give 2556 pairs, so fdr / m is far below the smallest reportable p-value.
+    rows = [
+        {"scenario": f"s{scenario:02d}", "run_id": f"s{scenario:02d}-{idx}", "baf": scenario + 0.01 * idx}
+        for scenario in range(72)
+        for idx in range(10)
+    ]
+    tests = _pairwise_significance_by_metric(_ResultColumns(rows), metric_key="baf", n_resamples=2000)
+
+    assert len(tests) == 72 * 71 // 2
+    assert all(item["significant_bh_005"] for item in tests)
+
+
+def test_pairwise_tests_run_the_full_budget_inside_the_bh_band() -> None:
+    # The a/b pair has p of about 0.033, between fdr / m = 0.0167 and fdr = 0.05 for three pairs.
+    rows = [
+        {"scenario": name, "run_id": f"{name}-{idx}", "baf": offset + (idx % 5) * 0.5 + 0.1 * idx}
+        for name, offset in (("a", 0.0), ("b", 1.0), ("c", 20.0))
+        for idx in range(10)
+    ]
+    sequential = _pairwise_significance_by_metric(_ResultColumns(rows), metric_key="baf", n_resamples=2000)
+    full = _pairwise_significance_by_metric(
+        _ResultColumns(rows), metric_key="baf", n_resamples=2000, sequential=False
+    )
+
+    def pair(tests: list[dict[str, object]]) -> dict[str, object]:
+        return next(item for item in tests if (item["scenario_a"], item["scenario_b"]) == ("a", "b"))
+
+    assert 0.05 / 3 < float(pair(full)["p_value"]) < 0.05
+    assert pair(sequential)["permutations_used"] == 2000
+    assert pair(sequential)["p_value"] == pair(full)["p_value"]
+    assert pair(sequential)["significant_bh_005"] is pair(full)["significant_bh_005"] is True
+    assert all(item["permutations_used"] < 2000 for item in sequential if item["scenario_b"] == "c")
+
+
 def test_analysis_builds_2d_interaction_surface_for_top_baf_params() -> None:
     rows = [
         {
@@ -781,7 +819,7 @@ def test_collect_top_correlations_adds_bh_q_values() -> None:
         )
 
     correlations = _collect_top_correlations(
-        rows,
+        _ResultColumns(rows),
         numeric_param_keys=["param_alpha", "param_beta"],
         metric_keys=["baf", "auc_normalized"],
         top_n=10,
@@ -820,3 +858,73 @@ def test_sort_correlations_is_stable_for_tied_statistics() -> None:
 
     ranked = _sort_correlations(tied, ranking_mode="q_then_abs_r", top_n=2)
     assert [item["param_key"] for item in ranked] == ["param_a", "param_b"]
+
+
+def test_audit_and_summary_profiles_skip_expensive_sections() -> None:
+    rows = []
+    for scenario_name, baf_base in {"s_low": 0.2, "s_high": 0.7}.items():
+        for idx in range(10):
+            rows.append(
+                {
+                    "scenario": scenario_name,
+                    "run_id": f"{scenario_name}-{idx}",
+                    "baf": baf_base + idx * 0.01,
+                    "auc_normalized": baf_base,
+                    "time_to_extinguish": 50.0 + idx,
+                    "critical": False,
+                    "truncated_by_max_steps": idx == 0,
+                    "param_humidity": 0.1 * idx,
+                }
+            )
+
+    full = analyze_results(rows, significance_permutations=200)
+    summary = analyze_results(rows, profile="summary")
+    audit = analyze_results(rows, profile="audit")
+
+    assert summary.by_scenario == full.by_scenario
+    assert summary.scenario_ranking == full.scenario_ranking
+    assert not summary.scenario_pairwise_significance and not summary.continuous_param_correlations
+    for name, stats in audit.by_scenario.items():
+        assert "baf_mean_ci_low" not in stats
+        assert stats["censored_share"] == full.by_scenario[name]["censored_share"]
+        assert stats["baf_mean_all"] == full.by_scenario[name]["baf_mean_all"]
+    with pytest.raises(ValueError):
+        analyze_results(rows, profile="fast")
+
+
+def test_analysis_cache_recomputes_only_changed_scenarios() -> None:
+    rows = []
+    for scenario_name, baf_base in {"s_a": 0.2, "s_b": 0.5, "s_c": 0.7}.items():
+        for idx in range(12):
+            rows.append(
+                {
+                    "scenario": scenario_name,
+                    "run_id": f"{scenario_name}-{idx}",
+                    "baf": baf_base + idx * 0.01,
+                    "auc_normalized": baf_base + (idx % 3) * 0.02,
+                    "time_to_extinguish": 50.0 + idx,
+                    "critical": idx > 9,
+                    "truncated_by_max_steps": idx == 0,
+                    "param_humidity": 0.1 * idx,
+                }
+            )
+
+    cache = AnalysisCache()
+    first = analyze_results(rows, significance_permutations=200, cache=cache)
+    assert first == analyze_results(rows, significance_permutations=200)
+    computed = cache.misses
+    assert computed > 0 and cache.hits == 0
+
+    assert analyze_results(rows, significance_permutations=200, cache=cache) == first
+    assert cache.misses == computed
+
+    changed = deepcopy(rows)
+    for row in changed:
+        if row["scenario"] == "s_c":
+            row["baf"] = min(1.0, float(row["baf"]) + 0.1)
+    hits_before = cache.hits
+    result = analyze_results(changed, significance_permutations=200, cache=cache)
+    assert result == analyze_results(changed, significance_permutations=200)
+    # s_a and s_b stats and correlations plus their pairwise tests are reused.
+    assert 0 < cache.misses - computed < computed
+    assert cache.hits - hits_before >= 4
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.core.config import CAConfig
+from src.app.core.engine import ForestFireCA
+
+
+def make_forest(*, ignite: bool = True, **options: object) -> ForestFireCA:
+    params: dict[str, object] = dict(
+        width=45,
+        height=33,
+        f=0.2,
+        lightning_cooldown_steps=3,
+        lightning_max_strikes_per_event=3,
+        wind_enabled=True,
+        rain_scenario_enabled=True,
+        rain_scenario_start_step=8,
+        rain_scenario_end_step=16,
+        rain_scenario_intensity=0.5,
+        rng_mode="counter",
+        seed=11,
+    )
+    ca = ForestFireCA(CAConfig(**{**params, **options}))
+    if ignite:
+        ca.ignite(16, 22)
+    ca.debug_counts = True
+    return ca
+
+
+@pytest.mark.parametrize("ignition_mode", ["per_direction", "combined"])
+def test_counter_draws_give_identical_grids_across_backends(ignition_mode: str) -> None:
+    backends = [
+        make_forest(ignition_mode=ignition_mode),
+        make_forest(ignition_mode=ignition_mode, tile_size=8),
+        make_forest(ignition_mode=ignition_mode, strip_rows=5, threads=1),
+        make_forest(ignition_mode=ignition_mode, strip_rows=7, threads=3),
+    ]
+    reference = backends[0]
+    for _ in range(40):
+        for ca in backends:
+            ca.step()
+        for ca in backends[1:]:
+            assert np.array_equal(ca.grid, reference.grid)
+    assert max(reference.burning_cells_history) > 1
+    for ca in backends[1:]:
+        assert ca.burning_cells_history == reference.burning_cells_history
+
+
+def test_counter_draws_make_idle_skipping_exact() -> None:
+    for seed in range(4):
+        skipped = make_forest(ignite=False, width=20, height=20, f=0.05, wind_enabled=False, seed=seed)
+        stepped = make_forest(ignite=False, width=20, height=20, f=0.05, wind_enabled=False, seed=seed)
+        advanced = skipped.advance_idle(500)
+        for _ in range(advanced):
+            stepped.step()
+        for _ in range(5):
+            skipped.step()
+            stepped.step()
+        assert np.array_equal(skipped.grid, stepped.grid)
+        assert skipped.burning_cells_history == stepped.burning_cells_history
+
+
+def test_unknown_rng_mode_is_rejected() -> None:
+    ca = ForestFireCA(CAConfig(width=10, height=10, rng_mode="philox"))
+    with pytest.raises(ValueError, match="rng_mode"):
+        ca.step()
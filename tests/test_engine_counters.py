@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.core.config import CAConfig
+from src.app.core.constants import (
+    BURNING1,
+    BURNING2,
+    BURNING3,
+    BURNT,
+    DAMPEN_BIT,
+    EXTINGUISH_BIT,
+    IGNITE_BIT,
+)
+from src.app.core.engine import ForestFireCA, apply_transitions
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"ignition_mode": "combined"},
+        {"tile_size": 8},
+        {"tile_size": 8, "ignition_mode": "combined"},
+    ],
+)
+def test_incremental_counters_match_full_recount(options: dict[str, object]) -> None:
+    ca = ForestFireCA(
+        CAConfig(
+            width=40,
+            height=30,
+            f=0.4,
+            lightning_cooldown_steps=1,
+            lightning_max_strikes_per_event=3,
+            rain_scenario_enabled=True,
+            rain_scenario_start_step=5,
+            rain_scenario_end_step=12,
+            rain_scenario_intensity=0.7,
+            seed=13,
+            **options,
+        )
+    )
+    ca.debug_counts = True
+    ca.ignite(15, 20)
+
+    for step in range(40):
+        ca.step()
+        if step == 10:
+            ca.set_barrier(3, 3)
+            ca.plant_conif(4, 4)
+            ca.plant_decid(5, 5)
+            ca.set_empty(6, 6)
+            ca.ignite(7, 7)
+
+    ca.verify_counts()
+    assert sum(ca.cell_counts().values()) == 40 * 30
+    assert ca.burning_cells_history[-1] == ca.cell_counts()["burning"]
+
+
+def test_transition_table_matches_masked_rules_and_counts_per_member() -> None:
+    rng = np.random.default_rng(4)
+    g = rng.integers(0, 8, size=(3, 20, 20), dtype=np.uint8)
+    ignite, dampen, extinguish = (rng.random(g.shape) < 0.3 for _ in range(3))
+
+    expected = g.copy()
+    expected[g == BURNING3] = BURNT
+    expected[g == BURNING2] = BURNING3
+    expected[(g == BURNING2) & extinguish] = BURNT
+    expected[g == BURNING1] = BURNING2
+    expected[(g == BURNING1) & dampen] = BURNING3
+    expected[ignite] = BURNING1
+
+    code = g | ignite * np.uint8(IGNITE_BIT) | dampen * np.uint8(DAMPEN_BIT) | extinguish * np.uint8(EXTINGUISH_BIT)
+    out = np.zeros_like(g)
+    delta = apply_transitions(code, g, out, np.zeros(g.shape, dtype=bool), members=3)
+
+    assert np.array_equal(out, expected)
+    for member in range(3):
+        before = np.bincount(g[member].ravel(), minlength=8)
+        after = np.bincount(out[member].ravel(), minlength=8)
+        assert delta[member].tolist() == (after - before).tolist()
+
+
+def test_verify_counts_detects_unsynced_direct_writes() -> None:
+    ca = ForestFireCA(CAConfig(width=4, height=4, init_tree_density=0.0, lightning_enabled=False, seed=1))
+    ca.grid[1, 1] = BURNING2
+
+    assert not ca.has_active_fire()
+    with pytest.raises(RuntimeError, match="out of sync"):
+        ca.verify_counts()
+
+    ca.start_run_tracking()
+    assert ca.has_active_fire()
+    ca.verify_counts()
+
+
+def test_edits_update_counters() -> None:
+    ca = ForestFireCA(CAConfig(width=3, height=3, init_tree_density=0.0, lightning_enabled=False, seed=1))
+
+    ca.plant_decid(0, 0)
+    ca.plant_conif(0, 1)
+    ca.ignite(0, 0)
+    ca.set_barrier(1, 1)
+    ca.set_barrier(0, 0)  # burning cells cannot become barriers
+
+    assert ca.grid[0, 0] == BURNING1
+    assert ca.cell_counts() == {"empty": 6, "decid": 0, "conif": 1, "burning": 1, "barrier": 1, "burnt": 0}
+    ca.verify_counts()
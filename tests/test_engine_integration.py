@@ -139,4 +139,48 @@ def test_metrics_payload_invariants_lightning_golden_scenario() -> None:
         "burned_components": 1,
         "largest_cluster_share": 1.0,
         "shape_complexity": 4.0,
-    }
\ No newline at end of file
+    }
+
+
+def test_seeded_trajectory_matches_reference_engine() -> None:
+    # Golden series recorded with the original allocation-per-step engine; the buffered
+    # step must keep reproducing it draw for draw.
+    ca = ForestFireCA(
+        CAConfig(
+            width=24,
+            height=20,
+            seed=11,
+            f=0.3,
+            lightning_cooldown_steps=2,
+            lightning_max_strikes_per_event=3,
+            wind_enabled=True,
+            wind_dir="SW",
+            wind_strength=0.9,
+            humidity=0.3,
+            rain_scenario_enabled=True,
+            rain_scenario_start_step=10,
+            rain_scenario_end_step=16,
+            rain_scenario_intensity=0.6,
+        )
+    )
+
+    for _ in range(30):
+        ca.step()
+
+    assert ca.burning_cells_history == [
+        0, 0, 0, 0, 1, 5, 8, 11, 14, 25, 41, 42, 40, 30, 30, 25,
+        28, 39, 50, 60, 54, 53, 46, 49, 45, 39, 25, 15, 9, 5, 3,
+    ]
+    assert ca.cell_counts() == {"empty": 179, "decid": 15, "conif": 11, "burning": 3, "barrier": 0, "burnt": 272}
+
+
+def test_step_reuses_double_buffered_grids() -> None:
+    ca = ForestFireCA(CAConfig(width=16, height=16, init_tree_density=1.0, lightning_enabled=False, seed=2))
+    ca.ignite(8, 8)
+    first = ca.step()
+    second = ca.step()
+    third = ca.step()
+
+    assert first.base is third.base
+    assert first.base is not second.base
+    assert ca.grid.base is third.base
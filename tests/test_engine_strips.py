@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.core.config import CAConfig
+from src.app.core.engine import ForestFireCA
+
+
+def make_forest(**options: object) -> ForestFireCA:
+    params: dict[str, object] = dict(
+        width=40,
+        height=30,
+        f=0.3,
+        lightning_cooldown_steps=2,
+        lightning_max_strikes_per_event=2,
+        rain_scenario_enabled=True,
+        rain_scenario_start_step=4,
+        rain_scenario_end_step=9,
+        rain_scenario_intensity=0.6,
+        seed=8,
+    )
+    ca = ForestFireCA(CAConfig(**{**params, **options}))
+    ca.ignite(15, 20)
+    ca.debug_counts = True
+    return ca
+
+
+def test_strip_step_does_not_depend_on_thread_count() -> None:
+    # 30 rows in strips of 8 leave a shorter last strip.
+    single = make_forest(strip_rows=8, threads=1)
+    pooled = make_forest(strip_rows=8, threads=3)
+
+    for _ in range(15):
+        single.step()
+        pooled.step()
+        assert np.array_equal(single.grid, pooled.grid)
+    assert single.burning_cells_history == pooled.burning_cells_history
+    assert max(single.burning_cells_history) > 1
+
+
+def test_strip_step_spreads_across_strip_halos_like_dense_step() -> None:
+    # Certain ignition and no rain or lightning: every draw succeeds, whichever stream it comes from.
+    options = dict(
+        init_tree_density=1.0,
+        flamm_decid=5.0,
+        flamm_conif=5.0,
+        burn_stage_factors=(1.0, 1.0, 1.0),
+        lightning_enabled=False,
+        rain_scenario_enabled=False,
+    )
+    dense = make_forest(**options)
+    strips = make_forest(strip_rows=4, threads=2, **options)
+
+    for _ in range(8):
+        dense.step()
+        strips.step()
+        assert np.array_equal(dense.grid, strips.grid)
+
+
+def test_strip_engines_share_one_thread_pool() -> None:
+    def strip_threads() -> list[threading.Thread]:
+        return [thread for thread in threading.enumerate() if thread.name.startswith("ca-strip")]
+
+    for _ in range(4):
+        make_forest(strip_rows=8, threads=2).fork(new_seed=1).step()
+    assert 0 < len(strip_threads()) <= 2
+
+    old = strip_threads()
+    make_forest(strip_rows=8, threads=3).step()
+    assert not any(thread.is_alive() for thread in old)
+    assert 0 < len(strip_threads()) <= 3
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.core.config import CAConfig
+from src.app.core.constants import BURNING1, TREE_DECID
+from src.app.core.engine import ForestFireCA
+
+
+class ConstantRandom:
+    def __init__(self, value: float):
+        self.value = value
+
+    def random(self, shape=None):
+        if shape is None:
+            return self.value
+        return np.full(shape, self.value, dtype=np.float64)
+
+
+def make_forest(*, tile_size: int, width: int = 64, height: int = 48) -> ForestFireCA:
+    return ForestFireCA(
+        CAConfig(
+            width=width,
+            height=height,
+            init_tree_density=1.0,
+            conifer_ratio=0.5,
+            humidity=0.2,
+            lightning_enabled=False,
+            rain_scenario_enabled=True,
+            rain_scenario_start_step=3,
+            rain_scenario_end_step=6,
+            rain_scenario_intensity=0.9,
+            tile_size=tile_size,
+            seed=5,
+        )
+    )
+
+
+def test_tiled_step_matches_dense_step_with_same_draws() -> None:
+    dense = make_forest(tile_size=0)
+    tiled = make_forest(tile_size=8)
+    assert np.array_equal(dense.grid, tiled.grid)
+
+    dense.rng = ConstantRandom(0.3)
+    tiled.rng = ConstantRandom(0.3)
+    for ca in (dense, tiled):
+        ca.ignite(5, 5)
+        ca.ignite(40, 60)
+
+    for _ in range(12):
+        dense.step()
+        tiled.step()
+        assert np.array_equal(dense.grid, tiled.grid)
+    assert dense.burning_cells_history == tiled.burning_cells_history
+
+
+def test_tiled_step_leaves_cold_tiles_untouched() -> None:
+    ca = make_forest(tile_size=8)
+    before = ca.grid.copy()
+    ca.ignite(2, 2)
+
+    ca.step()
+
+    assert ca.grid[2, 2] != before[2, 2]
+    assert np.array_equal(ca.grid[16:, :], before[16:, :])
+    assert np.array_equal(ca.grid[:, 16:], before[:, 16:])
+
+
+def test_separate_fires_get_separate_active_tiles() -> None:
+    ca = ForestFireCA(
+        CAConfig(width=96, height=16, init_tree_density=0.0, lightning_enabled=False, tile_size=8, seed=1)
+    )
+    for col in range(ca.cfg.width):
+        ca.plant_decid(4, col)
+    ca.ignite(4, 2)
+    ca.ignite(4, 93)
+
+    rects = ca._active_rects()
+
+    assert rects == [(0, 8, 0, 16), (0, 8, 80, 96), (8, 16, 0, 16), (8, 16, 80, 96)]
+
+
+def test_direct_grid_edits_are_picked_up_by_start_run_tracking() -> None:
+    ca = ForestFireCA(CAConfig(width=32, height=32, init_tree_density=0.0, lightning_enabled=False, tile_size=8, seed=3))
+    ca.grid[20, 20] = BURNING1
+    ca.grid[20, 21] = TREE_DECID
+    ca.start_run_tracking()
+    ca.rng = ConstantRandom(0.0)
+
+    ca.step()
+
+    assert ca.grid[20, 21] == BURNING1
+
+
+def test_assigned_grid_is_picked_up_by_the_tiled_step() -> None:
+    dense = make_forest(tile_size=0)
+    tiled = make_forest(tile_size=8)
+    grid = dense.grid.copy()
+    grid[20, 30] = BURNING1
+    dense.grid = grid
+    tiled.grid = grid
+
+    dense.rng = ConstantRandom(0.3)
+    tiled.rng = ConstantRandom(0.3)
+    for _ in range(5):
+        dense.step()
+        tiled.step()
+    assert dense.cell_counts()["burnt"] > 0
+    assert np.array_equal(dense.grid, tiled.grid)
+
+
+def test_changing_tile_size_rebuilds_the_tile_activity() -> None:
+    dense = make_forest(tile_size=0)
+    tiled = make_forest(tile_size=0)
+    dense.rng = ConstantRandom(0.3)
+    tiled.rng = ConstantRandom(0.3)
+    for ca in (dense, tiled):
+        ca.ignite(20, 30)
+    tiled.cfg.tile_size = 8
+
+    for _ in range(5):
+        dense.step()
+        tiled.step()
+    assert tiled._tile_active is not None
+    assert np.array_equal(dense.grid, tiled.grid)
+
+    tiled.cfg.tile_size = 16
+    dense.step()
+    tiled.step()
+    assert tiled._tile_active.shape == (3, 4)
+    assert np.array_equal(dense.grid, tiled.grid)
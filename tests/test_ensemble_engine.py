@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.core.config import CAConfig
+from src.app.core.ensemble import ForestFireEnsemble
+from src.app.experiments.runner import run_experiments
+from src.app.experiments.scenarios import ScenarioDefinition
+
+
+def _same(a: object, b: object) -> bool:
+    if isinstance(a, float) and math.isnan(a):
+        return isinstance(b, float) and math.isnan(b)
+    return a == b
+
+
+def test_ensemble_runner_matches_serial_engine() -> None:
+    scenarios = [
+        ScenarioDefinition(name="lightning", params={"width": 30, "height": 30, "f": 0.05, "humidity": 0.2}),
+        ScenarioDefinition(
+            name="wind_rain",
+            params={
+                "width": 25,
+                "height": 20,
+                "wind_enabled": True,
+                "wind_strength": 0.6,
+                "rain_scenario_enabled": True,
+                "rain_scenario_start_step": 3,
+                "rain_scenario_end_step": 10,
+                "rain_scenario_intensity": 0.6,
+            },
+        ),
+        ScenarioDefinition(name="no_trees", params={"width": 30, "height": 30, "init_tree_density": 0.0}),
+        ScenarioDefinition(name="tiled", params={"width": 30, "height": 30, "tile_size": 8}),
+    ]
+    kwargs = dict(scenarios=scenarios, defaults={}, runs_per_scenario=4, base_seed=3, max_steps=60, critical_baf_threshold=0.3)
+
+    serial = run_experiments(**kwargs)
+    ensemble = run_experiments(**kwargs, engine="ensemble")
+
+    assert [r.run_id for r in serial] == [r.run_id for r in ensemble]
+    for a, b in zip(serial, ensemble):
+        assert a.seed == b.seed
+        assert a.metrics.keys() == b.metrics.keys()
+        mismatched = [key for key in a.metrics if not _same(a.metrics[key], b.metrics[key])]
+        assert not mismatched, (a.run_id, mismatched)
+
+
+def test_ensemble_rejects_mixed_shapes() -> None:
+    with pytest.raises(ValueError):
+        ForestFireEnsemble([CAConfig(width=10, height=10), CAConfig(width=12, height=10)])
+
+
+def test_unknown_engine_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        run_experiments(
+            scenarios=[ScenarioDefinition(name="a", params={"width": 10, "height": 10})],
+            defaults={},
+            runs_per_scenario=1,
+            base_seed=0,
+            max_steps=5,
+            critical_baf_threshold=0.3,
+            engine="gpu",
+        )
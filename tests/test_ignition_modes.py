@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.core.config import CAConfig
+from src.app.core.constants import BURNING1, BURNING2, BURNING3, BURNT, EMPTY, TREE_DECID
+from src.app.core.engine import ForestFireCA
+
+
+def make_line(ignition_mode: str, *, seed: int = 7, rain: float = 0.0) -> ForestFireCA:
+    return ForestFireCA(
+        CAConfig(
+            width=3,
+            height=1,
+            init_tree_density=0.0,
+            humidity=0.5,
+            temperature_c=15.0,
+            lightning_enabled=False,
+            rain_enabled=rain > 0.0,
+            rain_intensity=rain,
+            ignition_mode=ignition_mode,
+            seed=seed,
+        )
+    )
+
+
+@pytest.mark.parametrize("ignition_mode", ["per_direction", "combined"])
+def test_two_burning_neighbours_ignite_with_union_probability(ignition_mode: str) -> None:
+    ca = make_line(ignition_mode)
+    # dryness_eff = 0.5 at 15 °C, flamm_decid = 0.85, stage factor 1.0 on each side.
+    p_side = 0.5 * 0.85
+    expected = 1.0 - (1.0 - p_side) ** 2
+
+    trials = 4000
+    ignited = 0
+    for _ in range(trials):
+        ca.grid[0, :] = [BURNING1, TREE_DECID, BURNING1]
+        ca.step()
+        ignited += int(ca.grid[0, 1] == BURNING1)
+
+    tolerance = 4.0 * (expected * (1.0 - expected) / trials) ** 0.5
+    assert ignited / trials == pytest.approx(expected, abs=tolerance)
+
+
+@pytest.mark.parametrize("ignition_mode", ["per_direction", "combined"])
+def test_rain_dampening_rate_matches_model(ignition_mode: str) -> None:
+    ca = make_line(ignition_mode, rain=0.8)
+
+    trials = 4000
+    dampened = 0
+    extinguished = 0
+    for _ in range(trials):
+        ca.grid[0, :] = [BURNING1, EMPTY, BURNING2]
+        ca.step()
+        dampened += int(ca.grid[0, 0] == BURNING3)
+        extinguished += int(ca.grid[0, 2] == BURNT)
+
+    assert dampened / trials == pytest.approx(0.25 * 0.8, abs=0.03)
+    assert extinguished / trials == pytest.approx(0.50 * 0.8, abs=0.03)
+
+
+def test_combined_mode_skips_draws_without_fire() -> None:
+    ca = ForestFireCA(
+        CAConfig(width=20, height=20, lightning_enabled=False, ignition_mode="combined", rain_enabled=True, rain_intensity=0.5, seed=3)
+    )
+    state_before = ca.rng.bit_generator.state
+
+    ca.step()
+
+    assert ca.rng.bit_generator.state == state_before
+    assert ca.burning_cells_history == [0, 0]
+
+
+def test_unknown_ignition_mode_is_rejected() -> None:
+    ca = make_line("typo")
+    ca.grid[0, :] = [BURNING2, TREE_DECID, EMPTY]
+
+    with pytest.raises(ValueError, match="ignition_mode"):
+        ca.step()
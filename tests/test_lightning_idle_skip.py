@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.core.config import CAConfig
+from src.app.core.engine import ForestFireCA
+
+
+def _waiting_cfg(seed: int) -> CAConfig:
+    # Event probability 0.08, and 0.08 * 0.4**2 while the rain window [5, 15) is open.
+    return CAConfig(
+        width=12,
+        height=12,
+        f=0.08,
+        lightning_cooldown_steps=3,
+        rain_scenario_enabled=True,
+        rain_scenario_start_step=5,
+        rain_scenario_end_step=15,
+        rain_scenario_intensity=0.6,
+        seed=seed,
+    )
+
+
+def test_advance_idle_stops_at_the_strike_with_bulk_history() -> None:
+    ca = ForestFireCA(_waiting_cfg(3))
+    ca._lightning_cooldown = 2
+    advanced = ca.advance_idle(500)
+
+    assert ca.has_active_fire()
+    assert advanced == ca.step_count >= 3
+    assert ca.burning_cells_history[:-1] == [0] * advanced
+    assert ca.burning_cells_history[-1] > 0
+    assert ca.advance_idle(500) == 0
+    ca.verify_counts()
+
+
+def test_advance_idle_waiting_time_follows_stepwise_distribution() -> None:
+    waits = []
+    for seed in range(1500):
+        ca = ForestFireCA(_waiting_cfg(seed))
+        ca._lightning_cooldown = 2
+        waits.append(ca.advance_idle(200))
+    waits_array = np.array(waits)
+
+    # Two cooldown steps, three steps at p = 0.08, then p = 0.0128 inside the rain window.
+    assert waits_array.min() == 3
+    assert np.mean(waits_array <= 3) == pytest.approx(0.08, abs=0.02)
+    assert np.mean(waits_array <= 10) == pytest.approx(1 - 0.92**3 * (1 - 0.0128) ** 5, abs=0.03)
+
+
+def test_advance_idle_uses_the_whole_budget_when_no_strike_is_possible() -> None:
+    ca = ForestFireCA(CAConfig(width=10, height=10, lightning_enabled=False, seed=1))
+    ca._lightning_cooldown = 5
+    grid = ca.grid.copy()
+
+    assert ca.advance_idle(40) == 40
+    assert ca.step_count == 40 and ca._lightning_cooldown == 0
+    assert ca.burning_cells_history == [0] * 41
+    assert np.array_equal(ca.grid, grid)
+
+    wet = ForestFireCA(CAConfig(width=10, height=10, humidity=1.0, f=0.5, seed=1))
+    assert wet.advance_idle(25) == 25 and not wet.has_active_fire()
+
+
+def test_lightning_strike_possible_only_with_enabled_positive_lightning() -> None:
+    assert ForestFireCA(CAConfig(width=10, height=10, f=0.1, seed=1)).lightning_strike_possible()
+    assert not ForestFireCA(CAConfig(width=10, height=10, lightning_enabled=False, seed=1)).lightning_strike_possible()
+    assert not ForestFireCA(CAConfig(width=10, height=10, f=0.0, seed=1)).lightning_strike_possible()
+    assert not ForestFireCA(CAConfig(width=10, height=10, humidity=1.0, f=0.5, seed=1)).lightning_strike_possible()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.core.config import CAConfig
+from src.app.core.engine import ForestFireCA
+from src.app.core.packed import PackedForestFireCA, pack_grid, unpack_grid
+
+
+def make_config(**options: object) -> CAConfig:
+    params: dict[str, object] = dict(
+        # Not a multiple of 64, so the last word of every row holds padding bits.
+        width=131,
+        height=29,
+        f=0.2,
+        lightning_cooldown_steps=3,
+        lightning_max_strikes_per_event=3,
+        wind_enabled=True,
+        rain_scenario_enabled=True,
+        rain_scenario_start_step=8,
+        rain_scenario_end_step=16,
+        rain_scenario_intensity=0.5,
+        rng_mode="counter",
+        seed=11,
+    )
+    return CAConfig(**{**params, **options})
+
+
+def test_pack_and_unpack_round_trip() -> None:
+    grid = np.random.default_rng(3).integers(0, 8, size=(5, 131), dtype=np.uint8)
+    planes = pack_grid(grid)
+    assert planes.shape == (3, 5, 3)
+    assert planes.dtype == np.uint64
+    assert np.array_equal(unpack_grid(planes, 131), grid)
+
+
+@pytest.mark.parametrize("ignition_mode", ["per_direction", "combined"])
+def test_packed_engine_matches_dense_engine_with_counter_draws(ignition_mode: str) -> None:
+    dense = ForestFireCA(make_config(ignition_mode=ignition_mode))
+    packed = PackedForestFireCA(make_config(ignition_mode=ignition_mode))
+    assert np.array_equal(packed.grid, dense.grid)
+
+    dense.ignite(14, 64)
+    packed.ignite(14, 64)
+    for _ in range(40):
+        dense.step()
+        packed.step()
+        assert np.array_equal(packed.grid, dense.grid)
+        assert packed.cell_counts() == dense.cell_counts()
+    assert max(dense.burning_cells_history) > 1
+    assert packed.burning_cells_history == dense.burning_cells_history
+    assert packed.finalize_run_metrics() == dense.finalize_run_metrics()
+
+
+def test_checkpoints_move_runs_between_engines() -> None:
+    dense = ForestFireCA(make_config())
+    dense.ignite(14, 64)
+    for _ in range(5):
+        dense.step()
+    packed = PackedForestFireCA.from_checkpoint(make_config(), dense.checkpoint())
+    for _ in range(5):
+        dense.step()
+        packed.step()
+
+    resumed = ForestFireCA.from_checkpoint(make_config(), packed.checkpoint())
+    for _ in range(5):
+        dense.step()
+        resumed.step()
+    assert np.array_equal(resumed.grid, dense.grid)
+    assert resumed.burning_cells_history == dense.burning_cells_history
+
+
+def test_packed_engine_requires_counter_draws() -> None:
+    with pytest.raises(ValueError, match="rng_mode"):
+        PackedForestFireCA(make_config(rng_mode="sequential"))
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.experiments.journal import ResultJournal, batch_fingerprint
+from src.app.experiments.runner import iter_experiments, persist_results, run_experiments
+from src.app.experiments.scenarios import ScenarioDefinition
+
+
+BATCH = dict(
+    defaults={"width": 20, "height": 20},
+    scenarios=[ScenarioDefinition(name="a", params={}), ScenarioDefinition(name="b", params={"humidity": 0.5})],
+    runs_per_scenario=3,
+    base_seed=2,
+    max_steps=25,
+    critical_baf_threshold=0.5,
+)
+
+
+def test_journal_resume_skips_finished_runs_and_ignores_partial_line(tmp_path: Path) -> None:
+    expected = run_experiments(**BATCH)
+    path = tmp_path / "journal.jsonl"
+
+    with ResultJournal(path, flush_every=2) as journal:
+        for result in expected[:4]:
+            journal.append(result)
+    with path.open("a", encoding="utf-8") as fp:
+        fp.write('{"run_id": "b-00')
+
+    journal = ResultJournal(path, resume=True)
+    done = journal.run_ids()
+    assert done == {r.run_id for r in expected[:4]}
+
+    for result in iter_experiments(**BATCH, skip_run_ids=done):
+        journal.append(result)
+    journal.close()
+
+    restored = list(ResultJournal(path, resume=True).read())
+    assert [r.run_id for r in restored] == [r.run_id for r in expected]
+    assert [r.metrics for r in restored] == [r.metrics for r in expected]
+
+
+def test_journal_resume_refuses_a_different_batch(tmp_path: Path) -> None:
+    path = tmp_path / "journal.jsonl"
+    settings = {
+        key: BATCH[key] for key in ("defaults", "scenarios", "base_seed", "max_steps", "critical_baf_threshold")
+    }
+    with ResultJournal(path, fingerprint=batch_fingerprint(**settings)) as journal:
+        for result in run_experiments(**BATCH)[:2]:
+            journal.append(result)
+
+    # Adding a scenario keeps the runs of the existing ones.
+    added = [*BATCH["scenarios"], ScenarioDefinition(name="c", params={"humidity": 0.9})]
+    resumed = ResultJournal(path, resume=True, fingerprint=batch_fingerprint(**{**settings, "scenarios": added}))
+    assert len(resumed.run_ids()) == 2
+
+    changed = [ScenarioDefinition(name="a", params={"humidity": 0.2}), BATCH["scenarios"][1]]
+    for options in ({"base_seed": 3}, {"max_steps": 40}, {"scenarios": changed}):
+        with pytest.raises(ValueError, match="different batch"):
+            ResultJournal(path, resume=True, fingerprint=batch_fingerprint(**{**settings, **options}))
+
+    legacy = tmp_path / "legacy.jsonl"
+    with ResultJournal(legacy) as journal:
+        journal.append(run_experiments(**BATCH)[0])
+    with pytest.raises(ValueError, match="fingerprint"):
+        ResultJournal(legacy, resume=True, fingerprint=batch_fingerprint(**settings))
+
+
+def test_persist_results_writes_all_rows_in_batches(tmp_path: Path) -> None:
+    results = run_experiments(**BATCH)
+    csv_path, _ = persist_results(results, tmp_path, batch_size=4)
+
+    with csv_path.open(newline="", encoding="utf-8") as fp:
+        rows = list(csv.DictReader(fp))
+    assert [row["run_id"] for row in rows] == [r.run_id for r in results]
+    assert "param_humidity" in rows[0] and rows[0]["param_humidity"] == ""
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.core.config import CAConfig
+from src.app.core.engine import ForestFireCA
+from src.app.experiments.cache import RunCache
+from src.app.experiments.runner import resume_truncated_runs, run_experiments
+from src.app.experiments.scenarios import ScenarioDefinition
+
+
+SCENARIOS = [
+    ScenarioDefinition(name="slow", params={"width": 40, "height": 40, "humidity": 0.3, "f": 0.02}),
+    ScenarioDefinition(name="tiled", params={"width": 30, "height": 30, "tile_size": 8}),
+]
+
+
+def _batch(max_steps: int, **options: object) -> list:
+    return run_experiments(
+        defaults={},
+        scenarios=SCENARIOS,
+        runs_per_scenario=3,
+        base_seed=5,
+        max_steps=max_steps,
+        critical_baf_threshold=0.5,
+        **options,
+    )
+
+
+def test_checkpoint_restore_continues_trajectory() -> None:
+    cfg = CAConfig(width=30, height=30, f=0.05, lightning_cooldown_steps=3, seed=4)
+    reference = ForestFireCA(cfg)
+    reference.ignite(15, 15)
+    for _ in range(5):
+        reference.step()
+
+    restored = ForestFireCA.from_checkpoint(cfg, reference.checkpoint())
+    for _ in range(10):
+        reference.step()
+        restored.step()
+
+    assert np.array_equal(reference.grid, restored.grid)
+    assert reference.burning_cells_history == restored.burning_cells_history
+    assert reference.cell_counts() == restored.cell_counts()
+
+
+@pytest.mark.parametrize("tile_size", [0, 8])
+def test_snapshot_restore_rewinds_and_replays(tile_size: int) -> None:
+    cfg = CAConfig(width=40, height=30, f=0.05, lightning_cooldown_steps=3, tile_size=tile_size, seed=4)
+    ca = ForestFireCA(cfg)
+    ca.ignite(15, 20)
+    for _ in range(5):
+        ca.step()
+    data = ca.snapshot()
+    assert len(data) < ca.grid.size
+
+    for _ in range(10):
+        ca.step()
+    expected_grid = ca.grid.copy()
+    expected_history = list(ca.burning_cells_history)
+
+    ca.restore(data)
+    assert ca.step_count == 5
+    for _ in range(10):
+        ca.step()
+    assert np.array_equal(ca.grid, expected_grid)
+    assert ca.burning_cells_history == expected_history
+    ca.verify_counts()
+
+    with pytest.raises(ValueError):
+        ca.restore(data[:-3])
+    with pytest.raises(ValueError):
+        ForestFireCA(CAConfig(width=30, height=30)).restore(data)
+
+
+def test_fork_branches_from_a_common_prefix() -> None:
+    cfg = CAConfig(width=30, height=30, f=0.05, seed=4)
+    parent = ForestFireCA(cfg)
+    parent.ignite(15, 15)
+    for _ in range(4):
+        parent.step()
+
+    same = parent.fork()
+    other = parent.fork(new_seed=99)
+    assert other.cfg.seed == 99 and parent.cfg.seed == 4
+    for _ in range(8):
+        parent.step()
+        same.step()
+        other.step()
+
+    assert np.array_equal(parent.grid, same.grid)
+    assert parent.burning_cells_history == same.burning_cells_history
+    assert other.burning_cells_history[:5] == parent.burning_cells_history[:5]
+    assert not np.array_equal(parent.grid, other.grid)
+    other.verify_counts()
+
+
+@pytest.mark.parametrize("engine", ["serial", "ensemble"])
+def test_resumed_runs_match_fresh_runs_with_larger_budget(engine: str) -> None:
+    short = _batch(10, engine=engine, keep_checkpoints=True)
+    truncated = [r for r in short if r.metrics["truncated_by_max_steps"]]
+    assert truncated
+    # Compact blobs, so workers return and the audit keeps far less than a uint8 grid per run.
+    assert all(isinstance(r.checkpoint, bytes) for r in truncated)
+    assert all(len(r.checkpoint) < int(r.params["width"]) * int(r.params["height"]) for r in truncated)
+    assert all(r.checkpoint is None for r in short if not r.metrics["truncated_by_max_steps"])
+
+    resumed = resume_truncated_runs(short, max_steps=30, critical_baf_threshold=0.5)
+    fresh = {r.run_id: r for r in _batch(30, engine=engine)}
+
+    assert [r.run_id for r in resumed] == [r.run_id for r in truncated]
+    for result in resumed:
+        assert result.metrics == fresh[result.run_id].metrics
+
+
+def test_cached_truncated_runs_are_not_simulated_again(tmp_path) -> None:
+    _batch(10, keep_checkpoints=True, cache=RunCache(tmp_path))
+
+    cache = RunCache(tmp_path)
+    cached = _batch(10, keep_checkpoints=True, cache=cache)
+    assert (cache.hits, cache.misses) == (len(cached), 0)
+    assert all(r.checkpoint is None for r in cached)
+
+    # Without a checkpoint the audit re-creates the run from its seed.
+    fresh = {r.run_id: r for r in _batch(30)}
+    for result in resume_truncated_runs(cached, max_steps=30, critical_baf_threshold=0.5):
+        assert result.metrics == fresh[result.run_id].metrics
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.core.config import CAConfig
+from src.app.experiments.cache import RunCache
+from src.app.experiments.runner import run_experiments
+from src.app.experiments.scenarios import ScenarioDefinition
+
+
+def _batch(scenarios: list[ScenarioDefinition], cache: RunCache, **options: object) -> list:
+    return run_experiments(
+        defaults={"width": 20, "height": 20},
+        scenarios=scenarios,
+        runs_per_scenario=2,
+        base_seed=9,
+        max_steps=30,
+        critical_baf_threshold=0.5,
+        cache=cache,
+        **options,
+    )
+
+
+def test_key_is_canonical_and_covers_run_inputs() -> None:
+    key = RunCache.key(CAConfig(humidity=0.0, seed=1), 100, 0.8)
+    assert key == RunCache.key(CAConfig(humidity=0, seed=1), 100, 0.8)
+    assert key != RunCache.key(CAConfig(humidity=0.0, seed=2), 100, 0.8)
+    assert key != RunCache.key(CAConfig(humidity=0.0, seed=1), 101, 0.8)
+    assert key != RunCache.key(CAConfig(humidity=0.0, seed=1), 100, 0.7)
+
+
+def test_key_ignores_thread_count() -> None:
+    key = RunCache.key(CAConfig(strip_rows=8, threads=1, seed=1), 100, 0.8)
+    assert key == RunCache.key(CAConfig(strip_rows=8, threads=4, seed=1), 100, 0.8)
+    assert key != RunCache.key(CAConfig(strip_rows=16, threads=1, seed=1), 100, 0.8)
+
+
+def test_added_scenario_only_simulates_its_own_runs(tmp_path: Path) -> None:
+    first = [ScenarioDefinition(name="a", params={"humidity": 0.1})]
+    second = first + [ScenarioDefinition(name="b", params={"humidity": 0.4})]
+
+    cold = _batch(first, RunCache(tmp_path))
+
+    cache = RunCache(tmp_path)
+    warm = _batch(second, cache)
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert [r.metrics for r in warm[:2]] == [r.metrics for r in cold]
+    assert [r.metrics for r in warm[2:]] == [r.metrics for r in _batch(second[1:], RunCache(tmp_path / "fresh"))]
+
+
+def test_eviction_keeps_cache_under_cap(tmp_path: Path) -> None:
+    cache = RunCache(tmp_path, max_bytes=1)
+    _batch([ScenarioDefinition(name="a", params={})], cache)
+    assert sum(path.stat().st_size for path in tmp_path.glob("*/*.json")) <= 1
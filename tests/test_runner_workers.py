@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.core.config import CAConfig
+from src.app.experiments.runner import _plan_tasks, derive_run_seed, run_experiments
+from src.app.experiments.scenarios import ScenarioDefinition
+
+
+SCENARIOS = [
+    ScenarioDefinition(name="dry", params={"width": 24, "height": 24, "humidity": 0.1}),
+    ScenarioDefinition(name="wet", params={"width": 20, "height": 16, "humidity": 0.6}),
+]
+
+
+def _batch(**options: object) -> list:
+    return run_experiments(
+        defaults={},
+        scenarios=SCENARIOS,
+        runs_per_scenario=3,
+        base_seed=11,
+        max_steps=40,
+        critical_baf_threshold=0.5,
+        **options,
+    )
+
+
+def test_seed_is_keyed_on_scenario_and_run_index() -> None:
+    assert derive_run_seed(11, "dry", 0) == derive_run_seed(11, "dry", 0)
+    assert derive_run_seed(11, "dry", 0) != derive_run_seed(11, "dry", 1)
+    assert derive_run_seed(11, "dry", 0) != derive_run_seed(11, "wet", 0)
+    assert derive_run_seed(11, "dry", 0) != derive_run_seed(12, "dry", 0)
+
+
+def test_seeds_do_not_depend_on_scenario_order() -> None:
+    forward = {r.run_id: r.seed for r in _batch()}
+    backward = run_experiments(
+        defaults={},
+        scenarios=list(reversed(SCENARIOS)),
+        runs_per_scenario=3,
+        base_seed=11,
+        max_steps=1,
+        critical_baf_threshold=0.5,
+    )
+    assert forward == {r.run_id: r.seed for r in backward}
+
+
+@pytest.mark.parametrize("engine", ["serial", "ensemble"])
+def test_process_pool_matches_serial_execution(engine: str) -> None:
+    serial = _batch(engine=engine)
+    pooled = _batch(engine=engine, workers=2)
+
+    assert [r.run_id for r in pooled] == [r.run_id for r in serial]
+    assert [r.seed for r in pooled] == [r.seed for r in serial]
+    assert [r.metrics for r in pooled] == [r.metrics for r in serial]
+
+
+RAIN_TIMING = [
+    ScenarioDefinition(name="no_rain", params={}),
+    ScenarioDefinition(name="rain_early", params={"rain_scenario_enabled": True, "rain_scenario_start_step": 4}),
+    ScenarioDefinition(name="rain_late", params={"rain_scenario_enabled": True, "rain_scenario_start_step": 12}),
+]
+
+
+def test_common_random_numbers_share_seeds_across_scenarios() -> None:
+    assert derive_run_seed(11, None, 0) == derive_run_seed(11, None, 0)
+    assert derive_run_seed(11, None, 0) != derive_run_seed(11, None, 1)
+    assert derive_run_seed(11, None, 0) != derive_run_seed(11, "dry", 0)
+
+
+def test_shared_prefix_runs_match_independent_runs() -> None:
+    defaults = {"width": 30, "height": 30, "humidity": 0.1, "rain_scenario_end_step": 30, "rain_scenario_intensity": 0.9}
+
+    def batch(engine: str) -> list:
+        return run_experiments(
+            defaults=defaults,
+            scenarios=RAIN_TIMING,
+            runs_per_scenario=3,
+            base_seed=11,
+            max_steps=40,
+            critical_baf_threshold=0.5,
+            engine=engine,
+            common_random_numbers=True,
+        )
+
+    cfgs = [CAConfig(**{**defaults, **scenario.params, "seed": 7}) for scenario in RAIN_TIMING]
+    assert _plan_tasks(cfgs, [None] * len(cfgs), engine="serial", workers=1) == [("prefix", [0, 1, 2])]
+
+    shared = batch("serial")
+    # The ensemble engine simulates every run on its own and matches the serial engine per run.
+    independent = batch("ensemble")
+    assert [r.seed for r in shared[:3]] == [r.seed for r in shared[3:6]]
+    assert [r.metrics for r in shared] == [r.metrics for r in independent]
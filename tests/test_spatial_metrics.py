@@ -4,7 +4,9 @@ import pytest
 
 np = pytest.importorskip("numpy")
 
-from src.app.core.spatial_metrics import burned_spatial_metrics
+from src.app.core.config import CAConfig
+from src.app.core.engine import ForestFireCA
+from src.app.core.spatial_metrics import burned_spatial_metrics, burned_spatial_metrics_stack
 
 
 def test_burned_spatial_metrics_returns_zeroes_for_empty_mask() -> None:
@@ -45,3 +47,47 @@ def test_burned_spatial_metrics_uses_8_connectivity_for_components() -> None:
     assert result["burned_components"] == 1
     assert result["largest_cluster_share"] == 1.0
     assert result["shape_complexity"] == pytest.approx(4.0)
+
+
+def test_burned_spatial_metrics_stack_matches_single_masks() -> None:
+    rng = np.random.default_rng(3)
+    masks = rng.random((12, 17, 23)) < np.linspace(0.0, 0.9, 12)[:, None, None]
+
+    assert burned_spatial_metrics_stack(masks) == [burned_spatial_metrics(mask) for mask in masks]
+
+
+def test_components_do_not_join_across_stacked_masks() -> None:
+    masks = np.zeros((2, 2, 3), dtype=bool)
+    masks[0, 1, :] = True
+    masks[1, 0, :] = True
+
+    result = burned_spatial_metrics_stack(masks)
+
+    assert [item["burned_components"] for item in result] == [1, 1]
+
+
+def test_components_join_u_shape_through_lower_row() -> None:
+    mask = np.array(
+        [
+            [1, 0, 1, 0, 1],
+            [1, 0, 1, 0, 1],
+            [1, 1, 1, 1, 1],
+        ],
+        dtype=bool,
+    )
+
+    result = burned_spatial_metrics(mask)
+
+    assert result["burned_components"] == 1
+    assert result["largest_cluster_share"] == 1.0
+
+
+@pytest.mark.parametrize("shape", [(10, 0), (0, 10), (0, 0)])
+def test_zero_sized_grids_give_zero_metrics(shape: tuple[int, int]) -> None:
+    zero = {"burned_components": 0, "largest_cluster_share": 0.0, "shape_complexity": 0.0}
+    assert burned_spatial_metrics(np.zeros(shape, dtype=bool)) == zero
+    assert burned_spatial_metrics_stack(np.zeros((2, *shape), dtype=bool)) == [zero, zero]
+
+    height, width = shape
+    metrics = ForestFireCA(CAConfig(width=width, height=height)).finalize_run_metrics()
+    assert metrics["burned_components"] == 0
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.experiments import statistics
+from src.app.experiments.statistics import (
+    _bootstrap_corr_ci,
+    _bootstrap_indices,
+    _bootstrap_mean_ci,
+    _bootstrap_pearson_matrix_ci,
+    _bootstrap_slope_ci,
+    _linear_slope,
+    _pearson_corr,
+    _pearson_matrix,
+)
+
+
+def test_bootstrap_indices_are_shared_per_sample_size_and_seed() -> None:
+    first = _bootstrap_indices(50, 200, 42)
+
+    assert _bootstrap_indices(50, 200, 42) is first
+    assert first.shape == (200, 50)
+    assert first.min() >= 0 and first.max() < 50
+    assert not np.array_equal(_bootstrap_indices(50, 200, 7), first)
+
+
+def test_large_bootstraps_draw_blocks_without_changing_the_cis(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(3)
+    xs = rng.random(61).tolist()
+    ys = [x + e for x, e in zip(xs, rng.standard_normal(61))]
+    x, y = rng.random((2, 61, 2)), rng.random((2, 61, 3))
+    expected = (_bootstrap_mean_ci(ys), _bootstrap_corr_ci(xs, ys), _bootstrap_slope_ci(xs, ys))
+    expected_matrix = _bootstrap_pearson_matrix_ci(x, y, n_resamples=300)
+
+    # Force the uncached, block-by-block path.
+    monkeypatch.setattr(statistics, "_BOOTSTRAP_CACHED_ELEMENTS", 0)
+    monkeypatch.setattr(statistics, "_BOOTSTRAP_BLOCK_ELEMENTS", 500)
+    _bootstrap_indices.cache_clear()
+    assert (_bootstrap_mean_ci(ys), _bootstrap_corr_ci(xs, ys), _bootstrap_slope_ci(xs, ys)) == expected
+    for got, want in zip(_bootstrap_pearson_matrix_ci(x, y, n_resamples=300), expected_matrix):
+        assert all(np.array_equal(a, b) for a, b in zip(got, want))
+    assert _bootstrap_indices.cache_info().currsize == 0
+
+
+def test_bootstrap_cis_are_deterministic_and_bracket_the_estimate() -> None:
+    rng = np.random.default_rng(0)
+    xs = rng.random(80).tolist()
+    ys = [2.0 * x + 0.1 * e for x, e in zip(xs, rng.standard_normal(80))]
+
+    mean_ci = _bootstrap_mean_ci(ys)
+    corr_ci = _bootstrap_corr_ci(xs, ys)
+    slope_ci = _bootstrap_slope_ci(xs, ys)
+
+    assert mean_ci == _bootstrap_mean_ci(ys)
+    assert corr_ci == _bootstrap_corr_ci(xs, ys)
+    assert mean_ci[0] <= float(np.mean(ys)) <= mean_ci[1]
+    assert 0.9 < corr_ci[0] <= corr_ci[1] <= 1.0
+    assert slope_ci[0] < 2.0 < slope_ci[1]
+
+
+def test_bootstrap_skips_constant_resamples() -> None:
+    assert _bootstrap_corr_ci([1.0, 1.0, 1.0, 2.0], [1.0, 1.0, 1.0, 1.0]) == (0.0, 0.0)
+    low, high = _bootstrap_slope_ci([0.0, 0.0, 1.0], [0.0, 0.0, 3.0], n_resamples=500)
+    assert low == pytest.approx(3.0) and high == pytest.approx(3.0)
+
+
+def test_matrix_correlations_match_pairwise_versions() -> None:
+    rng = np.random.default_rng(3)
+    n = 40
+    params = np.column_stack([rng.integers(0, 3, n) * 0.1, np.full(n, 0.1), rng.random(n)])
+    metrics = np.column_stack([rng.random(n) + params[:, 0], np.full(n, 2.0)])
+
+    corr, slope = _pearson_matrix(params, metrics)
+    (corr_low, corr_high), (slope_low, slope_high) = _bootstrap_pearson_matrix_ci(params, metrics)
+    # A leading group axis resamples each group with the same indices.
+    (grouped_low, _), _ = _bootstrap_pearson_matrix_ci(
+        np.stack([params, params[::-1]]), np.stack([metrics, metrics[::-1]])
+    )
+
+    for i in range(params.shape[1]):
+        for j in range(metrics.shape[1]):
+            xs, ys = params[:, i].tolist(), metrics[:, j].tolist()
+            expected_corr = _pearson_corr(xs, ys)
+            expected_slope = _linear_slope(xs, ys)
+            assert np.isnan(corr[i, j]) == (expected_corr is None)
+            assert np.isnan(slope[i, j]) == (expected_slope is None)
+            if expected_corr is not None:
+                assert corr[i, j] == pytest.approx(expected_corr, abs=1e-12)
+            assert (corr_low[i, j], corr_high[i, j]) == pytest.approx(_bootstrap_corr_ci(xs, ys), abs=1e-12)
+            assert (slope_low[i, j], slope_high[i, j]) == pytest.approx(_bootstrap_slope_ci(xs, ys), abs=1e-12)
+            assert grouped_low[0, i, j] == pytest.approx(corr_low[i, j], abs=1e-12)
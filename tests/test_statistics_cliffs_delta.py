@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.app.experiments.statistics import _cliffs_delta
+
+
+def _pairwise_delta(xs: list[float], ys: list[float]) -> float:
+    greater = sum(1 for x in xs for y in ys if x > y)
+    lower = sum(1 for x in xs for y in ys if x < y)
+    return float((greater - lower) / (len(xs) * len(ys)))
+
+
+def test_cliffs_delta_matches_pairwise_definition_with_ties_and_nan() -> None:
+    rng = random.Random(5)
+    for _ in range(200):
+        xs = [rng.choice([0.0, 0.25, 0.5, 1.0, math.nan, rng.random()]) for _ in range(rng.randint(1, 30))]
+        ys = [rng.choice([0.0, 0.25, 0.5, 1.0, math.nan, rng.random()]) for _ in range(rng.randint(1, 30))]
+        assert _cliffs_delta(xs, ys) == _pairwise_delta(xs, ys)
+
+
+def test_cliffs_delta_handles_empty_samples() -> None:
+    assert _cliffs_delta([], [1.0]) == 0.0
+    assert _cliffs_delta([1.0], []) == 0.0
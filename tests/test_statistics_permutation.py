@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.experiments.statistics import _permutation_test_mean_diff, _sequential_permutation_test
+
+
+def test_full_permutation_test_uses_every_resample() -> None:
+    p_value, used = _sequential_permutation_test([1.0, 2.0, 3.0], [1.5, 2.5, 3.5], max_resamples=600, seed=1)
+
+    assert used == 600
+    assert p_value == _permutation_test_mean_diff([1.0, 2.0, 3.0], [1.5, 2.5, 3.5], n_resamples=600, seed=1)
+    assert 0.5 < p_value <= 1.0
+
+
+def test_identical_samples_count_observed_split_as_extreme() -> None:
+    p_value, _ = _sequential_permutation_test([0.1, 0.1, 0.1], [0.1, 0.1, 0.1], max_resamples=100)
+
+    assert p_value == 1.0
+
+
+def test_sequential_stopping_ends_early_on_both_sides_of_the_thresholds() -> None:
+    rng = np.random.default_rng(0)
+    same_a = rng.random(40).tolist()
+    same_b = rng.random(40).tolist()
+    far_a = (rng.random(40) + 5.0).tolist()
+
+    p_null, used_null = _sequential_permutation_test(
+        same_a, same_b, max_resamples=20000, stop_below=0.001, stop_above=0.05
+    )
+    p_far, used_far = _sequential_permutation_test(
+        far_a, same_b, max_resamples=20000, stop_below=0.001, stop_above=0.05
+    )
+
+    assert used_null < 20000 and p_null > 0.05
+    assert used_far < 20000 and p_far < 0.001
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.core.config import CAConfig
+from src.app.core.engine import ForestFireCA, skip_uniform_draws
+
+
+def test_plan_is_reused_until_the_config_changes() -> None:
+    cfg = CAConfig(width=30, height=30, seed=2)
+    ca = ForestFireCA(cfg)
+    plan = ca.plan
+    ca.ignite(15, 15)
+    ca.step()
+    assert ca.plan is plan
+
+    # In-place edits, as the GUI makes them, recompile the plan before the next step.
+    cfg.humidity = 0.5
+    assert ca.plan is not plan
+    assert ca.plan.dryness_base == pytest.approx(0.5 * (0.5 + 35.0 / 50.0))
+
+    ca.cfg = CAConfig(width=30, height=30, wind_enabled=True, wind_dir="N", seed=2)
+    assert ca.plan.wind_enabled
+    assert ca.plan.wind[1] == pytest.approx(1.6)
+
+
+def test_config_edits_mid_run_match_an_engine_built_with_them() -> None:
+    edited = ForestFireCA(CAConfig(width=40, height=40, seed=6))
+    edited.ignite(20, 20)
+    for _ in range(4):
+        edited.step()
+    edited.cfg.rain_enabled = True
+    edited.cfg.rain_intensity = 0.4
+
+    fresh = ForestFireCA.from_checkpoint(
+        CAConfig(width=40, height=40, rain_enabled=True, rain_intensity=0.4, seed=6), edited.checkpoint()
+    )
+    for _ in range(8):
+        edited.step()
+        fresh.step()
+    assert np.array_equal(edited.grid, fresh.grid)
+    assert edited.burning_cells_history == fresh.burning_cells_history
+
+
+def test_skipped_draws_leave_the_stream_where_generated_ones_would() -> None:
+    skipped = np.random.default_rng(9)
+    drawn = np.random.default_rng(9)
+    assert skip_uniform_draws(skipped, 1000)
+    drawn.random(1000)
+    assert skipped.random() == drawn.random()
+
+    # A buffered 32-bit half cannot survive advance(), so the skip is refused.
+    buffered = np.random.default_rng(9)
+    buffered.integers(0, 10, dtype=np.uint32)
+    assert not skip_uniform_draws(buffered, 10)